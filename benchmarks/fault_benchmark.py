@@ -0,0 +1,108 @@
+###################################################################################
+# @file fault_benchmark.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Frame Decoder Resync Benchmark
+###################################################################################
+# Run from the repository root with: python -m benchmarks.fault_benchmark
+from collections import Counter
+import contextlib
+import io
+import time
+
+import numpy as np
+
+import config
+from low_level import comms
+from low_level.framedecoder import FrameDecoder
+from ss_simulator.fault_injection import FaultInjector
+from ss_simulator.telemetry_generator import encode_telemetry_frames
+
+FRAME_COUNT = 20000
+# Small enough that one chunk can't hold more frames than the frame queue
+CHUNK_SIZE = 2048
+FAULT_PROFILES = (("clean", {}),
+                  ("bit_flip 1e-4", {"bit_flip": 1e-4}),
+                  ("drop 1e-4", {"drop": 1e-4}),
+                  ("dup 0x55 1%", {"duplicate_delimiter": 0.01}),
+                  ("truncate 1%", {"truncate": 0.01}),
+                  ("bogus type 1%", {"bogus_type": 0.01}),
+                  ("junk burst 1%", {"junk_burst": 0.01}),
+                  ("noisy", {"bit_flip": 1e-4, "drop": 1e-4, "duplicate_delimiter": 0.01, "truncate": 0.01,
+                             "bogus_type": 0.01, "junk_burst": 0.01}))
+
+
+def build_stream(seed=0):
+    """ Build FRAME_COUNT telemetry frames over 100 channels with random values. """
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 2 ** 63, FRAME_COUNT, dtype=np.int64).astype(np.uint64)
+    return b"".join(encode_telemetry_frames(channel, values[channel::100]) for channel in range(100))
+
+
+def chunks(stream):
+    """ Split a stream into CHUNK_SIZE reads. """
+    return [stream[index:index + CHUNK_SIZE] for index in range(0, len(stream), CHUNK_SIZE)]
+
+
+def decode_chunk_decoder(stream_chunks):
+    """ Decode with the FrameDecoder, returns the frames and the number of errors. """
+    decoder = FrameDecoder()
+    frames = []
+    for chunk in stream_chunks:
+        frames += decoder.feed(chunk)
+    return frames, sum(decoder.error_counts.values())
+
+
+def decode_state_machine(stream_chunks):
+    """ Decode with the StateMachine, returns the frames and the number of errors it reported. """
+    errors = []
+    comms.comms_register_callback(errors.append)
+    config.FRAME_PIPELINE = True
+    state_machine = comms.StateMachine()
+    frames = []
+    for chunk in stream_chunks:
+        comms.incoming_byte_queue.put(chunk)
+        state_machine.run_state_machine()
+        while not comms.frame_queue.empty():
+            frames.append(bytes(comms.frame_queue.get_nowait()))
+            comms.frame_queue.task_done()
+    return frames, len(errors)
+
+
+def bench_faults():
+    """ Time each decoder on each fault profile, count the frames delivered intact, lost and corrupted. """
+    stream = build_stream()
+    sent = Counter(decode_chunk_decoder(chunks(stream))[0])
+    assert sum(sent.values()) == FRAME_COUNT
+    print("{:<14} {:<14} {:>8} {:>9} {:>8} {:>8} {:>8}".format(
+        "profile", "decoder", "us/KiB", "intact %", "lost %", "corrupt", "errors"))
+    for name, rates in FAULT_PROFILES:
+        injector = FaultInjector(seed=1, **rates)
+        faulty_chunks = chunks(b"".join(injector.inject(chunk) for chunk in chunks(stream)))
+        size = sum(len(chunk) for chunk in faulty_chunks)
+        for decoder_name, decode in (("FrameDecoder", decode_chunk_decoder), ("StateMachine", decode_state_machine)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                frames, errors = decode(faulty_chunks)
+                seconds = time.perf_counter() - start
+            received = Counter(frames)
+            intact = sum((received & sent).values())
+            corrupt = sum(received.values()) - intact
+            print("{:<14} {:<14} {:>8.2f} {:>9.2f} {:>8.2f} {:>8} {:>8}".format(
+                name, decoder_name, seconds * 1e6 / (size / 1024), 100 * intact / FRAME_COUNT,
+                100 * (FRAME_COUNT - intact) / FRAME_COUNT, corrupt, errors))
+
+
+if __name__ == "__main__":
+    bench_faults()
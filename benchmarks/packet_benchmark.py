@@ -0,0 +1,99 @@
+###################################################################################
+# @file packet_benchmark.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Packet Building Microbenchmarks
+###################################################################################
+# Run from the repository root with: python -m benchmarks.packet_benchmark
+import random
+import timeit
+
+from low_level.frameformat import PROTOCOL_DELIMITER, DELIMITER_BYTE, DOUBLE_DELIMITER, DATA_LENGTH_OFFSET, \
+    FRAME_HEADER_SIZE, data_length_builder
+from low_level.packet import build_frame
+
+PAYLOAD_SIZES = (16, 256, 4096, 65536)
+DELIMITER_DENSITIES = (0, 50, 100)
+
+
+def delimiter_scan_and_add(data_to_scan):
+    """ Reference implementation of delimiter stuffing, as packetize did it before build_frame.
+    Scan data passed in for any delimiters,
+    insert an extra delimiter after any delimiter found except the first one so that the receiver doesn't interpret
+    it as a start of a new frame.
+    The data length field is rewritten as the length of the stuffed data field, which is what the receiver counts.
+    """
+    data_to_scan = bytes(data_to_scan)
+    # Stuff the data field in a single pass
+    data_field = data_to_scan[FRAME_HEADER_SIZE:].replace(DELIMITER_BYTE, DOUBLE_DELIMITER)
+    # Rebuild the data length field from the stuffed length, then stuff everything after the start of frame delimiter
+    header = data_to_scan[1:DATA_LENGTH_OFFSET] + data_length_builder.pack(len(data_field))
+    scanned_data = data_to_scan[:1] + header.replace(DELIMITER_BYTE, DOUBLE_DELIMITER) + data_field
+    return scanned_data
+
+
+def build_payload(size, density, seed=0):
+    """ Build a payload of size bytes where density percent of the bytes are delimiters. """
+    rng = random.Random(seed)
+    return bytes(PROTOCOL_DELIMITER if rng.randrange(100) < density else rng.choice((0x00, 0xAA, 0xFF))
+                 for _ in range(size))
+
+
+def build_unstuffed_frame(payload):
+    """ Build an unstuffed frame around the payload, as passed to delimiter_scan_and_add. """
+    return bytes([PROTOCOL_DELIMITER, 0xDE, 0xAD, 0xBE, 0x03]) + len(payload).to_bytes(4, "big") + payload
+
+
+def bench_delimiter_scan_and_add():
+    """ Time the reference stuffing for each payload size and delimiter density, check each frame round trips.
+    Only a baseline for build_frame, delimiter_scan_and_add is no longer used by packet.py.
+    """
+    print("delimiter_scan_and_add: reference (baseline), not a production code path")
+    print("{:>8} {:>8} {:>12} {:>10}".format("size", "0x55 %", "us/frame", "MB/s"))
+    for size in PAYLOAD_SIZES:
+        for density in DELIMITER_DENSITIES:
+            payload = build_payload(size, density)
+            unstuffed = build_unstuffed_frame(payload)
+            # The stuffed frame must de-stuff back to the original payload, with the stuffed data length
+            stuffed = delimiter_scan_and_add(unstuffed)
+            destuffed = stuffed[:1] + stuffed[1:].replace(DOUBLE_DELIMITER, DELIMITER_BYTE)
+            assert destuffed[FRAME_HEADER_SIZE:] == payload
+            data_length = int.from_bytes(destuffed[DATA_LENGTH_OFFSET:FRAME_HEADER_SIZE], "big")
+            assert data_length == len(payload) + payload.count(DELIMITER_BYTE)
+
+            timer = timeit.Timer(lambda: delimiter_scan_and_add(unstuffed))
+            loops, _ = timer.autorange()
+            seconds = min(timer.repeat(repeat=5, number=loops)) / loops
+            print("{:>8} {:>8} {:>12.2f} {:>10.1f}".format(size, density, seconds * 1e6, size / seconds / 1e6))
+
+
+def bench_build_frame():
+    """ Time building a complete frame from a data field for each payload size and delimiter density. """
+    print("build_frame: production (packetize, request_frame)")
+    print("{:>8} {:>8} {:>12} {:>10}".format("size", "0x55 %", "us/frame", "MB/s"))
+    for size in PAYLOAD_SIZES:
+        for density in DELIMITER_DENSITIES:
+            payload = build_payload(size, density)
+            # Must match stuffing the whole unstuffed frame
+            assert build_frame(payload, 0x03) == delimiter_scan_and_add(build_unstuffed_frame(payload))
+
+            timer = timeit.Timer(lambda: build_frame(payload, 0x03))
+            loops, _ = timer.autorange()
+            seconds = min(timer.repeat(repeat=5, number=loops)) / loops
+            print("{:>8} {:>8} {:>12.2f} {:>10.1f}".format(size, density, seconds * 1e6, size / seconds / 1e6))
+
+
+if __name__ == "__main__":
+    bench_delimiter_scan_and_add()
+    bench_build_frame()
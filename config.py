@@ -31,6 +31,51 @@ COM_PORT = "COM1"
 COMMS = "SERIAL"
 TC_TLM_RATE = 1
 TIMEOUT = float(1000) / 1000
+# Maximum number of bytes drained from the receive buffer in one read
+RX_MAX_CHUNK_SIZE = 4096
+# Seconds to wait before retrying a read on a closed COM Port
+RX_RETRY_INTERVAL = 0.1
+# Seconds between repeats of the error message while the COM Port stays closed
+RX_RETRY_MESSAGE_INTERVAL = 10
+# Frame decoder used on received data, "STATE_MACHINE" (byte by byte) or "CHUNK" (whole chunks at once)
+FRAME_DECODER = "STATE_MACHINE"
+# Pipelined mode queues frames for the packet handler without waiting for each one to be processed
+FRAME_PIPELINE = False
+# Maximum number of frames waiting for the packet handler, 0 for unbounded
+FRAME_QUEUE_SIZE = 256
+# Action when the frame queue is full in pipelined mode, "BLOCK", "DROP_OLDEST" or "DROP_NEWEST"
+FRAME_QUEUE_POLICY = "BLOCK"
+# Most frames the packet handler takes off the frame queue per wakeup
+PACKET_BATCH_SIZE = 64
+# Number of encoded request frames to cache, keyed by data type and packed data field
+FRAME_CACHE_SIZE = 256
+# Resolution in seconds and number of slots of the request timeout wheel
+TIMEOUT_TICK = 0.01
+TIMEOUT_WHEEL_SLOTS = 1024
+# Seconds between printing the TC/TLM round trip latency summary, 0 to disable
+LATENCY_DUMP_INTERVAL = 60
+# Most telemetry requests of a batch poll awaiting a response at once
+TLM_POLL_WINDOW = 16
+# Telemetry panel refreshes per second
+GUI_REFRESH_RATE = 20
+# Telemetry plot redraws per second
+PLOT_REFRESH_RATE = 10
+# Telemetry samples kept per channel for plotting, export and statistics
+TLM_HISTORY_LENGTH = 10000
+# Memory limit in bytes of the telemetry history of all channels, channels keep fewer samples to fit more channels
+TLM_HISTORY_MEMORY_CAP = 64 * 1024 * 1024
+# Fewest telemetry samples kept per channel, channels beyond the memory cap at this length are not recorded
+TLM_HISTORY_MIN_LENGTH = 100
+# Capture every chunk received and frame sent on the link to files in CAPTURE_DIR
+CAPTURE_ENABLED = True
+CAPTURE_DIR = "captures"
+# Size in bytes a capture file is rotated at, and the number of capture files kept
+CAPTURE_FILE_SIZE = 64 * 1024 * 1024
+CAPTURE_FILE_COUNT = 16
+# Seconds between writes of the captured data to disk
+CAPTURE_FLUSH_INTERVAL = 0.25
+# Most records waiting to be written, further records are dropped if the disk falls this far behind
+CAPTURE_QUEUE_LIMIT = 100000
 
 
 
@@ -0,0 +1,52 @@
+###################################################################################
+# @file batchqueue.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Batched Queue Draining
+###################################################################################
+import time
+
+
+def queue_get_batch(source_queue, max_items, timeout=None):
+    """ Block until source_queue holds at least one item or timeout seconds pass (None waits forever),
+    then remove and return up to max_items items with a single lock acquisition.
+    Returns an empty list on timeout. Works with any queue.Queue.
+    plotting_data_monitor/utils.get_batch_from_queue is a copy for the standalone monitor, keep the two in step.
+    """
+    with source_queue.not_empty:
+        if timeout is None:
+            while not source_queue._qsize():
+                source_queue.not_empty.wait()
+        else:
+            deadline = time.monotonic() + timeout
+            while not source_queue._qsize():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                source_queue.not_empty.wait(remaining)
+        items = [source_queue._get() for _ in range(min(max_items, source_queue._qsize()))]
+        # Wake as many blocked producers as there are free places
+        source_queue.not_full.notify(len(items))
+        return items
+
+
+def queue_task_done(source_queue, count):
+    """ Mark count items from source_queue as processed with a single lock acquisition, see queue.Queue.task_done. """
+    with source_queue.all_tasks_done:
+        unfinished = source_queue.unfinished_tasks - count
+        if unfinished < 0:
+            raise ValueError("task_done() called too many times")
+        if unfinished == 0:
+            source_queue.all_tasks_done.notify_all()
+        source_queue.unfinished_tasks = unfinished
@@ -0,0 +1,198 @@
+###################################################################################
+# @file capture.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Raw Link Capture
+###################################################################################
+from collections import deque
+import atexit
+import os
+import struct
+import threading
+import time
+
+import config
+
+""" Capture file format, all fields Big Endian.
+File header: magic, monotonic ns and wall clock ns when the file was opened.
+Each record: direction, monotonic ns, data length, then the raw data as it crossed the wire.
+"""
+CAPTURE_MAGIC = b"MGSCAP01"
+capture_header_builder = struct.Struct("! 8s q q")
+capture_record_builder = struct.Struct("! B q I")
+CAPTURE_RX = 0
+CAPTURE_TX = 1
+CAPTURE_FILE_EXTENSION = ".mgscap"
+
+
+def capture_file_header():
+    """ Return the header for a new capture file. """
+    return capture_header_builder.pack(CAPTURE_MAGIC, time.monotonic_ns(), time.time_ns())
+
+
+def capture_records(buffer):
+    """ Iterate over the (direction, monotonic ns, data) records of a capture held in a buffer (E.G. an mmap).
+    The data are memoryviews into the buffer. Raises ValueError if the buffer is not a capture,
+    a record cut short by the end of the buffer (E.G. a file still being written) is ignored.
+    """
+    view = memoryview(buffer)
+    if len(view) < capture_header_builder.size or bytes(view[:len(CAPTURE_MAGIC)]) != CAPTURE_MAGIC:
+        raise ValueError("Not a Mercury GS capture file")
+    offset = capture_header_builder.size
+    end = len(view)
+    record_size = capture_record_builder.size
+    unpack_from = capture_record_builder.unpack_from
+    while offset + record_size <= end:
+        direction, timestamp, length = unpack_from(view, offset)
+        offset += record_size
+        if offset + length > end:
+            break
+        yield direction, timestamp, view[offset:offset + length]
+        offset += length
+
+
+class LinkCapture(threading.Thread):
+    """ Appends every received chunk and transmitted frame to a capture file, rotated by size.
+    record() only timestamps the data and appends it to a deque, the writes happen in this Thread
+    every config.CAPTURE_FLUSH_INTERVAL seconds, so capturing adds no file I/O to the receive path.
+    """
+
+    def __init__(self, directory, file_size=None, file_count=None, flush_interval=None, queue_limit=None):
+        """ Initialise Thread, the record queue and the rotation settings. """
+        super().__init__()
+        self.daemon = True
+        self.directory = directory
+        self.file_size = config.CAPTURE_FILE_SIZE if file_size is None else file_size
+        self.file_count = config.CAPTURE_FILE_COUNT if file_count is None else file_count
+        self.flush_interval = config.CAPTURE_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.queue_limit = config.CAPTURE_QUEUE_LIMIT if queue_limit is None else queue_limit
+        # (direction, monotonic ns, data) records waiting to be written
+        self.records = deque()
+        self.stop_event = threading.Event()
+        self.capture_file = None
+        self.capture_path = None
+        self.capture_file_size = 0
+        self.records_written = 0
+        self.bytes_written = 0
+        # Records discarded because the writer fell queue_limit records behind
+        self.records_dropped = 0
+
+    def record(self, direction, data):
+        """ Capture a chunk of data sent (CAPTURE_TX) or received (CAPTURE_RX), called from any Thread. """
+        if len(self.records) >= self.queue_limit:
+            self.records_dropped += 1
+            return
+        self.records.append((direction, time.monotonic_ns(), bytes(data)))
+
+    def run(self):
+        """ Overloads the Thread's "run" function, writes the queued records until stop() is called. """
+        try:
+            while not self.stop_event.wait(self.flush_interval):
+                self.write_records()
+            self.write_records()
+        finally:
+            self.close_file()
+
+    def write_records(self):
+        """ Write every queued record to the capture file, rotating it when it is full. """
+        parts = []
+        pending_size = 0
+        pack = capture_record_builder.pack
+        try:
+            while self.records:
+                direction, timestamp, data = self.records.popleft()
+                record_size = capture_record_builder.size + len(data)
+                if self.capture_file is None or \
+                        self.capture_file_size + pending_size + record_size > self.file_size:
+                    self.write_parts(parts)
+                    parts = []
+                    pending_size = 0
+                    self.rotate()
+                parts.append(pack(direction, timestamp, len(data)))
+                parts.append(data)
+                pending_size += record_size
+                self.records_written += 1
+            self.write_parts(parts)
+            if self.capture_file is not None:
+                self.capture_file.flush()
+        except OSError as err:
+            print(repr(err))
+            print("ERROR: Link capture write failed")
+            self.close_file()
+
+    def write_parts(self, parts):
+        """ Write records packed by write_records to the capture file in a single write. """
+        if parts:
+            data = b"".join(parts)
+            self.capture_file.write(data)
+            self.capture_file_size += len(data)
+            self.bytes_written += len(data)
+
+    def rotate(self):
+        """ Close the current capture file, open a new one and delete the oldest beyond file_count. """
+        self.close_file()
+        os.makedirs(self.directory, exist_ok=True)
+        name = time.strftime("capture_%Y%m%d_%H%M%S") + "_{:06d}".format(time.time_ns() // 1000 % 1000000)
+        self.capture_path = os.path.join(self.directory, name + CAPTURE_FILE_EXTENSION)
+        self.capture_file = open(self.capture_path, "wb")
+        header = capture_file_header()
+        self.capture_file.write(header)
+        self.capture_file_size = len(header)
+        captures = sorted(entry for entry in os.listdir(self.directory) if entry.endswith(CAPTURE_FILE_EXTENSION))
+        for old_capture in captures[:max(0, len(captures) - self.file_count)]:
+            os.remove(os.path.join(self.directory, old_capture))
+
+    def close_file(self):
+        """ Close the current capture file. """
+        if self.capture_file is not None:
+            try:
+                self.capture_file.close()
+            except OSError as err:
+                print(repr(err))
+            self.capture_file = None
+
+    def stop(self):
+        """ Write the remaining records and close the capture file. """
+        self.stop_event.set()
+        if self.is_alive():
+            self.join()
+
+
+link_capture = None
+
+
+def capture_start(directory=None):
+    """ Start capturing the link to directory (config.CAPTURE_DIR by default). """
+    global link_capture
+    capture_stop()
+    link_capture = LinkCapture(config.CAPTURE_DIR if directory is None else directory)
+    link_capture.start()
+    # Registered once however many times capture is restarted
+    atexit.unregister(capture_stop)
+    atexit.register(capture_stop)
+
+
+def capture_stop():
+    """ Stop capturing the link, writing out every record captured so far. """
+    global link_capture
+    if link_capture is not None:
+        link_capture.stop()
+        link_capture = None
+
+
+def capture_record(direction, data):
+    """ Capture data sent or received on the link, if capture is running. """
+    capture = link_capture
+    if capture is not None:
+        capture.record(direction, data)
@@ -19,11 +19,14 @@
 import queue
 import struct
 import threading
+import time
 from enum import Enum
 
 import serial
 import config
 from low_level.frameformat import PROTOCOL_DELIMITER, MAX_DATA_TYPES, DataType, DataTypeSize
+from low_level.framedecoder import FrameDecoder, FrameDecodeError
+from low_level.capture import CAPTURE_RX, CAPTURE_TX, capture_record, capture_start
 from config import RaspberryPi
 try:
     # If this succeeds then we are using a Raspberry Pi
@@ -56,8 +59,43 @@ if RaspberryPi is True:
         #CS = None
         #RESET = None
 
-frame_queue = queue.Queue()
+
+
+class FrameQueue(queue.Queue):
+    """ Bounded queue of complete frames with a backpressure policy for when the packet handler falls behind:
+    "BLOCK" waits for space, "DROP_OLDEST" discards the oldest queued frame, "DROP_NEWEST" discards the new frame.
+    """
+
+    def __init__(self, maxsize=0, policy="BLOCK"):
+        """ Initialise the queue, policy and dropped frame counter. """
+        super().__init__(maxsize)
+        self.policy = policy
+        self.frames_dropped = 0
+
+    def put_frame(self, frame):
+        """ Put a frame onto the queue, applying the backpressure policy if the queue is full. """
+        if self.policy == "DROP_NEWEST":
+            try:
+                self.put_nowait(frame)
+            except queue.Full:
+                self.frames_dropped += 1
+        elif self.policy == "DROP_OLDEST":
+            with self.not_full:
+                if 0 < self.maxsize <= self._qsize():
+                    # Discard the oldest frame to make space, without waiting for the handler Thread
+                    self._get()
+                    self.unfinished_tasks -= 1
+                    self.frames_dropped += 1
+                self._put(frame)
+                self.unfinished_tasks += 1
+                self.not_empty.notify()
+        else:
+            self.put(frame)
+
+
+frame_queue = FrameQueue(config.FRAME_QUEUE_SIZE, config.FRAME_QUEUE_POLICY)
 direct_read_queue = queue.Queue()
+# Holds received data as bytes chunks, one item per read rather than one item per byte
 incoming_byte_queue = queue.Queue()
 comms_handler = None
 PENDING_FRAME = 0
@@ -73,6 +111,18 @@ def signal_handler(sig, frame):
     sys.exit(0)
 
 
+def frame_queue_put(frame):
+    """ Pass a complete frame to the packet handler Thread.
+    In pipelined mode the frame is queued and decoding continues straight away,
+    otherwise block until the packet handler has processed it.
+    """
+    if config.FRAME_PIPELINE is True:
+        frame_queue.put_frame(frame)
+    else:
+        frame_queue.put(frame)
+        frame_queue.join()
+
+
 def comms_register_callback(exception_handler_function_ptr):
     """ Registers the callbacks for this module to pass data back to previous modules. """
     global callback_exception_handler
@@ -85,7 +135,10 @@ class CommsHandler:
 
     def __init__(self, port, baud_rate):
         """ Initialise the rx_listener and serial. """
-        self.rx_state_machine = StateMachine()
+        if config.FRAME_DECODER == "CHUNK":
+            self.rx_state_machine = ChunkStateMachine()
+        else:
+            self.rx_state_machine = StateMachine()
         if RaspberryPi is True:
             self.radio = RadioComms(spi, CS, RESET, 434.0)
         self.serial = SerialComms(config.COM_PORT, config.BAUD_RATE)
@@ -106,9 +159,9 @@ try:
                 received_packet = self.receive(timeout=10)
                 if received_packet is not None:
                     print("RECEIVED: " + str(received_packet))
-                    packet_split = struct.unpack(str(len(received_packet)) + "c", received_packet)
-                    for byte in packet_split:
-                        incoming_byte_queue.put(byte)
+                    # Pass the whole packet on to the State Machine as one chunk
+                    incoming_byte_queue.put(bytes(received_packet))
+                    capture_record(CAPTURE_RX, received_packet)
 except NameError:
     pass
 
@@ -125,7 +178,7 @@ class SerialComms(serial.Serial):
 
         self.bytesize = 8
         self.write_timeout = 5
-        self.rx_thread = threading.Thread(target=self.rx_loop)
+        self.rx_thread = threading.Thread(target=self.rx_loop, daemon=True)
 
         # Close COM Port if open
         if self.is_open:
@@ -134,13 +187,38 @@ class SerialComms(serial.Serial):
         # Open COM Port
         try:
             self.open()
-            self.rx_thread.start()
         except serial.serialutil.SerialException as err:
             print(repr(err))
+        # Start receiving even if the port didn't open, rx_loop waits for it to be opened (E.G. by change_com_port)
+        self.rx_thread.start()
 
     def rx_loop(self):
-        rx_byte = self.read(1)
-        incoming_byte_queue.put(rx_byte)
+        """ Continuously read from the COM Port on the rx_thread.
+        Blocks until at least one byte has arrived, then drains everything waiting in the receive buffer
+        and passes it on to the State Machine as a single bytes chunk.
+        """
+        last_error_time = None
+        while True:
+            try:
+                # Block for the first byte, then read whatever else is already waiting (up to the chunk limit)
+                rx_chunk = self.read(1)
+                rx_waiting = min(self.in_waiting, config.RX_MAX_CHUNK_SIZE)
+                if rx_waiting > 0:
+                    rx_chunk += self.read(rx_waiting)
+            except (serial.serialutil.SerialException, TypeError, OSError) as err:
+                # Port is closed or being reopened (E.G. COM Port change), wait and try again.
+                # in_waiting raises TypeError or OSError if the port is closed between the two reads
+                now = time.monotonic()
+                if last_error_time is None or now - last_error_time >= config.RX_RETRY_MESSAGE_INTERVAL:
+                    print(repr(err))
+                    last_error_time = now
+                time.sleep(config.RX_RETRY_INTERVAL)
+                continue
+            last_error_time = None
+
+            if len(rx_chunk) > 0:
+                incoming_byte_queue.put(rx_chunk)
+                capture_record(CAPTURE_RX, rx_chunk)
 
     def check_baud_rate(self, requested_baud_rate):
         """ Check that the baud rate requested is not already set. """
@@ -204,16 +282,19 @@ class StateMachine(threading.Thread):
                 self.run_state_machine()
 
     def run_state_machine(self):
-        rx_byte = incoming_byte_queue.get()
-
-        if self.state == StateMachineState.PENDING_FRAME.value:
-            self.pending_frame(rx_byte)
-        elif self.state == StateMachineState.GATHERING_HEADER.value:
-            self.gathering_header(rx_byte)
-        elif self.state == StateMachineState.READING_DATA.value:
-            self.reading_data(rx_byte)
-        else:
-            self.state = StateMachineState.PENDING_FRAME.value
+        """ Pop a chunk of received bytes off the queue and step the State Machine through each byte. """
+        rx_chunk = incoming_byte_queue.get()
+
+        for index in range(len(rx_chunk)):
+            rx_byte = rx_chunk[index:index + 1]
+            if self.state == StateMachineState.PENDING_FRAME.value:
+                self.pending_frame(rx_byte)
+            elif self.state == StateMachineState.GATHERING_HEADER.value:
+                self.gathering_header(rx_byte)
+            elif self.state == StateMachineState.READING_DATA.value:
+                self.reading_data(rx_byte)
+            else:
+                self.state = StateMachineState.PENDING_FRAME.value
 
     def pending_frame(self, rx_byte):
         """ PENDING_FRAME State, checks for start of frame...
@@ -294,8 +375,8 @@ class StateMachine(threading.Thread):
                                                                                                 self.data_count,
                                                                                                 True,
                                                                                                 self.data_length)
-            # If we have read out enough data bytes
-            if self.data_count == self.data_length:
+            # If we have read out enough data bytes (and haven't resynchronised to a new frame)
+            if self.state == StateMachineState.READING_DATA.value and self.data_count == self.data_length:
                 invalid_frame = False
                 data_type = self.frame_buffer[4]
                 # Check the data type against all known data types
@@ -314,41 +395,37 @@ class StateMachine(threading.Thread):
                 if invalid_frame is False:
                     # Append data length and data fields onto frame buffer
                     self.frame_buffer.extend(self.data_length_bytes + self.data_bytes)
-                    # Add Frame onto queue to be processed by packet handler Thread
-                    frame_queue.put(self.frame_buffer)
-                    # Block until packet is processed in handler Thread
-                    frame_queue.join()
+                    # Add an immutable copy of the Frame onto queue to be processed by packet handler Thread
+                    frame_queue_put(bytes(self.frame_buffer))
 
                 # Frame has been fully processed,
                 # Reset all member variables so that the state machine can process the next frame
-                self.header_count = 0
-                self.gathered_header.clear()
-                self.data_length = 0
-                self.data_length_bytes.clear()
-                self.data_length_count = 0
-                self.data_length = 0
-                self.data_bytes.clear()
-                self.data_count = 0
-                self.got_data_length = False
-                self.delimiter_received = False
+                self.reset_frame()
 
                 # Set state to PENDING_FRAME
                 self.state = StateMachineState.PENDING_FRAME.value
                 # Clear the frame buffer
                 self.frame_buffer.clear()
 
-    def direct_read(self, com):
-        """ DIRECT_READ State, entered if Test Interface is used to bypass State Machine """
-        # Block until there is a byte to read
-        rx_byte = self.read_byte(com)
-        # Put byte onto queue
-        direct_read_queue.put(rx_byte)
+    def reset_frame(self):
+        """ Reset the header, data length and data fields gathered for the current frame. """
+        self.header_count = 0
+        self.gathered_header = bytearray()
+        self.data_length_bytes = bytearray()
+        self.data_length_count = 0
+        self.data_length = 0
+        self.data_bytes = bytearray()
+        self.data_count = 0
+        self.got_data_length = False
+        self.delimiter_received = False
 
     @staticmethod
-    def read_byte(com):
-        """ Read and return a byte from the COM Port """
-        rx_byte = com.read(1)
-        return rx_byte
+    def direct_read():
+        """ DIRECT_READ State, entered if Test Interface is used to bypass State Machine """
+        # Block until the rx_thread has received a chunk
+        rx_chunk = incoming_byte_queue.get()
+        # Put chunk onto queue
+        direct_read_queue.put(rx_chunk)
 
     def delimiter_scan_and_remove(self, buffer, index, data_field=False, data_length_decrement=0):
         """ Iterate through buffer, pop off a delimiter where there are 2 consecutive delimiter values,
@@ -376,26 +453,66 @@ class StateMachine(threading.Thread):
             # and we have received a prior delimiter that makes this an invalid sequence
             if self.delimiter_received is True:
                 # This is the start of a new frame!
-                # Set the frame buffer to this new frame
-                self.frame_buffer = buffer
-                # Reset received delimiter variable
-                self.delimiter_received = False
+                # Set the frame buffer to this new frame, the delimiter and this byte
+                self.frame_buffer = bytearray([PROTOCOL_DELIMITER, buffer[index]])
+                # Discard the fields gathered for the abandoned frame
+                self.reset_frame()
                 # Enter GATHERING_HEADER state
                 self.state = StateMachineState.GATHERING_HEADER.value
-                self.header_count = 0
-                return buffer, 0
+                if data_field is True:
+                    return self.data_bytes, 0, 0
+                return bytearray(), 0
         # Increment the index
         index += 1
-        if data_length_decrement == 0:
-            return buffer, index
-        else:
+        if data_field is True:
             return buffer, index, data_length_decrement
+        return buffer, index
+
+
+class ChunkStateMachine(threading.Thread):
+    """ Alternative to the StateMachine that decodes each received chunk in one pass using a FrameDecoder,
+    selected with config.FRAME_DECODER = "CHUNK".
+    """
+
+    def __init__(self):
+        """ Initialise Thread and the FrameDecoder. """
+        super().__init__()
+        self.test_listen = False
+        self.daemon = True
+        self.decoder = FrameDecoder(self.decode_error)
+
+    def run(self):
+        """ Overloads the Thread's "run" function,
+        reads directly if Test Interface is used,
+        otherwise engages the FrameDecoder.
+        """
+        while True:
+            if self.test_listen is True:
+                StateMachine.direct_read()
+            else:
+                self.run_state_machine()
+
+    def run_state_machine(self):
+        """ Pop a chunk of received bytes off the queue, decode it and pass each complete frame on. """
+        rx_chunk = incoming_byte_queue.get()
+
+        for frame in self.decoder.feed(rx_chunk):
+            # Add Frame onto queue to be processed by packet handler Thread
+            frame_queue_put(frame)
+
+    @staticmethod
+    def decode_error(error):
+        """ Report the frame errors that the StateMachine also reports. """
+        if error in (FrameDecodeError.UNKNOWN_DATA_TYPE, FrameDecodeError.INVALID_DATA_LENGTH):
+            callback_exception_handler(error.value)
 
 
 def comms_init(port, baud_rate):
     """ Initialise CommsHandler class instance , set COM Port and baud rate, start rx_listener Thread. """
     global comms_handler
     if comms_handler is not CommsHandler:
+        if config.CAPTURE_ENABLED is True:
+            capture_start()
         comms_handler = CommsHandler(port, baud_rate)
         comms_handler.rx_state_machine.start()
 
@@ -411,6 +528,7 @@ def comms_init(port, baud_rate):
 def comms_send(data):
     """ Send data over the COM Port"""
     global comms_handler
+    capture_record(CAPTURE_TX, data)
     if config.COMMS == "RF69" and RaspberryPi is True:
         comms_handler.radio.send(data)
     elif config.COMMS == "SERIAL":
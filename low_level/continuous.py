@@ -18,7 +18,10 @@
 ###################################################################################
 import config
 from low_level.comms import flush_com_port, comms_send
-from threading import Timer
+import heapq
+import itertools
+import math
+import threading
 import time
 
 
@@ -29,80 +32,161 @@ def continuous_register_callback(exception_handler_function_ptr):
     callback_exception_handler = exception_handler_function_ptr
 
 
-class RepeatedTimer(object):
-    """ RepeatedTimer class to enable continuous transmission. """
-    def __init__(self, interval, function, *args, **kwargs):
-        """ Initialise the timer, set interval, function callback and args, then start the Timer. """
-        self._timer = None
+class ContinuousStream(object):
+    """ Handle for one continuous transmission, called at its own rate by the ContinuousScheduler. """
+
+    def __init__(self, scheduler, interval, function, *args, **kwargs):
+        """ Initialise the stream with its interval, function callback and args. """
+        self.scheduler = scheduler
         self.interval = interval
         self.function = function
         self.args = args
         self.kwargs = kwargs
         self.is_running = False
-        self.next_call = time.time()
-        self.start()
-
-    def _run(self):
-        """ Start next Timer interval and call the associated function. """
-        self.is_running = False
-        self.start()
-        self.function(*self.args, **self.kwargs)
+        self.next_call = 0.0
+        # The scheduler's heap entry for this stream, entries that no longer match are discarded
+        self.heap_entry = None
 
     def start(self):
-        """ Set up next Timer interval. """
-        if not self.is_running:
-            self.next_call += self.interval
-            self._timer = Timer(self.next_call - time.time(), self._run)
-            self._timer.start()
-            self.is_running = True
+        """ Start calling the function, the first call is one interval from now. """
+        self.scheduler.schedule(self, time.monotonic() + self.interval)
 
     def stop(self):
-        """ Stop the Timer"""
-        self._timer.cancel()
-        self.is_running = False
+        """ Stop calling the function. """
+        self.scheduler.unschedule(self)
 
+    def set_rate(self, calls_per_second):
+        """ Change the rate, the next call is one new interval after the previous call. """
+        self.scheduler.reschedule(self, 1.0 / calls_per_second)
 
-def dummy_function():
-    """ A dummy function to enable creating the Timer global"""
-    pass
 
+class ContinuousScheduler(threading.Thread):
+    """ Runs every continuous transmission stream from a single Thread,
+    using a heap of next call deadlines so that no Thread is created per call.
+    """
 
-rt = RepeatedTimer((1.0 / config.TC_TLM_RATE), dummy_function)
+    def __init__(self):
+        """ Initialise Thread, deadline heap and condition used to wake the Thread on changes. """
+        super().__init__()
+        self.daemon = True
+        self.heap = []
+        self.sequence = itertools.count()
+        self.condition = threading.Condition()
+
+    def schedule(self, stream, next_call):
+        """ Schedule the next call of a stream, starting the Thread on first use. """
+        with self.condition:
+            stream.next_call = next_call
+            stream.is_running = True
+            stream.heap_entry = (next_call, next(self.sequence), stream)
+            heapq.heappush(self.heap, stream.heap_entry)
+            self.condition.notify()
+        if not self.is_alive():
+            try:
+                self.start()
+            except RuntimeError:
+                # Already started by another caller
+                pass
+
+    def unschedule(self, stream):
+        """ Stop a stream, its heap entry is discarded when it reaches the top of the heap. """
+        with self.condition:
+            stream.is_running = False
+            stream.heap_entry = None
+
+    def reschedule(self, stream, interval):
+        """ Change the interval of a stream, the next call is one new interval after its previous call. """
+        with self.condition:
+            previous_call = stream.next_call - stream.interval
+            stream.interval = interval
+            if stream.is_running is True:
+                self.schedule(stream, previous_call + interval)
+
+    def run(self):
+        """ Overloads the Thread's "run" function, waits for the earliest deadline then calls that stream. """
+        while True:
+            with self.condition:
+                while True:
+                    if not self.heap:
+                        self.condition.wait()
+                        continue
+                    next_call, _, stream = self.heap[0]
+                    if self.heap[0] is not stream.heap_entry:
+                        # Stream was stopped or rescheduled
+                        heapq.heappop(self.heap)
+                        continue
+                    delay = next_call - time.monotonic()
+                    if delay > 0:
+                        self.condition.wait(delay)
+                        continue
+                    break
+                heapq.heappop(self.heap)
+                # Next deadline is a whole number of intervals after the last, so calls do not drift.
+                # Deadlines missed while the Thread was busy are skipped rather than called in a burst.
+                now = time.monotonic()
+                following_call = next_call + stream.interval
+                if following_call <= now:
+                    following_call += stream.interval * math.ceil((now - following_call) / stream.interval)
+                    if following_call <= now:
+                        following_call += stream.interval
+                stream.next_call = following_call
+                stream.heap_entry = (following_call, next(self.sequence), stream)
+                heapq.heappush(self.heap, stream.heap_entry)
+            try:
+                stream.function(*stream.args, **stream.kwargs)
+            except Exception as err:
+                print(repr(err))
+                print("ERROR: Continuous transmission failed")
+
+
+scheduler = ContinuousScheduler()
+# Continuous transmission streams, keyed by the frame they send
+continuous_streams = {}
 
 
 def register_continuous(calls_per_second, callback, data_to_send, message_object_database, latest_message_object):
-    """ Register a new continuous transmission Thread.
-    Set the interval, callback function, arguments and then start the Thread.
+    """ Register a new continuous transmission stream.
+    Set the interval, callback function, arguments and then start the stream.
+    Registering a frame that is already being sent continuously changes its rate instead.
+    Returns the stream handle.
     """
     frequency = 1.0 / calls_per_second
-    global rt
-    rt.interval = frequency
-    rt.function = callback
-    rt.args = (data_to_send, message_object_database, latest_message_object)#
-    rt.start()
+    stream_key = bytes(data_to_send)
+    stream = continuous_streams.get(stream_key)
+    if stream is not None and stream.is_running is True:
+        stream.set_rate(calls_per_second)
+        return stream
+    stream = ContinuousStream(scheduler, frequency, callback, data_to_send, message_object_database,
+                              latest_message_object)
+    continuous_streams[stream_key] = stream
+    stream.start()
+    return stream
 
 
 def adjust_continuous(calls_per_second):
-    """ Adjust the continuous transmission Thread with a new rate"""
-    global rt
+    """ Adjust every continuous transmission stream to a new rate. """
     try:
         frequency = 1.0 / calls_per_second
-        rt.interval = frequency
     except ZeroDivisionError as err:
         print("\n", repr(err))
         print("ERROR: Rate is 0, cannot run continuously")
         callback_exception_handler("ERROR: Rate is 0, cannot run continuously")
+        return
+    for stream in list(continuous_streams.values()):
+        scheduler.reschedule(stream, frequency)
 
 
 def continuous_stop():
-    """ Stop the continuous transmission thread """
-    if rt.is_running is True:
-        rt.stop()
+    """ Stop every continuous transmission stream """
+    if any(stream.is_running for stream in continuous_streams.values()):
+        for stream in list(continuous_streams.values()):
+            stream.stop()
+        continuous_streams.clear()
         flush_com_port()
 
 
 def continuous_sender(frame, message_object_database, latest_message_object):
-    """ The function for each continuous transmission Thread. """
+    """ The function called for each continuous transmission stream. """
     # Create a new object for the message, pass in the ID and TIMEOUT value
     new_object = latest_message_object.__class__(latest_message_object.ID, config.TIMEOUT)
     # Append message to database so that a response can search for and cancel the timeout
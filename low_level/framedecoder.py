@@ -0,0 +1,232 @@
+###################################################################################
+# @file framedecoder.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Chunk Oriented Frame Decoder
+###################################################################################
+from enum import Enum
+
+from low_level.frameformat import PROTOCOL_DELIMITER, DELIMITER_BYTE, DOUBLE_DELIMITER, MAX_DATA_TYPES, DataType, \
+    DataTypeSize
+# Number of de-stuffed bytes following the start of frame (Delimiter + Reserved 1)
+HEADER_SIZE = 3
+DATA_LENGTH_SIZE = 4
+# Expected data field length for each known data type value
+DATA_TYPE_SIZES = {data_type.value: DataTypeSize[data_type.name].value for data_type in DataType}
+
+
+class FrameDecodeError(Enum):
+    """ FrameDecodeError class for each reason a frame can be discarded. """
+    DATA_TYPE_OUT_OF_RANGE = "ERROR: Frame Data Type Field is out of range."
+    UNKNOWN_DATA_TYPE = "ERROR: Frame Data Type Field does not match actual type."
+    INVALID_DATA_LENGTH = "ERROR: Frame Data Length Field does not match actual length."
+    FRAME_INTERRUPTED = "ERROR: Start of frame received before the end of the previous frame."
+
+
+class FrameDecoder:
+    """ Incremental decoder that accepts received bytes in chunks of any size and returns complete frames.
+    Produces the same frames as the StateMachine: header, data length field and de-stuffed data field.
+    """
+
+    def __init__(self, error_callback=None):
+        """ Initialise the receive buffer, frame tracking variables and counters. """
+        self.error_callback = error_callback
+        self.buffer = bytearray()
+        # Position in the buffer to search for the next start of frame from
+        self.search_position = 0
+        # Position in the buffer of the current frame's delimiter, None if not inside a frame
+        self.frame_start = None
+        self.frame_header = None
+        self.data_start = 0
+        self.data_end = 0
+        self.scan_position = 0
+        self.frames_decoded = 0
+        self.bytes_received = 0
+        self.error_counts = {error: 0 for error in FrameDecodeError}
+
+    def reset(self):
+        """ Discard any partially received frame. """
+        self.buffer.clear()
+        self.search_position = 0
+        self.frame_start = None
+
+    def feed(self, chunk):
+        """ Add a chunk of received bytes, return a list of every frame completed by it. """
+        self.bytes_received += len(chunk)
+        self.buffer += chunk
+        frames = []
+
+        while True:
+            if self.frame_start is None:
+                if self.find_frame_start() is False:
+                    break
+            if self.frame_header is None:
+                if self.read_frame_header() is False:
+                    break
+                if self.frame_start is None:
+                    continue
+            frame_complete = self.read_data_field(frames)
+            if frame_complete is False:
+                break
+
+        self.compact_buffer()
+        return frames
+
+    def find_frame_start(self):
+        """ Search for a delimiter followed by a non delimiter, skipping over any doubled delimiters. """
+        buffer = self.buffer
+        position = self.search_position
+        while True:
+            index = buffer.find(DELIMITER_BYTE, position)
+            if index == -1:
+                # No delimiter, none of the buffer can be part of a frame
+                self.search_position = len(buffer)
+                return False
+            if index + 1 == len(buffer):
+                # Delimiter is the last byte received, wait for the next byte to check it
+                self.search_position = index
+                return False
+            if buffer[index + 1] != PROTOCOL_DELIMITER:
+                # This is the start of a new frame!
+                self.frame_start = index
+                self.frame_header = None
+                return True
+            # Doubled delimiter is stuffed data, not a start of frame
+            position = index + 2
+
+    def read_frame_header(self):
+        """ Read and check the rest of the header and the data length field.
+        Returns False if more bytes are needed.
+        """
+        header_start = self.frame_start + 2
+        result = self.destuff_fixed(header_start, HEADER_SIZE)
+        if result is None:
+            return False
+        header, data_length_start = result
+        if header is FrameDecodeError.FRAME_INTERRUPTED:
+            self.restart_search(data_length_start, FrameDecodeError.FRAME_INTERRUPTED)
+            return True
+        # Check if Data Type is within range
+        if header[2] >= MAX_DATA_TYPES:
+            # Data Type out of range, discard message and return to searching for a frame
+            self.restart_search(data_length_start, FrameDecodeError.DATA_TYPE_OUT_OF_RANGE)
+            return True
+
+        result = self.destuff_fixed(data_length_start, DATA_LENGTH_SIZE)
+        if result is None:
+            return False
+        data_length_bytes, data_start = result
+        if data_length_bytes is FrameDecodeError.FRAME_INTERRUPTED:
+            self.restart_search(data_start, FrameDecodeError.FRAME_INTERRUPTED)
+            return True
+
+        self.frame_header = DELIMITER_BYTE + self.buffer[self.frame_start + 1:self.frame_start + 2] + header + \
+            data_length_bytes
+        self.data_start = data_start
+        self.data_end = data_start + int.from_bytes(data_length_bytes, "big")
+        self.scan_position = data_start
+        return True
+
+    def read_data_field(self, frames):
+        """ Scan the data field for a new start of frame, then de-stuff it and append the frame to frames once
+        every byte has arrived. Returns False if more bytes are needed.
+        """
+        buffer = self.buffer
+        data_end = self.data_end
+        limit = min(len(buffer), data_end)
+        index = buffer.find(DELIMITER_BYTE, self.scan_position, limit)
+        while index != -1:
+            if index + 1 == limit:
+                if limit != data_end:
+                    # Wait for the next byte to see if this delimiter is doubled
+                    self.scan_position = index
+                    return False
+                # A delimiter as the last byte of the data field ends the frame
+                break
+            if buffer[index + 1] != PROTOCOL_DELIMITER:
+                self.restart_search(index, FrameDecodeError.FRAME_INTERRUPTED)
+                return True
+            index = buffer.find(DELIMITER_BYTE, index + 2, limit)
+
+        if limit != data_end:
+            self.scan_position = limit
+            return False
+
+        data = bytes(buffer[self.data_start:data_end]).replace(DOUBLE_DELIMITER, DELIMITER_BYTE)
+        frame_header = self.frame_header
+        self.frame_start = None
+        self.frame_header = None
+        self.search_position = data_end
+
+        data_type = frame_header[4]
+        if data_type not in DATA_TYPE_SIZES:
+            self.decode_error(FrameDecodeError.UNKNOWN_DATA_TYPE)
+        elif len(data) != DATA_TYPE_SIZES[data_type]:
+            self.decode_error(FrameDecodeError.INVALID_DATA_LENGTH)
+        else:
+            frames.append(frame_header + data)
+            self.frames_decoded += 1
+        return True
+
+    def destuff_fixed(self, position, size):
+        """ Read size de-stuffed bytes from position.
+        Returns (bytes, next position), (FRAME_INTERRUPTED, position of new frame) or None if more bytes are needed.
+        """
+        buffer = self.buffer
+        end = position + size
+        # Fast path, no delimiters to remove
+        if end <= len(buffer) and buffer.find(DELIMITER_BYTE, position, end) == -1:
+            return bytes(buffer[position:end]), end
+
+        destuffed = bytearray()
+        while len(destuffed) < size:
+            if position >= len(buffer):
+                return None
+            byte = buffer[position]
+            if byte == PROTOCOL_DELIMITER:
+                if position + 1 >= len(buffer):
+                    return None
+                if buffer[position + 1] != PROTOCOL_DELIMITER:
+                    return FrameDecodeError.FRAME_INTERRUPTED, position
+                position += 1
+            destuffed.append(byte)
+            position += 1
+        return bytes(destuffed), position
+
+    def restart_search(self, position, error):
+        """ Discard the current frame and search for the next start of frame from position. """
+        self.frame_start = None
+        self.frame_header = None
+        self.search_position = position
+        self.decode_error(error)
+
+    def decode_error(self, error):
+        """ Count the error and pass it on to the error callback. """
+        self.error_counts[error] += 1
+        if self.error_callback is not None:
+            self.error_callback(error)
+
+    def compact_buffer(self):
+        """ Remove bytes that have already been decoded or discarded from the front of the buffer. """
+        if self.frame_start is not None:
+            consumed = self.frame_start
+            self.frame_start = 0
+            self.data_start -= consumed
+            self.data_end -= consumed
+            self.scan_position -= consumed
+        else:
+            consumed = self.search_position
+        self.search_position = 0
+        if consumed > 0:
+            del self.buffer[:consumed]
@@ -20,10 +20,18 @@ from enum import Enum
 import struct
 
 PROTOCOL_DELIMITER = 0x55
+DELIMITER_BYTE = bytes([PROTOCOL_DELIMITER])
+DOUBLE_DELIMITER = DELIMITER_BYTE * 2
 RESERVED = bytearray.fromhex("DE AD BE")
 MAX_DATA_TYPES = 8
+# Offset of the data length field and total size of the frame header (before delimiter stuffing)
+DATA_LENGTH_OFFSET = 5
+FRAME_HEADER_SIZE = 9
 
 """ Struct module Builders for message formatting. """
+# Frame header: 5 Individual Bytes followed by an Unsigned 32 Bit Int, Big Endian.
+frame_header_builder = struct.Struct("! 5B I")
+FRAME_HEADER_PREFIX = (PROTOCOL_DELIMITER, *RESERVED)
 telecommand_request_builder_string = struct.Struct("! I 8B")
 telecommand_request_builder_integer = struct.Struct("! I q")
 telecommand_request_builder_float = struct.Struct("! I d")
@@ -32,6 +40,7 @@ telecommand_time_builder_string = struct.Struct("! I I 2B H")
 telemetry_request_builder = struct.Struct("! I")
 telemetry_response_builder = struct.Struct("! I Q")
 telemetry_rejection_response_builder = struct.Struct("! I B")
+data_length_builder = struct.Struct("! I")
 
 
 class MessageFormat:
@@ -0,0 +1,183 @@
+###################################################################################
+# @file latency.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Round Trip Latency Statistics
+###################################################################################
+import threading
+
+# Each power of two of latency (in microseconds) is split into this many buckets, ~6% resolution
+SUB_BUCKET_BITS = 4
+SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+
+def bucket_index(latency_us):
+    """ Return the histogram bucket for a latency in microseconds. """
+    if latency_us < SUB_BUCKETS:
+        return latency_us
+    shift = latency_us.bit_length() - 1 - SUB_BUCKET_BITS
+    return (shift + 1) * SUB_BUCKETS + (latency_us >> shift) - SUB_BUCKETS
+
+
+def bucket_upper_bound(index):
+    """ Return the highest latency in microseconds held by a histogram bucket. """
+    if index < SUB_BUCKETS:
+        return index
+    shift = index // SUB_BUCKETS - 1
+    return ((index % SUB_BUCKETS + SUB_BUCKETS + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """ Round trip latency histogram and timeout count for one telemetry channel or telecommand. """
+
+    def __init__(self):
+        """ Initialise the bucket counts and totals. """
+        self.buckets = {}
+        self.count = 0
+        self.timeouts = 0
+        self.max_ns = 0
+
+    def record(self, latency_ns):
+        """ Add a round trip latency in nanoseconds. """
+        index = bucket_index(latency_ns // 1000)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        if latency_ns > self.max_ns:
+            self.max_ns = latency_ns
+
+    def record_timeout(self):
+        """ Count a request that timed out. """
+        self.timeouts += 1
+
+    def percentile(self, percent):
+        """ Return the latency in milliseconds that percent of responses arrived within. """
+        if self.count == 0:
+            return None
+        target = self.count * percent / 100.0
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= target:
+                return min(bucket_upper_bound(index) / 1000.0, self.max_ns / 1e6)
+        return self.max_ns / 1e6
+
+    def summary(self):
+        """ Return the response count, timeout count and rate, and p50/p95/p99/max latency in milliseconds. """
+        requests = self.count + self.timeouts
+        return {"count": self.count,
+                "timeouts": self.timeouts,
+                "timeout_rate": self.timeouts / requests if requests else 0.0,
+                "p50": self.percentile(50),
+                "p95": self.percentile(95),
+                "p99": self.percentile(99),
+                "max": self.max_ns / 1e6 if self.count else None}
+
+
+class LatencyTracker:
+    """ Latency histograms for every telemetry channel ("TLM") and telecommand ("TC") that has been requested. """
+
+    def __init__(self):
+        """ Initialise the histograms and their lock. """
+        self.histograms = {}
+        self.lock = threading.Lock()
+
+    def histogram(self, kind, number):
+        """ Return the histogram for a channel or command number, creating it on first use. """
+        key = (kind, number)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        return histogram
+
+    def record(self, kind, number, latency_ns):
+        """ Add a round trip latency for a channel or command number. """
+        with self.lock:
+            self.histogram(kind, number).record(latency_ns)
+
+    def record_timeout(self, kind, number):
+        """ Count a timeout for a channel or command number. """
+        with self.lock:
+            self.histogram(kind, number).record_timeout()
+
+    def summary(self):
+        """ Return a summary for each (kind, number), see LatencyHistogram.summary. """
+        with self.lock:
+            return {key: histogram.summary() for key, histogram in self.histograms.items()}
+
+    def reset(self):
+        """ Discard all recorded latencies and timeouts. """
+        with self.lock:
+            self.histograms.clear()
+
+
+latency_tracker = LatencyTracker()
+latency_dump_thread = None
+
+
+def latency_summary():
+    """ Return the latency summary of every telemetry channel and telecommand. """
+    return latency_tracker.summary()
+
+
+def latency_dump():
+    """ Print the latency summary of every telemetry channel and telecommand, nothing if none were recorded. """
+    summary = latency_summary()
+    if not summary:
+        return
+    print("{:>4} {:>10} {:>8} {:>8} {:>8} {:>9} {:>9} {:>9} {:>9}".format(
+        "", "NUMBER", "COUNT", "TIMEOUTS", "TO RATE", "P50 ms", "P95 ms", "P99 ms", "MAX ms"))
+    for (kind, number), histogram_summary in sorted(summary.items()):
+        print("{:>4} {:>10} {:>8} {:>8} {:>8.1%} {:>9} {:>9} {:>9} {:>9}".format(
+            kind, number, histogram_summary["count"], histogram_summary["timeouts"],
+            histogram_summary["timeout_rate"],
+            *("-" if histogram_summary[key] is None else "{:.2f}".format(histogram_summary[key])
+              for key in ("p50", "p95", "p99", "max"))))
+
+
+class LatencyDumpThread(threading.Thread):
+    """ Prints the latency summary every interval seconds on its own Thread,
+    so formatting it never delays the continuous transmissions on the ContinuousScheduler Thread.
+    """
+
+    def __init__(self, interval):
+        """ Initialise Thread, the interval and the stop Event. """
+        super().__init__()
+        self.daemon = True
+        self.interval = interval
+        self.stop_event = threading.Event()
+
+    def run(self):
+        """ Overloads the Thread's "run" function, dumps the summary until stop() is called. """
+        while not self.stop_event.wait(self.interval):
+            latency_dump()
+
+    def stop(self):
+        """ Stop dumping the summary. """
+        self.stop_event.set()
+
+
+def latency_dump_start(interval):
+    """ Print the latency summary every interval seconds. """
+    global latency_dump_thread
+    latency_dump_stop()
+    latency_dump_thread = LatencyDumpThread(interval)
+    latency_dump_thread.start()
+
+
+def latency_dump_stop():
+    """ Stop the periodic latency summary. """
+    global latency_dump_thread
+    if latency_dump_thread is not None:
+        latency_dump_thread.stop()
+        latency_dump_thread = None
@@ -0,0 +1,302 @@
+###################################################################################
+# @file link.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS asyncio Ground Station Link
+###################################################################################
+import asyncio
+from collections import deque
+import os
+import struct
+import threading
+import time
+
+import serial
+
+import config
+from low_level.framedecoder import FrameDecoder
+from low_level.frameformat import DataType, TelecommandResponseState, telecommand_request_builder_string, \
+    telecommand_request_builder_integer, telecommand_request_builder_float, telecommand_response_builder, \
+    telemetry_request_builder, telemetry_response_builder, telemetry_rejection_response_builder
+from low_level.latency import latency_tracker
+from low_level.packet import request_frame
+
+
+class TelemetryRejectedError(Exception):
+    """ The satellite rejected a telemetry request, rejection_code is a TelemetryRejectionResponseState value. """
+
+    def __init__(self, channel, rejection_code):
+        """ Store the channel and rejection code. """
+        super().__init__("TLM CH " + str(channel) + " rejected, code " + str(rejection_code))
+        self.channel = channel
+        self.rejection_code = rejection_code
+
+
+class LinkProtocol(asyncio.Protocol):
+    """ Receive side of a GroundStationLink, decodes received bytes into frames and passes them to the link. """
+
+    def __init__(self, link):
+        """ Initialise the frame decoder. """
+        self.link = link
+        self.decoder = FrameDecoder(link.decode_error)
+
+    def data_received(self, data):
+        """ Overloads asyncio.Protocol, decodes a received chunk. """
+        for frame in self.decoder.feed(data):
+            self.link.frame_received(frame)
+
+    def connection_lost(self, exc):
+        """ Overloads asyncio.Protocol, fails every outstanding request. """
+        self.link.connection_lost(exc)
+
+
+class GroundStationLink:
+    """ Request/response link to the satellite on an asyncio event loop.
+    Every outstanding request is a Future in a FIFO per (kind, number), so thousands can be in flight at once,
+    and periodic telemetry streams are Tasks on the same loop. All methods must be called from the loop's Thread,
+    see LinkThread to use the link from other Threads.
+    """
+
+    def __init__(self):
+        """ Initialise the outstanding request index, streams and counters. """
+        self.transport = None
+        self.protocol = None
+        # Futures awaiting a response, FIFO of (future, sent time) for each ("TLM", channel) or ("TC", number)
+        self.pending = {}
+        self.streams = set()
+        self.stream_requests = set()
+        # Called with (channel, value) for every telemetry response, requested or not
+        self.telemetry_callback = None
+        self.frames_received = 0
+        self.unmatched_responses = 0
+
+    async def open_serial(self, port, baud_rate=None):
+        """ Open a serial port (at the configured baud rate by default) and attach the link to its file descriptor. """
+        loop = asyncio.get_running_loop()
+        serial_port = serial.Serial(port, config.BAUD_RATE if baud_rate is None else baud_rate, timeout=0)
+        # The read transport owns the port, the write transport gets its own descriptor so either can close
+        write_file = os.fdopen(os.dup(serial_port.fileno()), "wb", buffering=0)
+        _, self.protocol = await loop.connect_read_pipe(lambda: LinkProtocol(self), serial_port)
+        self.transport, _ = await loop.connect_write_pipe(asyncio.Protocol, write_file)
+
+    async def open_connection(self, host, port):
+        """ Attach the link to a TCP connection, E.G. the simulator. """
+        loop = asyncio.get_running_loop()
+        self.transport, self.protocol = await loop.create_connection(lambda: LinkProtocol(self), host, port)
+
+    def close(self):
+        """ Stop every stream, fail every outstanding request and close the transport. """
+        for stream in list(self.streams):
+            stream.cancel()
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+        self.connection_lost(None)
+
+    def connection_lost(self, exc):
+        """ Fail every outstanding request with ConnectionError. """
+        pending = self.pending
+        self.pending = {}
+        for fifo in pending.values():
+            for future, _ in fifo:
+                if not future.done():
+                    future.set_exception(ConnectionError("Link closed") if exc is None else exc)
+
+    def decode_error(self, error):
+        """ Frame decode error callback, errors are counted by the decoder. """
+        print("ERROR: " + error.value)
+
+    async def request(self, kind, number, frame, timeout):
+        """ Send a request frame and wait for the response matched to (kind, number).
+        Raises asyncio.TimeoutError if no response arrives within timeout seconds.
+        """
+        if self.transport is None:
+            raise ConnectionError("Link is not open")
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, time.perf_counter_ns())
+        fifo = self.pending.get((kind, number))
+        if fifo is None:
+            fifo = self.pending[(kind, number)] = deque()
+        fifo.append(entry)
+        self.transport.write(frame)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            latency_tracker.record_timeout(kind, number)
+            raise
+        finally:
+            if future.cancelled():
+                # Timed out or the caller was cancelled, stop waiting for its response
+                try:
+                    fifo.remove(entry)
+                except ValueError:
+                    pass
+                if not fifo and self.pending.get((kind, number)) is fifo:
+                    del self.pending[(kind, number)]
+
+    async def request_telemetry(self, channel, timeout=None):
+        """ Request a telemetry channel, returns its value.
+        Raises TelemetryRejectedError if the request is rejected, asyncio.TimeoutError if it times out.
+        """
+        channel = int(channel)
+        frame = request_frame(DataType.TELEMETRY_REQUEST.value, telemetry_request_builder, (channel,))
+        return await self.request("TLM", channel, frame, config.TIMEOUT if timeout is None else timeout)
+
+    async def send_telecommand(self, number, data, timeout=None):
+        """ Send a telecommand with a str (up to 8 characters), int or float argument,
+        returns the TelecommandResponseState (or the raw status if it is not a known state).
+        """
+        number = int(number)
+        if isinstance(data, str):
+            # Prepend whitespace until string is 8 chars, as tc_request_send does
+            frame = request_frame(DataType.TELECOMMAND_REQUEST.value, telecommand_request_builder_string,
+                                  (number, *bytes(data.rjust(8), "ascii")))
+        elif isinstance(data, float):
+            frame = request_frame(DataType.TELECOMMAND_REQUEST.value, telecommand_request_builder_float,
+                                  (number, data))
+        else:
+            frame = request_frame(DataType.TELECOMMAND_REQUEST.value, telecommand_request_builder_integer,
+                                  (number, int(data)))
+        return await self.request("TC", number, frame, config.TIMEOUT if timeout is None else timeout)
+
+    def stream_telemetry(self, channel, interval, callback, timeout=None):
+        """ Request a telemetry channel every interval seconds and call callback(channel, result) with each value,
+        or with the exception if the request failed. Returns the stream's Task, cancel it to stop the stream.
+        """
+        stream = asyncio.get_running_loop().create_task(self.run_stream(int(channel), interval, callback, timeout))
+        self.streams.add(stream)
+        stream.add_done_callback(self.streams.discard)
+        return stream
+
+    async def run_stream(self, channel, interval, callback, timeout):
+        """ Send a stream's requests on a drift free schedule, skipping any deadlines that have been missed.
+        Requests are not awaited, so the rate does not depend on the round trip time.
+        """
+        loop = asyncio.get_running_loop()
+        next_call = loop.time()
+        while True:
+            stream_request = loop.create_task(self.stream_request(channel, callback, timeout))
+            self.stream_requests.add(stream_request)
+            stream_request.add_done_callback(self.stream_requests.discard)
+            next_call += interval
+            now = loop.time()
+            if next_call < now:
+                next_call += ((now - next_call) // interval + 1) * interval
+            await asyncio.sleep(next_call - now)
+
+    async def stream_request(self, channel, callback, timeout):
+        """ Send one request of a stream and pass the value or exception to its callback. """
+        try:
+            result = await self.request_telemetry(channel, timeout)
+        except (asyncio.TimeoutError, TelemetryRejectedError, ConnectionError) as err:
+            result = err
+        try:
+            callback(channel, result)
+        except Exception as err:
+            print(repr(err))
+            print("ERROR: Telemetry stream callback failed")
+
+    def resolve(self, kind, number, result=None, exception=None):
+        """ Complete the oldest outstanding request for (kind, number), returns False if there wasn't one. """
+        fifo = self.pending.get((kind, number))
+        while fifo:
+            future, sent_time = fifo.popleft()
+            if future.done():
+                if not fifo:
+                    # Only finished requests were left, don't keep the empty FIFO
+                    del self.pending[(kind, number)]
+                continue
+            if not fifo:
+                del self.pending[(kind, number)]
+            latency_tracker.record(kind, number, time.perf_counter_ns() - sent_time)
+            if exception is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exception)
+            return True
+        self.unmatched_responses += 1
+        return False
+
+    def frame_received(self, frame):
+        """ Match a decoded frame to its outstanding request. """
+        self.frames_received += 1
+        data_type = frame[4]
+        data = frame[9:]
+        try:
+            if data_type == DataType.TELEMETRY_DATA.value:
+                channel, value = telemetry_response_builder.unpack(data)
+                self.resolve("TLM", channel, result=value)
+                if self.telemetry_callback is not None:
+                    self.telemetry_callback(channel, value)
+            elif data_type == DataType.TELEMETRY_REQUEST_REJECTION.value:
+                channel, rejection_code = telemetry_rejection_response_builder.unpack(data)
+                self.resolve("TLM", channel, exception=TelemetryRejectedError(channel, rejection_code))
+            elif data_type == DataType.TELECOMMAND_RESPONSE.value:
+                number, status = telecommand_response_builder.unpack(data)
+                try:
+                    status = TelecommandResponseState(status)
+                except ValueError:
+                    pass
+                self.resolve("TC", number, result=status)
+        except struct.error as err:
+            print(repr(err))
+            print("ERROR: Response data field has an invalid length")
+
+    def outstanding(self):
+        """ Return the number of requests awaiting a response. """
+        return sum(len(fifo) for fifo in self.pending.values())
+
+
+class LinkThread(threading.Thread):
+    """ Runs a GroundStationLink's event loop in a worker Thread, so Threads outside asyncio (E.G. the Qt GUI)
+    can use it. Coroutines are submitted with submit(), which returns a concurrent.futures.Future; its done
+    callbacks run in this Thread, so GUI code should pass results on through a Qt signal.
+    """
+
+    def __init__(self):
+        """ Initialise Thread, the event loop and the link. """
+        super().__init__()
+        self.daemon = True
+        self.loop = asyncio.new_event_loop()
+        self.link = GroundStationLink()
+
+    def run(self):
+        """ Overloads the Thread's "run" function, runs the event loop until stop() is called. """
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+        self.loop.run_until_complete(self.loop.shutdown_asyncgens())
+        self.loop.close()
+
+    def submit(self, coroutine):
+        """ Run a coroutine (E.G. link.request_telemetry(ch, timeout)) on the loop from any Thread. """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def call(self, function, *args):
+        """ Call a link function (E.G. link.stream_telemetry) on the loop from any Thread,
+        returns a concurrent.futures.Future of its result (E.G. the stream's Task).
+        """
+        async def call_on_loop():
+            return function(*args)
+        return asyncio.run_coroutine_threadsafe(call_on_loop(), self.loop)
+
+    def cancel_stream(self, stream):
+        """ Stop a stream returned by link.stream_telemetry from any Thread. """
+        self.loop.call_soon_threadsafe(stream.cancel)
+
+    def stop(self):
+        """ Close the link and stop the event loop. """
+        def close():
+            self.link.close()
+            self.loop.stop()
+        self.loop.call_soon_threadsafe(close)
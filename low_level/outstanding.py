@@ -0,0 +1,73 @@
+###################################################################################
+# @file outstanding.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Outstanding Request Database
+###################################################################################
+from collections import deque
+import threading
+
+
+class OutstandingRequests:
+    """ Database of requests awaiting a response, indexed by channel/command number (the request's ID).
+    Each ID holds a FIFO of its pending requests so a response is matched to the oldest one in O(1).
+    Safe to access from the GUI, packet handler, continuous and timeout Threads.
+    """
+
+    def __init__(self):
+        """ Initialise the index and its lock. """
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def append(self, request):
+        """ Add a request to the end of the FIFO for its ID. """
+        with self.lock:
+            fifo = self.pending.get(request.ID)
+            if fifo is None:
+                fifo = self.pending[request.ID] = deque()
+            fifo.append(request)
+
+    def match(self, request_id):
+        """ Remove and return the oldest pending request with this ID, None if there isn't one. """
+        with self.lock:
+            fifo = self.pending.get(request_id)
+            if not fifo:
+                return None
+            request = fifo.popleft()
+            if not fifo:
+                del self.pending[request_id]
+            return request
+
+    def remove(self, request):
+        """ Remove a request, returns False if it was not pending (E.G. it has already been matched). """
+        with self.lock:
+            fifo = self.pending.get(request.ID)
+            if not fifo:
+                return False
+            # Requests time out in the order they were sent, so this is normally the oldest
+            if fifo[0] is request:
+                fifo.popleft()
+            else:
+                try:
+                    fifo.remove(request)
+                except ValueError:
+                    return False
+            if not fifo:
+                del self.pending[request.ID]
+            return True
+
+    def __len__(self):
+        """ Return the total number of pending requests. """
+        with self.lock:
+            return sum(len(fifo) for fifo in self.pending.values())
@@ -16,10 +16,13 @@
 #  Mercury GS Protocol Formatting and Packet Handling
 #  @author: Jamie Bayley (jbayley@kispe.co.uk)
 ###################################################################################
+from low_level.batchqueue import queue_get_batch, queue_task_done
 from low_level.comms import frame_queue, comms_send
-from low_level.frameformat import MessageFormat, DataType, struct, PROTOCOL_DELIMITER
+from low_level.frameformat import DataType, DELIMITER_BYTE, DOUBLE_DELIMITER, FRAME_HEADER_SIZE, \
+    FRAME_HEADER_PREFIX, frame_header_builder
 from low_level.continuous import continuous_sender, register_continuous
 import config
+import functools
 import threading
 
 
@@ -46,6 +49,8 @@ class PacketHandler(threading.Thread):
         """ Initialise Thread, set argument as frame_queue and start Thread"""
         super().__init__()
         self.args = queue
+        # Like the receive Threads, don't keep the application alive once everything else has exited
+        self.daemon = True
         self.start()
 
     def run(self):
@@ -53,24 +58,22 @@ class PacketHandler(threading.Thread):
         and passes data up to correct module depending on data type field.
         """
         while True:
-            # Wait for queue to contain a frame, pop one off
-            frame = frame_queue.get()
-            # Unpack bitfields
-            frame_header_bytes = frame[:4]
-            frame_data_type = frame[4]
-            frame_data_length_bytes = frame[5:9]
-            frame_data_length = struct.unpack("!L", frame_data_length_bytes)[0]
-            frame_data_bytes = frame[9:]
-
-            # Pass data field up to correct module depending on data type field
-            if frame_data_type == DataType.TELEMETRY_DATA.value:
-                callback_telemetry_response(frame_data_bytes)
-            elif frame_data_type == DataType.TELEMETRY_REQUEST_REJECTION.value:
-                callback_telemetry_rejection_response(frame_data_bytes)
-            elif frame_data_type == DataType.TELECOMMAND_RESPONSE.value:
-                callback_telecommand_response(frame_data_bytes)
-
-            frame_queue.task_done()
+            # Wait for queue to contain a frame, pop off every queued frame up to the batch size
+            frames = queue_get_batch(frame_queue, config.PACKET_BATCH_SIZE)
+            for frame in frames:
+                # Unpack bitfields, the decoder has already checked the header and data length
+                frame_data_type = frame[4]
+                frame_data_bytes = frame[9:]
+
+                # Pass data field up to correct module depending on data type field
+                if frame_data_type == DataType.TELEMETRY_DATA.value:
+                    callback_telemetry_response(frame_data_bytes)
+                elif frame_data_type == DataType.TELEMETRY_REQUEST_REJECTION.value:
+                    callback_telemetry_rejection_response(frame_data_bytes)
+                elif frame_data_type == DataType.TELECOMMAND_RESPONSE.value:
+                    callback_telecommand_response(frame_data_bytes)
+
+            queue_task_done(frame_queue, len(frames))
 
 
 def packet_init():
@@ -92,24 +95,36 @@ def packetize(data_to_packet, data_type, is_continuous, message_object_database,
     """ Format the data into the desired protocol
     This function fulfills requirement PLAT_COMMS_00040.
     """
-    # Create class instance for the packet, this may be useful in the future
-    packet_class = MessageFormat(data_to_packet, len(data_to_packet), data_type)
-    # Create the packet builder using Struct module to build a packet binary representation of
-    # 5 Individual Bytes followed by an Unsigned 32 Bit Int, Big Endian.
-    packet_builder = struct.Struct("! 5B I")
-    # Build the packet
-    packet_packed = bytearray(packet_builder.pack(packet_class.header,
-                                                  packet_class.reserved1,
-                                                  packet_class.reserved2,
-                                                  packet_class.reserved3,
-                                                  packet_class.data_type,
-                                                  packet_class.data_length))
-
-    # Add the data field on the end of the packet
-    # (this cannot be created using the packet builder as the data field is of variable size).
-    packet_packed.extend(packet_class.data)
-    # Scan the packet for delimiter bytes, add an extra delimiter after any delimiter found except the first one
-    packet = delimiter_scan_and_add(packet_packed)
+    # Build the packet, stuffing any delimiters after the start of frame
+    packet = build_frame(data_to_packet, data_type)
+    frame_send(packet, is_continuous, message_object_database, latest_message_object)
+
+
+def request_frame(data_type, data_format_builder, data_to_format):
+    """ Format the data with the struct builder and build it into a frame.
+    Frames are cached by data type and packed data field, so repeated requests skip delimiter stuffing.
+    """
+    return encoded_frame(data_type, data_format(data_to_format, data_format_builder))
+
+
+@functools.lru_cache(maxsize=config.FRAME_CACHE_SIZE)
+def encoded_frame(data_type, data_field):
+    """ Return the frame for a packed data field.
+    Keyed on the packed bytes rather than the arguments, as arguments that compare equal can pack differently
+    (E.G. a float argument of -0.0 and 0.0).
+    """
+    return bytes(build_frame(data_field, data_type))
+
+
+def frame_cache_info():
+    """ Return the hits, misses, maxsize and currsize of the request frame cache. """
+    return encoded_frame.cache_info()
+
+
+def frame_send(packet, is_continuous, message_object_database, latest_message_object):
+    """ Start the timeout timer for the message, send the packet and register it for continuous transmission
+    if required.
+    """
     # Start the Timeout timer for this message
     latest_message_object.start_timer()
     # Send the message
@@ -125,30 +140,20 @@ def packetize(data_to_packet, data_type, is_continuous, message_object_database,
             callback_exception_handler("ERROR: Rate is 0, cannot run continuously")
 
 
-def delimiter_scan_and_add(data_to_scan):
-    """ Scan data passed in for any delimiters,
-    insert an extra delimiter after any delimiter found except the first one so that the receiver doesn't interpret
-    it as a start of a new frame.
-    This function fulfills requirement PLAT_COMMS_00045
+def build_frame(data, data_type):
+    """ Build the stuffed frame for the data field and data type passed in.
+    The header is packed into a new buffer with the precompiled header builder and the data field is appended,
+    so a data field with no delimiters is copied exactly once on its way to the wire.
+    This function fulfills requirements PLAT_COMMS_00040 and PLAT_COMMS_00045.
     """
-    # Copy data buffer into mutable bytearray
-    data_editable_copy = bytearray(data_to_scan)
-    header_checked = False
-    num_added_delimiters = 0
-    # Iterate over bytes in data
-    for index, byte in enumerate(data_to_scan):
-        if byte == PROTOCOL_DELIMITER:
-            # This byte is a delimiter!
-            if header_checked is False:
-                # This is the first delimiter found, I.E Start of Frame. Do not add another delimiter after it.
-                header_checked = True
-            else:
-                # Add another delimiter after this
-                data_editable_copy.insert(index + num_added_delimiters, PROTOCOL_DELIMITER)
-                num_added_delimiters += 1
-                if index >= 9:
-                    data_editable_copy[8] += 1 # TODO: Find a better solution, this will overflow after 255
-                    # TODO: Also index of data length may not be 8 if there are delimiters in the header
-    # Copy edited bytearray back over to data buffer and return
-    scanned_data = bytes(data_editable_copy)
-    return scanned_data
+    data_field = data
+    if data.find(DELIMITER_BYTE) != -1:
+        data_field = data.replace(DELIMITER_BYTE, DOUBLE_DELIMITER)
+    frame = bytearray(FRAME_HEADER_SIZE)
+    frame_header_builder.pack_into(frame, 0, *FRAME_HEADER_PREFIX, data_type, len(data_field))
+    # Rarely the data type or data length field contains a delimiter, stuff the header too
+    if frame.find(DELIMITER_BYTE, 1) != -1:
+        frame[1:] = frame[1:].replace(DELIMITER_BYTE, DOUBLE_DELIMITER)
+    frame += data_field
+    return frame
+
@@ -0,0 +1,182 @@
+###################################################################################
+# @file replay.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Capture Replay
+###################################################################################
+# Run from the repository root with:
+#   python -m low_level.replay captures/capture_....mgscap            (as fast as possible)
+#   python -m low_level.replay "test_frames/Telemetry Response Ch1" --pace
+import argparse
+import mmap
+import threading
+import time
+
+import config
+from low_level.capture import CAPTURE_MAGIC, CAPTURE_RX, capture_records
+from low_level.comms import frame_queue, frame_queue_put
+from low_level.framedecoder import FrameDecoder
+from low_level.frameformat import DataType
+
+# Bits on the wire per byte (start, 8 data and stop bits), paces raw captures without timestamps
+BITS_PER_BYTE = 10
+
+
+def raw_chunks(view, chunk_size, baud_rate):
+    """ Split a raw capture (E.G. a test_frames file) into (monotonic ns, chunk) reads,
+    timestamped as if received back to back at baud_rate.
+    """
+    ns_per_byte = BITS_PER_BYTE * 1e9 / baud_rate
+    for offset in range(0, len(view), chunk_size):
+        yield int(offset * ns_per_byte), view[offset:offset + chunk_size]
+
+
+def capture_chunks(view):
+    """ Return the (monotonic ns, chunk) of every received record of a capture file. """
+    for direction, timestamp, data in capture_records(view):
+        if direction == CAPTURE_RX:
+            yield timestamp, data
+
+
+class CaptureReplay(threading.Thread):
+    """ Memory maps a link capture (or a raw test_frames file) and feeds every received chunk through
+    a FrameDecoder into the frame queue, to be processed by the PacketHandler as if it had just been received.
+    Runs as fast as possible by default, or at the recorded pace (scaled by speed) with pace=True.
+    Call replay() directly to replay in the calling Thread, or start() to replay in the background.
+    """
+
+    def __init__(self, path, pace=False, speed=1.0, chunk_size=None):
+        """ Initialise Thread, the decoder and the counters. """
+        super().__init__()
+        self.daemon = True
+        self.path = path
+        self.pace = pace
+        self.speed = speed
+        self.chunk_size = config.RX_MAX_CHUNK_SIZE if chunk_size is None else chunk_size
+        self.decoder = FrameDecoder()
+        self.stop_event = threading.Event()
+        self.chunks = 0
+        self.frames = 0
+        self.seconds = 0.0
+        self.frames_dropped_start = 0
+
+    def run(self):
+        """ Overloads the Thread's "run" function, replays the capture once. """
+        try:
+            self.replay()
+        except (OSError, ValueError) as err:
+            print(repr(err))
+            print("ERROR: Cannot replay " + str(self.path))
+
+    def replay(self):
+        """ Replay the capture, returns the summary once the PacketHandler has processed every frame. """
+        self.frames_dropped_start = frame_queue.frames_dropped
+        with open(self.path, "rb") as capture_file:
+            # mmap can't map an empty file
+            if capture_file.seek(0, 2) == 0:
+                return self.summary()
+            with mmap.mmap(capture_file.fileno(), 0, access=mmap.ACCESS_READ) as capture_map:
+                view = memoryview(capture_map)
+                try:
+                    if view[:len(CAPTURE_MAGIC)] == CAPTURE_MAGIC:
+                        chunks = capture_chunks(view)
+                    else:
+                        chunks = raw_chunks(view, self.chunk_size, config.BAUD_RATE)
+                    self.feed(chunks)
+                finally:
+                    # Every memoryview into the map must be released before it can close
+                    chunks = None
+                    view.release()
+        return self.summary()
+
+    def feed(self, chunks):
+        """ Decode each chunk and queue its frames, sleeping until each chunk is due when pacing. """
+        decoder = self.decoder
+        start_time = time.perf_counter()
+        first_timestamp = None
+        for timestamp, chunk in chunks:
+            if self.pace is True:
+                if first_timestamp is None:
+                    first_timestamp = timestamp
+                delay = start_time + (timestamp - first_timestamp) / 1e9 / self.speed - time.perf_counter()
+                if delay > 0 and self.stop_event.wait(delay):
+                    break
+            elif self.stop_event.is_set():
+                break
+            self.chunks += 1
+            for frame in decoder.feed(chunk):
+                frame_queue_put(frame)
+                self.frames += 1
+        # Include the PacketHandler's processing of the last frames
+        frame_queue.join()
+        self.seconds = time.perf_counter() - start_time
+
+    def stop(self):
+        """ Stop the replay after the current chunk. """
+        self.stop_event.set()
+
+    def summary(self):
+        """ Return the chunks, frames and bytes replayed, frames and bytes per second and decode error counts. """
+        seconds = self.seconds
+        return {"chunks": self.chunks,
+                "frames": self.frames,
+                "bytes": self.decoder.bytes_received,
+                "seconds": seconds,
+                "frames_per_second": self.frames / seconds if seconds else 0.0,
+                "bytes_per_second": self.decoder.bytes_received / seconds if seconds else 0.0,
+                "frames_dropped": frame_queue.frames_dropped - self.frames_dropped_start,
+                "errors": {error.name: count for error, count in self.decoder.error_counts.items()}}
+
+
+def replay_report(summary):
+    """ Print a replay summary. """
+    print("{} frames from {} bytes in {} chunks in {:.3f} s".format(summary["frames"], summary["bytes"],
+                                                                 summary["chunks"], summary["seconds"]))
+    print("{:.0f} frames/s, {:.0f} bytes/s, {} frames dropped by the frame queue".format(
+        summary["frames_per_second"], summary["bytes_per_second"], summary["frames_dropped"]))
+    print("Decode errors:")
+    for error, count in summary["errors"].items():
+        print("  {:<24} {:>10}".format(error, count))
+
+
+def main():
+    from low_level.packet import packet_init, packet_register_callback
+
+    parser = argparse.ArgumentParser(description="Replay a link capture through the frame decoder and packet handler")
+    parser.add_argument("capture", help="capture file, or a raw file of received bytes such as a test_frames file")
+    parser.add_argument("--pace", action="store_true", help="replay at the recorded pace instead of flat out")
+    parser.add_argument("--speed", type=float, default=1.0, help="pace multiplier, E.G. 2 for double speed")
+    parser.add_argument("--pipeline", action="store_true", help="queue frames without waiting for each one")
+    args = parser.parse_args()
+
+    # Count the frames the PacketHandler passes up for each data type
+    counts = {data_type: 0 for data_type in (DataType.TELEMETRY_DATA, DataType.TELEMETRY_REQUEST_REJECTION,
+                                             DataType.TELECOMMAND_RESPONSE)}
+
+    def counter(data_type):
+        def count(data):
+            counts[data_type] += 1
+        return count
+
+    packet_register_callback(counter(DataType.TELEMETRY_DATA), counter(DataType.TELEMETRY_REQUEST_REJECTION),
+                             counter(DataType.TELECOMMAND_RESPONSE), print)
+    config.FRAME_PIPELINE = args.pipeline
+    packet_init()
+    replay_report(CaptureReplay(args.capture, args.pace, args.speed).replay())
+    for data_type, count in counts.items():
+        print("{:<28} {:>10}".format(data_type.name, count))
+
+
+if __name__ == "__main__":
+    main()
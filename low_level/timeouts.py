@@ -0,0 +1,115 @@
+###################################################################################
+# @file timeouts.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Request Timeout Handling
+###################################################################################
+import itertools
+import math
+import threading
+import time
+
+import config
+
+
+class TimeoutWheel(threading.Thread):
+    """ Hashed timer wheel that tracks the timeouts of every outstanding request from a single Thread.
+    Each timeout is stored by ID in the slot for its deadline tick, so arming and cancelling are O(1).
+    """
+
+    def __init__(self, tick=config.TIMEOUT_TICK, slots=config.TIMEOUT_WHEEL_SLOTS):
+        """ Initialise Thread, the wheel slots and the tick clock. """
+        super().__init__()
+        self.daemon = True
+        self.tick = tick
+        self.slots = [dict() for _ in range(slots)]
+        # Slot holding each armed timeout ID
+        self.armed = {}
+        self.ids = itertools.count()
+        self.start_time = time.monotonic()
+        self.processed_tick = 0
+        self.condition = threading.Condition()
+
+    def clock_tick(self):
+        """ Return the current tick number. """
+        return int((time.monotonic() - self.start_time) / self.tick)
+
+    def arm(self, timeout, callback):
+        """ Call callback once timeout seconds have elapsed, unless cancelled first. Returns the timeout ID. """
+        with self.condition:
+            timeout_id = next(self.ids)
+            deadline = self.clock_tick() + max(1, math.ceil(timeout / self.tick))
+            slot = deadline % len(self.slots)
+            self.slots[slot][timeout_id] = (deadline, callback)
+            self.armed[timeout_id] = slot
+            if len(self.armed) == 1:
+                # Wake the Thread from idle
+                self.condition.notify()
+        if not self.is_alive():
+            try:
+                self.start()
+            except RuntimeError:
+                # Already started by another caller
+                pass
+        return timeout_id
+
+    def cancel(self, timeout_id):
+        """ Cancel a timeout, returns False if it has already expired or been cancelled. """
+        with self.condition:
+            slot = self.armed.pop(timeout_id, None)
+            if slot is None:
+                return False
+            del self.slots[slot][timeout_id]
+            return True
+
+    def outstanding(self):
+        """ Return the number of armed timeouts. """
+        return len(self.armed)
+
+    def expire(self, current_tick):
+        """ Remove and return the callbacks of every timeout due by current_tick. """
+        expired = []
+        if current_tick - self.processed_tick >= len(self.slots):
+            # Fallen a whole revolution behind, check every slot
+            slots_to_check = range(len(self.slots))
+        else:
+            slots_to_check = (tick % len(self.slots) for tick in range(self.processed_tick + 1, current_tick + 1))
+        for slot in slots_to_check:
+            timeouts = self.slots[slot]
+            for timeout_id in [timeout_id for timeout_id, (deadline, _) in timeouts.items()
+                               if deadline <= current_tick]:
+                expired.append(timeouts.pop(timeout_id)[1])
+                del self.armed[timeout_id]
+        self.processed_tick = current_tick
+        return expired
+
+    def run(self):
+        """ Overloads the Thread's "run" function, advances the wheel every tick while timeouts are armed. """
+        while True:
+            with self.condition:
+                while not self.armed:
+                    # Nothing is armed, skip the idle ticks. Anything armed later has a deadline after this tick
+                    self.processed_tick = self.clock_tick()
+                    self.condition.wait()
+                self.condition.wait(self.tick)
+                expired = self.expire(self.clock_tick())
+            for callback in expired:
+                try:
+                    callback()
+                except Exception as err:
+                    print(repr(err))
+                    print("ERROR: Timeout callback failed")
+
+
+timeout_wheel = TimeoutWheel()
@@ -18,18 +18,21 @@
 ###################################################################################
 import sys
 
-from PyQt5.QtCore import QRegExp
+from PyQt5.QtCore import QRegExp, QTimer
 from PyQt5.QtGui import QRegExpValidator, QIntValidator, QDoubleValidator, QValidator
-from PyQt5.QtWidgets import QFileDialog, QApplication, QMainWindow
+from PyQt5.QtWidgets import QFileDialog, QApplication, QMainWindow, QHeaderView
 
 import config
 from config import config_register_callback, change_timeout, OS, COMMS, RaspberryPi
 from low_level.continuous import continuous_register_callback, adjust_continuous, continuous_stop
 from low_level.packet import packet_register_callback, packet_init
 from low_level.comms import comms_init, comms_register_callback, change_baud_rate, change_com_port
+from low_level.latency import latency_dump_start
 from platform_comms_app import Ui_MainWindow
 from telecommand import tc_request_send, telecommand_register_callback, tc_response, tc_time_send
 from telemetry import tlm_rejection_response, tlm_request_send, telemetry_register_callback, tlm_response
+from telemetry_store import LatestValueStore
+from telemetry_view import TelemetryTableModel
 from test import transmit_test_frame, test_register_callback
 import time
 from datetime import datetime
@@ -89,52 +92,19 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         self.inputTlmAdHocChannelValue.setValidator(UIntValidator(self.inputTlmAdHocChannelValue))
         self.inputTcDataValue.setValidator(QRegExpValidator(QRegExp(".{0,8}"), self.inputTcDataValue))
 
-        self.tlm_response_field = ({"channel": self.labelTlmSlot1, "value": self.labelTlmSlot1Value},
-                                   {"channel": self.labelTlmSlot2, "value": self.labelTlmSlot2Value},
-                                   {"channel": self.labelTlmSlot3, "value": self.labelTlmSlot3Value},
-                                   {"channel": self.labelTlmSlot4, "value": self.labelTlmSlot4Value},
-                                   {"channel": self.labelTlmSlot5, "value": self.labelTlmSlot5Value},
-                                   {"channel": self.labelTlmSlot6, "value": self.labelTlmSlot6Value},
-                                   {"channel": self.labelTlmSlot7, "value": self.labelTlmSlot7Value},
-                                   {"channel": self.labelTlmSlot8, "value": self.labelTlmSlot8Value},
-                                   {"channel": self.labelTlmSlot9, "value": self.labelTlmSlot9Value},
-                                   {"channel": self.labelTlmSlot10, "value": self.labelTlmSlot10Value},
-                                   {"channel": self.labelTlmSlot11, "value": self.labelTlmSlot11Value},
-                                   {"channel": self.labelTlmSlot12, "value": self.labelTlmSlot12Value},
-                                   {"channel": self.labelTlmSlot13, "value": self.labelTlmSlot13Value},
-                                   {"channel": self.labelTlmSlot14, "value": self.labelTlmSlot14Value},
-                                   {"channel": self.labelTlmSlot15, "value": self.labelTlmSlot15Value},
-                                   {"channel": self.labelTlmSlot16, "value": self.labelTlmSlot16Value},
-                                   {"channel": self.labelTlmSlot17, "value": self.labelTlmSlot17Value},
-                                   {"channel": self.labelTlmSlot18, "value": self.labelTlmSlot18Value},
-                                   {"channel": self.labelTlmSlot19, "value": self.labelTlmSlot19Value},
-                                   {"channel": self.labelTlmSlot20, "value": self.labelTlmSlot20Value},
-                                   {"channel": self.labelTlmSlot21, "value": self.labelTlmSlot21Value},
-                                   {"channel": self.labelTlmSlot22, "value": self.labelTlmSlot22Value},
-                                   {"channel": self.labelTlmSlot23, "value": self.labelTlmSlot23Value},
-                                   {"channel": self.labelTlmSlot24, "value": self.labelTlmSlot24Value},
-                                   {"channel": self.labelTlmSlot25, "value": self.labelTlmSlot25Value},
-                                   {"channel": self.labelTlmSlot26, "value": self.labelTlmSlot26Value},
-                                   {"channel": self.labelTlmSlot27, "value": self.labelTlmSlot27Value},
-                                   {"channel": self.labelTlmSlot28, "value": self.labelTlmSlot28Value},
-                                   {"channel": self.labelTlmSlot29, "value": self.labelTlmSlot29Value},
-                                   {"channel": self.labelTlmSlot30, "value": self.labelTlmSlot30Value},
-                                   {"channel": self.labelTlmSlot31, "value": self.labelTlmSlot31Value},
-                                   {"channel": self.labelTlmSlot32, "value": self.labelTlmSlot32Value},
-                                   {"channel": self.labelTlmSlot33, "value": self.labelTlmSlot33Value},
-                                   {"channel": self.labelTlmSlot34, "value": self.labelTlmSlot34Value},
-                                   {"channel": self.labelTlmSlot35, "value": self.labelTlmSlot35Value},
-                                   {"channel": self.labelTlmSlot36, "value": self.labelTlmSlot36Value},
-                                   {"channel": self.labelTlmSlot37, "value": self.labelTlmSlot37Value},
-                                   {"channel": self.labelTlmSlot38, "value": self.labelTlmSlot38Value},
-                                   {"channel": self.labelTlmSlot39, "value": self.labelTlmSlot39Value},
-                                   {"channel": self.labelTlmSlot40, "value": self.labelTlmSlot40Value})
-
-        self.tlm_response_list = list()
-
-        for tlm_slot in self.tlm_response_field:
-            tlm_slot["channel"].setText("")
-            tlm_slot["value"].setText("")
+        # Every channel received, shown in ascending channel order
+        self.tlm_table_model = TelemetryTableModel(self)
+        self.tableViewTlm.setModel(self.tlm_table_model)
+        self.tableViewTlm.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.tableViewTlm.horizontalHeader().setStretchLastSection(True)
+        # The plot channel list follows the table, a channel's index is its row
+        self.tlm_table_model.rowsInserted.connect(self.plot_channels_inserted)
+        self.widgetTlmPlot.set_time_span(self.spinBoxPlotTimeSpan.value())
+        # Latest telemetry values written by the packet handler Thread, shown on each GUI refresh
+        self.tlm_latest_values = LatestValueStore()
+        self.tlm_refresh_timer = QTimer(self)
+        self.tlm_refresh_timer.timeout.connect(self.telemetry_refresh)
+        self.tlm_refresh_timer.start(int(1000 / config.GUI_REFRESH_RATE))
 
         if RaspberryPi is False:
             self.comboBoxComms.setEnabled(False)
@@ -154,6 +124,8 @@ class MainWindow(QMainWindow, Ui_MainWindow):
         continuous_register_callback(self.error_message_box)
         config_register_callback(self.error_message_box)
         packet_init()
+        if config.LATENCY_DUMP_INTERVAL > 0:
+            latency_dump_start(config.LATENCY_DUMP_INTERVAL)
 
     # TODO: I think there is a better way to handle events
     # There is event handlers and signals, not sure what to use.
@@ -302,20 +274,24 @@ class MainWindow(QMainWindow, Ui_MainWindow):
             self.inputTcDataValue.setValidator(QDoubleValidator())
 
     def telemetry_response_receive(self, telemetry_channel, telemetry_data):
+        # Called from the packet handler Thread, the GUI is updated on the next refresh
+        self.tlm_latest_values.update(telemetry_channel, telemetry_data)
 
-        if not any(d.get('channel') == telemetry_channel for d in self.tlm_response_list):
-            self.tlm_response_list.append({"channel": telemetry_channel, "value": telemetry_data})
-        else:
-            for item in self.tlm_response_list:
-                if item["channel"] == telemetry_channel:
-                    item["value"] = telemetry_data
+    def telemetry_refresh(self):
+        changed = self.tlm_latest_values.take_changed()
+        if changed:
+            self.tlm_table_model.apply_changes(changed)
+
+    def plot_channels_inserted(self, parent, first, last):
+        for row in range(first, last + 1):
+            channel_number = self.tlm_table_model.columns.channels[row]
+            self.comboBoxPlotChannel.insertItem(row, "TLM CH " + str(channel_number), channel_number)
 
-        from operator import itemgetter
-        self.tlm_response_list = sorted(self.tlm_response_list, key=itemgetter("channel"))
+    def on_plot_channel_change(self):
+        self.widgetTlmPlot.set_channel(self.comboBoxPlotChannel.currentData())
 
-        for slot, telemetry_to_plot in zip(self.tlm_response_field, self.tlm_response_list):
-            slot["channel"].setText("TLM CH " + telemetry_to_plot["channel"])
-            slot["value"].setText(telemetry_to_plot["value"])
+    def on_plot_time_span_change(self):
+        self.widgetTlmPlot.set_time_span(self.spinBoxPlotTimeSpan.value())
 
     def telemetry_rejection_response_receive(self, telemetry_channel, telemetry_rejection_code):
         self.labelTlmErrChannelValue.setText(telemetry_channel)
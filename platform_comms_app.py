@@ -36,651 +36,19 @@ class Ui_MainWindow(object):
         self.groupBoxTlm.setObjectName("groupBoxTlm")
         self.verticalLayout_5 = QtWidgets.QVBoxLayout(self.groupBoxTlm)
         self.verticalLayout_5.setObjectName("verticalLayout_5")
-        self.gridLayoutTlmResponse = QtWidgets.QGridLayout()
-        self.gridLayoutTlmResponse.setObjectName("gridLayoutTlmResponse")
-        self.labelTlmSlot2Value = QtWidgets.QLabel(self.groupBoxTlm)
+        self.tableViewTlm = QtWidgets.QTableView(self.groupBoxTlm)
         sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
         sizePolicy.setHorizontalStretch(0)
         sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot2Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot2Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot2Value.setObjectName("labelTlmSlot2Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot2Value, 1, 1, 1, 1)
-        self.labelTlmSlot4Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot4Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot4Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot4Value.setObjectName("labelTlmSlot4Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot4Value, 3, 1, 1, 1)
-        self.labelTlmSlot5 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot5.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot5.setSizePolicy(sizePolicy)
-        self.labelTlmSlot5.setObjectName("labelTlmSlot5")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot5, 4, 0, 1, 1)
-        self.labelTlmSlot2 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot2.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot2.setSizePolicy(sizePolicy)
-        self.labelTlmSlot2.setObjectName("labelTlmSlot2")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot2, 1, 0, 1, 1)
-        self.labelTlmSlot6Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot6Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot6Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot6Value.setObjectName("labelTlmSlot6Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot6Value, 5, 1, 1, 1)
-        self.labelTlmSlot9Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot9Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot9Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot9Value.setObjectName("labelTlmSlot9Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot9Value, 8, 1, 1, 1)
-        self.labelTlmSlot4 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot4.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot4.setSizePolicy(sizePolicy)
-        self.labelTlmSlot4.setObjectName("labelTlmSlot4")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot4, 3, 0, 1, 1)
-        self.labelTlmSlot8 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot8.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot8.setSizePolicy(sizePolicy)
-        self.labelTlmSlot8.setObjectName("labelTlmSlot8")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot8, 7, 0, 1, 1)
-        self.labelTlmSlot9 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot9.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot9.setSizePolicy(sizePolicy)
-        self.labelTlmSlot9.setObjectName("labelTlmSlot9")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot9, 8, 0, 1, 1)
-        self.labelTlmSlot1 = QtWidgets.QLabel(self.groupBoxTlm)
-        self.labelTlmSlot1.setEnabled(True)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot1.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot1.setSizePolicy(sizePolicy)
-        self.labelTlmSlot1.setAutoFillBackground(False)
-        self.labelTlmSlot1.setObjectName("labelTlmSlot1")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot1, 0, 0, 1, 1)
-        self.labelTlmSlot5Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot5Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot5Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot5Value.setObjectName("labelTlmSlot5Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot5Value, 4, 1, 1, 1)
-        self.labelTlmSlot3 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot3.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot3.setSizePolicy(sizePolicy)
-        self.labelTlmSlot3.setObjectName("labelTlmSlot3")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot3, 2, 0, 1, 1)
-        self.labelTlmSlot6 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot6.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot6.setSizePolicy(sizePolicy)
-        self.labelTlmSlot6.setObjectName("labelTlmSlot6")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot6, 5, 0, 1, 1)
-        self.labelTlmSlot7 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot7.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot7.setSizePolicy(sizePolicy)
-        self.labelTlmSlot7.setObjectName("labelTlmSlot7")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot7, 6, 0, 1, 1)
-        self.labelTlmSlot7Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot7Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot7Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot7Value.setObjectName("labelTlmSlot7Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot7Value, 6, 1, 1, 1)
-        self.labelTlmSlot8Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot8Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot8Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot8Value.setObjectName("labelTlmSlot8Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot8Value, 7, 1, 1, 1)
-        self.labelTlmSlot1Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot1Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot1Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot1Value.setObjectName("labelTlmSlot1Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot1Value, 0, 1, 1, 1)
-        self.labelTlmSlot3Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot3Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot3Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot3Value.setObjectName("labelTlmSlot3Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot3Value, 2, 1, 1, 1)
-        self.labelTlmSlot28Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot28Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot28Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot28Value.setObjectName("labelTlmSlot28Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot28Value, 7, 5, 1, 1)
-        self.labelTlmSlot35 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot35.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot35.setSizePolicy(sizePolicy)
-        self.labelTlmSlot35.setObjectName("labelTlmSlot35")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot35, 4, 6, 1, 1)
-        self.labelTlmSlot30Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot30Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot30Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot30Value.setObjectName("labelTlmSlot30Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot30Value, 9, 5, 1, 1)
-        self.labelTlmSlot29Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot29Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot29Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot29Value.setObjectName("labelTlmSlot29Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot29Value, 8, 5, 1, 1)
-        self.labelTlmSlot21 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot21.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot21.setSizePolicy(sizePolicy)
-        self.labelTlmSlot21.setObjectName("labelTlmSlot21")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot21, 0, 4, 1, 1)
-        self.labelTlmSlot22 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot22.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot22.setSizePolicy(sizePolicy)
-        self.labelTlmSlot22.setObjectName("labelTlmSlot22")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot22, 1, 4, 1, 1)
-        self.labelTlmSlot24 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot24.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot24.setSizePolicy(sizePolicy)
-        self.labelTlmSlot24.setObjectName("labelTlmSlot24")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot24, 3, 4, 1, 1)
-        self.labelTlmSlot23 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot23.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot23.setSizePolicy(sizePolicy)
-        self.labelTlmSlot23.setObjectName("labelTlmSlot23")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot23, 2, 4, 1, 1)
-        self.labelTlmSlot28 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot28.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot28.setSizePolicy(sizePolicy)
-        self.labelTlmSlot28.setObjectName("labelTlmSlot28")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot28, 7, 4, 1, 1)
-        self.labelTlmSlot27 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot27.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot27.setSizePolicy(sizePolicy)
-        self.labelTlmSlot27.setObjectName("labelTlmSlot27")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot27, 6, 4, 1, 1)
-        self.labelTlmSlot26 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot26.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot26.setSizePolicy(sizePolicy)
-        self.labelTlmSlot26.setObjectName("labelTlmSlot26")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot26, 5, 4, 1, 1)
-        self.labelTlmSlot29 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot29.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot29.setSizePolicy(sizePolicy)
-        self.labelTlmSlot29.setObjectName("labelTlmSlot29")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot29, 8, 4, 1, 1)
-        self.labelTlmSlot25 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot25.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot25.setSizePolicy(sizePolicy)
-        self.labelTlmSlot25.setObjectName("labelTlmSlot25")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot25, 4, 4, 1, 1)
-        self.labelTlmSlot11 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot11.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot11.setSizePolicy(sizePolicy)
-        self.labelTlmSlot11.setObjectName("labelTlmSlot11")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot11, 0, 2, 1, 1)
-        self.labelTlmSlot11Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot11Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot11Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot11Value.setObjectName("labelTlmSlot11Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot11Value, 0, 3, 1, 1)
-        self.labelTlmSlot12 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot12.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot12.setSizePolicy(sizePolicy)
-        self.labelTlmSlot12.setObjectName("labelTlmSlot12")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot12, 1, 2, 1, 1)
-        self.labelTlmSlot30 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot30.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot30.setSizePolicy(sizePolicy)
-        self.labelTlmSlot30.setObjectName("labelTlmSlot30")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot30, 9, 4, 1, 1)
-        self.labelTlmSlot16 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot16.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot16.setSizePolicy(sizePolicy)
-        self.labelTlmSlot16.setObjectName("labelTlmSlot16")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot16, 5, 2, 1, 1)
-        self.labelTlmSlot17 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot17.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot17.setSizePolicy(sizePolicy)
-        self.labelTlmSlot17.setObjectName("labelTlmSlot17")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot17, 6, 2, 1, 1)
-        self.labelTlmSlot14 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot14.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot14.setSizePolicy(sizePolicy)
-        self.labelTlmSlot14.setObjectName("labelTlmSlot14")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot14, 3, 2, 1, 1)
-        self.labelTlmSlot15 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot15.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot15.setSizePolicy(sizePolicy)
-        self.labelTlmSlot15.setObjectName("labelTlmSlot15")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot15, 4, 2, 1, 1)
-        self.labelTlmSlot13 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot13.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot13.setSizePolicy(sizePolicy)
-        self.labelTlmSlot13.setObjectName("labelTlmSlot13")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot13, 2, 2, 1, 1)
-        self.labelTlmSlot18 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot18.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot18.setSizePolicy(sizePolicy)
-        self.labelTlmSlot18.setObjectName("labelTlmSlot18")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot18, 7, 2, 1, 1)
-        self.labelTlmSlot10 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot10.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot10.setSizePolicy(sizePolicy)
-        self.labelTlmSlot10.setObjectName("labelTlmSlot10")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot10, 9, 0, 1, 1)
-        self.labelTlmSlot20 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot20.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot20.setSizePolicy(sizePolicy)
-        self.labelTlmSlot20.setObjectName("labelTlmSlot20")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot20, 9, 2, 1, 1)
-        self.labelTlmSlot10Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot10Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot10Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot10Value.setObjectName("labelTlmSlot10Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot10Value, 9, 1, 1, 1)
-        self.labelTlmSlot20Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot20Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot20Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot20Value.setObjectName("labelTlmSlot20Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot20Value, 9, 3, 1, 1)
-        self.labelTlmSlot19 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot19.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot19.setSizePolicy(sizePolicy)
-        self.labelTlmSlot19.setObjectName("labelTlmSlot19")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot19, 8, 2, 1, 1)
-        self.labelTlmSlot16Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot16Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot16Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot16Value.setObjectName("labelTlmSlot16Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot16Value, 5, 3, 1, 1)
-        self.labelTlmSlot14Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot14Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot14Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot14Value.setObjectName("labelTlmSlot14Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot14Value, 3, 3, 1, 1)
-        self.labelTlmSlot15Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot15Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot15Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot15Value.setObjectName("labelTlmSlot15Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot15Value, 4, 3, 1, 1)
-        self.labelTlmSlot12Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot12Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot12Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot12Value.setObjectName("labelTlmSlot12Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot12Value, 1, 3, 1, 1)
-        self.labelTlmSlot13Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot13Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot13Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot13Value.setObjectName("labelTlmSlot13Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot13Value, 2, 3, 1, 1)
-        self.labelTlmSlot22Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot22Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot22Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot22Value.setObjectName("labelTlmSlot22Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot22Value, 1, 5, 1, 1)
-        self.labelTlmSlot21Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot21Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot21Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot21Value.setObjectName("labelTlmSlot21Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot21Value, 0, 5, 1, 1)
-        self.labelTlmSlot17Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot17Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot17Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot17Value.setObjectName("labelTlmSlot17Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot17Value, 6, 3, 1, 1)
-        self.labelTlmSlot19Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot19Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot19Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot19Value.setObjectName("labelTlmSlot19Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot19Value, 8, 3, 1, 1)
-        self.labelTlmSlot18Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot18Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot18Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot18Value.setObjectName("labelTlmSlot18Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot18Value, 7, 3, 1, 1)
-        self.labelTlmSlot23Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot23Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot23Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot23Value.setObjectName("labelTlmSlot23Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot23Value, 2, 5, 1, 1)
-        self.labelTlmSlot27Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot27Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot27Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot27Value.setObjectName("labelTlmSlot27Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot27Value, 6, 5, 1, 1)
-        self.labelTlmSlot26Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot26Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot26Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot26Value.setObjectName("labelTlmSlot26Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot26Value, 5, 5, 1, 1)
-        self.labelTlmSlot25Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot25Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot25Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot25Value.setObjectName("labelTlmSlot25Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot25Value, 4, 5, 1, 1)
-        self.labelTlmSlot24Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot24Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot24Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot24Value.setObjectName("labelTlmSlot24Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot24Value, 3, 5, 1, 1)
-        self.labelTlmSlot35Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot35Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot35Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot35Value.setObjectName("labelTlmSlot35Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot35Value, 4, 7, 1, 1)
-        self.labelTlmSlot31 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot31.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot31.setSizePolicy(sizePolicy)
-        self.labelTlmSlot31.setObjectName("labelTlmSlot31")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot31, 0, 6, 1, 1)
-        self.labelTlmSlot32 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot32.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot32.setSizePolicy(sizePolicy)
-        self.labelTlmSlot32.setObjectName("labelTlmSlot32")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot32, 1, 6, 1, 1)
-        self.labelTlmSlot33 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot33.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot33.setSizePolicy(sizePolicy)
-        self.labelTlmSlot33.setObjectName("labelTlmSlot33")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot33, 2, 6, 1, 1)
-        self.labelTlmSlot34 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot34.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot34.setSizePolicy(sizePolicy)
-        self.labelTlmSlot34.setObjectName("labelTlmSlot34")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot34, 3, 6, 1, 1)
-        self.labelTlmSlot36 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot36.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot36.setSizePolicy(sizePolicy)
-        self.labelTlmSlot36.setObjectName("labelTlmSlot36")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot36, 5, 6, 1, 1)
-        self.labelTlmSlot37 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot37.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot37.setSizePolicy(sizePolicy)
-        self.labelTlmSlot37.setObjectName("labelTlmSlot37")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot37, 6, 6, 1, 1)
-        self.labelTlmSlot38 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot38.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot38.setSizePolicy(sizePolicy)
-        self.labelTlmSlot38.setObjectName("labelTlmSlot38")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot38, 7, 6, 1, 1)
-        self.labelTlmSlot39 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot39.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot39.setSizePolicy(sizePolicy)
-        self.labelTlmSlot39.setObjectName("labelTlmSlot39")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot39, 8, 6, 1, 1)
-        self.labelTlmSlot40 = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot40.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot40.setSizePolicy(sizePolicy)
-        self.labelTlmSlot40.setObjectName("labelTlmSlot40")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot40, 9, 6, 1, 1)
-        self.labelTlmSlot31Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot31Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot31Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot31Value.setObjectName("labelTlmSlot31Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot31Value, 0, 7, 1, 1)
-        self.labelTlmSlot32Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot32Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot32Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot32Value.setObjectName("labelTlmSlot32Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot32Value, 1, 7, 1, 1)
-        self.labelTlmSlot33Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot33Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot33Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot33Value.setObjectName("labelTlmSlot33Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot33Value, 2, 7, 1, 1)
-        self.labelTlmSlot34Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot34Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot34Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot34Value.setObjectName("labelTlmSlot34Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot34Value, 3, 7, 1, 1)
-        self.labelTlmSlot36Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot36Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot36Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot36Value.setObjectName("labelTlmSlot36Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot36Value, 5, 7, 1, 1)
-        self.labelTlmSlot37Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot37Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot37Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot37Value.setObjectName("labelTlmSlot37Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot37Value, 6, 7, 1, 1)
-        self.labelTlmSlot38Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot38Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot38Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot38Value.setObjectName("labelTlmSlot38Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot38Value, 7, 7, 1, 1)
-        self.labelTlmSlot39Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot39Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot39Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot39Value.setObjectName("labelTlmSlot39Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot39Value, 8, 7, 1, 1)
-        self.labelTlmSlot40Value = QtWidgets.QLabel(self.groupBoxTlm)
-        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(self.labelTlmSlot40Value.sizePolicy().hasHeightForWidth())
-        self.labelTlmSlot40Value.setSizePolicy(sizePolicy)
-        self.labelTlmSlot40Value.setObjectName("labelTlmSlot40Value")
-        self.gridLayoutTlmResponse.addWidget(self.labelTlmSlot40Value, 9, 7, 1, 1)
-        self.verticalLayout_5.addLayout(self.gridLayoutTlmResponse)
+        sizePolicy.setHeightForWidth(self.tableViewTlm.sizePolicy().hasHeightForWidth())
+        self.tableViewTlm.setSizePolicy(sizePolicy)
+        self.tableViewTlm.setAlternatingRowColors(True)
+        self.tableViewTlm.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tableViewTlm.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.tableViewTlm.setObjectName("tableViewTlm")
+        self.tableViewTlm.horizontalHeader().setStretchLastSection(True)
+        self.tableViewTlm.verticalHeader().setVisible(False)
+        self.verticalLayout_5.addWidget(self.tableViewTlm)
         self.boxLayoutAdHocReq = QtWidgets.QVBoxLayout()
         self.boxLayoutAdHocReq.setObjectName("boxLayoutAdHocReq")
         self.groupBoxAdHocReq = QtWidgets.QGroupBox(self.groupBoxTlm)
@@ -731,6 +99,45 @@ class Ui_MainWindow(object):
         self.verticalLayout_5.addLayout(self.boxLayoutAdHocReq)
         self.verticalLayout_4.addWidget(self.groupBoxTlm)
         self.tabWidget.addTab(self.tabTelemetry, "")
+        self.tabPlot = QtWidgets.QWidget()
+        self.tabPlot.setObjectName("tabPlot")
+        self.verticalLayoutPlot = QtWidgets.QVBoxLayout(self.tabPlot)
+        self.verticalLayoutPlot.setObjectName("verticalLayoutPlot")
+        self.groupBoxPlot = QtWidgets.QGroupBox(self.tabPlot)
+        self.groupBoxPlot.setObjectName("groupBoxPlot")
+        self.verticalLayoutPlotGroup = QtWidgets.QVBoxLayout(self.groupBoxPlot)
+        self.verticalLayoutPlotGroup.setObjectName("verticalLayoutPlotGroup")
+        self.horizontalLayoutPlotControls = QtWidgets.QHBoxLayout()
+        self.horizontalLayoutPlotControls.setObjectName("horizontalLayoutPlotControls")
+        self.labelPlotChannel = QtWidgets.QLabel(self.groupBoxPlot)
+        self.labelPlotChannel.setObjectName("labelPlotChannel")
+        self.horizontalLayoutPlotControls.addWidget(self.labelPlotChannel)
+        self.comboBoxPlotChannel = QtWidgets.QComboBox(self.groupBoxPlot)
+        self.comboBoxPlotChannel.setMinimumSize(QtCore.QSize(120, 0))
+        self.comboBoxPlotChannel.setObjectName("comboBoxPlotChannel")
+        self.horizontalLayoutPlotControls.addWidget(self.comboBoxPlotChannel)
+        self.labelPlotTimeSpan = QtWidgets.QLabel(self.groupBoxPlot)
+        self.labelPlotTimeSpan.setObjectName("labelPlotTimeSpan")
+        self.horizontalLayoutPlotControls.addWidget(self.labelPlotTimeSpan)
+        self.spinBoxPlotTimeSpan = QtWidgets.QSpinBox(self.groupBoxPlot)
+        self.spinBoxPlotTimeSpan.setMinimum(1)
+        self.spinBoxPlotTimeSpan.setMaximum(3600)
+        self.spinBoxPlotTimeSpan.setProperty("value", 60)
+        self.spinBoxPlotTimeSpan.setObjectName("spinBoxPlotTimeSpan")
+        self.horizontalLayoutPlotControls.addWidget(self.spinBoxPlotTimeSpan)
+        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutPlotControls.addItem(spacerItem1)
+        self.verticalLayoutPlotGroup.addLayout(self.horizontalLayoutPlotControls)
+        self.widgetTlmPlot = TelemetryPlotWidget(self.groupBoxPlot)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.widgetTlmPlot.sizePolicy().hasHeightForWidth())
+        self.widgetTlmPlot.setSizePolicy(sizePolicy)
+        self.widgetTlmPlot.setObjectName("widgetTlmPlot")
+        self.verticalLayoutPlotGroup.addWidget(self.widgetTlmPlot)
+        self.verticalLayoutPlot.addWidget(self.groupBoxPlot)
+        self.tabWidget.addTab(self.tabPlot, "")
         self.tabTelecommanding = QtWidgets.QWidget()
         self.tabTelecommanding.setObjectName("tabTelecommanding")
         self.verticalLayout = QtWidgets.QVBoxLayout(self.tabTelecommanding)
@@ -883,8 +290,8 @@ class Ui_MainWindow(object):
         self.pushButtonAbortUploadFile = QtWidgets.QPushButton(self.groupBoxToUpload)
         self.pushButtonAbortUploadFile.setObjectName("pushButtonAbortUploadFile")
         self.horizontalLayout.addWidget(self.pushButtonAbortUploadFile)
-        spacerItem1 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayout.addItem(spacerItem1)
+        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout.addItem(spacerItem2)
         self.verticalLayoutToUpload.addLayout(self.horizontalLayout)
         self.progressBarUpload = QtWidgets.QProgressBar(self.groupBoxToUpload)
         self.progressBarUpload.setProperty("value", 24)
@@ -931,8 +338,8 @@ class Ui_MainWindow(object):
         self.pushButtonRequestDownload = QtWidgets.QPushButton(self.groupBoxToDownload)
         self.pushButtonRequestDownload.setObjectName("pushButtonRequestDownload")
         self.horizontalLayoutRequestDownload.addWidget(self.pushButtonRequestDownload)
-        spacerItem2 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutRequestDownload.addItem(spacerItem2)
+        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutRequestDownload.addItem(spacerItem3)
         self.verticalLayout_8.addLayout(self.horizontalLayoutRequestDownload)
         self.progressBarDownload = QtWidgets.QProgressBar(self.groupBoxToDownload)
         self.progressBarDownload.setProperty("value", 24)
@@ -970,16 +377,16 @@ class Ui_MainWindow(object):
         self.comboBoxCommsBaudValue.addItem("")
         self.comboBoxCommsBaudValue.addItem("")
         self.horizontalLayoutConfig.addWidget(self.comboBoxCommsBaudValue)
-        spacerItem3 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutConfig.addItem(spacerItem3)
+        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutConfig.addItem(spacerItem4)
         self.labelTcTlmRate = QtWidgets.QLabel(self.groupBoxConfig)
         self.labelTcTlmRate.setObjectName("labelTcTlmRate")
         self.horizontalLayoutConfig.addWidget(self.labelTcTlmRate)
         self.inputTcTlmRateValue = QtWidgets.QLineEdit(self.groupBoxConfig)
         self.inputTcTlmRateValue.setObjectName("inputTcTlmRateValue")
         self.horizontalLayoutConfig.addWidget(self.inputTcTlmRateValue)
-        spacerItem4 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutConfig.addItem(spacerItem4)
+        spacerItem5 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutConfig.addItem(spacerItem5)
         self.labelTcTlmTimeout = QtWidgets.QLabel(self.groupBoxConfig)
         self.labelTcTlmTimeout.setObjectName("labelTcTlmTimeout")
         self.horizontalLayoutConfig.addWidget(self.labelTcTlmTimeout)
@@ -987,8 +394,8 @@ class Ui_MainWindow(object):
         self.inputTcTlmTimeoutValue.setObjectName("inputTcTlmTimeoutValue")
         self.horizontalLayoutConfig.addWidget(self.inputTcTlmTimeoutValue)
         self.formLayoutConfig.setLayout(0, QtWidgets.QFormLayout.FieldRole, self.horizontalLayoutConfig)
-        spacerItem5 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.formLayoutConfig.setItem(1, QtWidgets.QFormLayout.SpanningRole, spacerItem5)
+        spacerItem6 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.formLayoutConfig.setItem(1, QtWidgets.QFormLayout.SpanningRole, spacerItem6)
         self.labelComPort = QtWidgets.QLabel(self.groupBoxConfig)
         self.labelComPort.setObjectName("labelComPort")
         self.formLayoutConfig.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.labelComPort)
@@ -1017,11 +424,11 @@ class Ui_MainWindow(object):
         self.inputComPort.addItem("")
         self.inputComPort.addItem("")
         self.horizontalLayoutComPort.addWidget(self.inputComPort)
-        spacerItem6 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutComPort.addItem(spacerItem6)
+        spacerItem7 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutComPort.addItem(spacerItem7)
         self.formLayoutConfig.setLayout(2, QtWidgets.QFormLayout.FieldRole, self.horizontalLayoutComPort)
-        spacerItem7 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.formLayoutConfig.setItem(3, QtWidgets.QFormLayout.SpanningRole, spacerItem7)
+        spacerItem8 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.formLayoutConfig.setItem(3, QtWidgets.QFormLayout.SpanningRole, spacerItem8)
         self.labelConfigFile = QtWidgets.QLabel(self.groupBoxConfig)
         self.labelConfigFile.setObjectName("labelConfigFile")
         self.formLayoutConfig.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.labelConfigFile)
@@ -1034,8 +441,8 @@ class Ui_MainWindow(object):
         self.pushButtonOpenConfigFilePath.setObjectName("pushButtonOpenConfigFilePath")
         self.horizontalLayoutConfigFile.addWidget(self.pushButtonOpenConfigFilePath)
         self.formLayoutConfig.setLayout(4, QtWidgets.QFormLayout.FieldRole, self.horizontalLayoutConfigFile)
-        spacerItem8 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.formLayoutConfig.setItem(5, QtWidgets.QFormLayout.SpanningRole, spacerItem8)
+        spacerItem9 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.formLayoutConfig.setItem(5, QtWidgets.QFormLayout.SpanningRole, spacerItem9)
         self.labelComms = QtWidgets.QLabel(self.groupBoxConfig)
         self.labelComms.setObjectName("labelComms")
         self.formLayoutConfig.setWidget(6, QtWidgets.QFormLayout.LabelRole, self.labelComms)
@@ -1075,11 +482,11 @@ class Ui_MainWindow(object):
         self.inputDelimiter = QtWidgets.QLineEdit(self.groupBoxTest)
         self.inputDelimiter.setObjectName("inputDelimiter")
         self.horizontalLayoutDelimiter.addWidget(self.inputDelimiter)
-        spacerItem9 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutDelimiter.addItem(spacerItem9)
+        spacerItem10 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutDelimiter.addItem(spacerItem10)
         self.formLayoutTest.setLayout(0, QtWidgets.QFormLayout.FieldRole, self.horizontalLayoutDelimiter)
-        spacerItem10 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.formLayoutTest.setItem(1, QtWidgets.QFormLayout.SpanningRole, spacerItem10)
+        spacerItem11 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.formLayoutTest.setItem(1, QtWidgets.QFormLayout.SpanningRole, spacerItem11)
         self.labelReservedBytes = QtWidgets.QLabel(self.groupBoxTest)
         self.labelReservedBytes.setObjectName("labelReservedBytes")
         self.formLayoutTest.setWidget(2, QtWidgets.QFormLayout.LabelRole, self.labelReservedBytes)
@@ -1088,21 +495,21 @@ class Ui_MainWindow(object):
         self.inputReservedBytes1 = QtWidgets.QLineEdit(self.groupBoxTest)
         self.inputReservedBytes1.setObjectName("inputReservedBytes1")
         self.horizontalLayoutReservedBytes.addWidget(self.inputReservedBytes1)
-        spacerItem11 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutReservedBytes.addItem(spacerItem11)
+        spacerItem12 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutReservedBytes.addItem(spacerItem12)
         self.inputReservedBytes2 = QtWidgets.QLineEdit(self.groupBoxTest)
         self.inputReservedBytes2.setObjectName("inputReservedBytes2")
         self.horizontalLayoutReservedBytes.addWidget(self.inputReservedBytes2)
-        spacerItem12 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutReservedBytes.addItem(spacerItem12)
+        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutReservedBytes.addItem(spacerItem13)
         self.inputReservedBytes3 = QtWidgets.QLineEdit(self.groupBoxTest)
         self.inputReservedBytes3.setObjectName("inputReservedBytes3")
         self.horizontalLayoutReservedBytes.addWidget(self.inputReservedBytes3)
-        spacerItem13 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutReservedBytes.addItem(spacerItem13)
+        spacerItem14 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutReservedBytes.addItem(spacerItem14)
         self.formLayoutTest.setLayout(2, QtWidgets.QFormLayout.FieldRole, self.horizontalLayoutReservedBytes)
-        spacerItem14 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.formLayoutTest.setItem(3, QtWidgets.QFormLayout.SpanningRole, spacerItem14)
+        spacerItem15 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.formLayoutTest.setItem(3, QtWidgets.QFormLayout.SpanningRole, spacerItem15)
         self.labelDataType = QtWidgets.QLabel(self.groupBoxTest)
         self.labelDataType.setObjectName("labelDataType")
         self.formLayoutTest.setWidget(4, QtWidgets.QFormLayout.LabelRole, self.labelDataType)
@@ -1111,11 +518,11 @@ class Ui_MainWindow(object):
         self.inputDataType = QtWidgets.QLineEdit(self.groupBoxTest)
         self.inputDataType.setObjectName("inputDataType")
         self.horizontalLayoutDataType.addWidget(self.inputDataType)
-        spacerItem15 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutDataType.addItem(spacerItem15)
+        spacerItem16 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutDataType.addItem(spacerItem16)
         self.formLayoutTest.setLayout(4, QtWidgets.QFormLayout.FieldRole, self.horizontalLayoutDataType)
-        spacerItem16 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.formLayoutTest.setItem(5, QtWidgets.QFormLayout.SpanningRole, spacerItem16)
+        spacerItem17 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.formLayoutTest.setItem(5, QtWidgets.QFormLayout.SpanningRole, spacerItem17)
         self.labelDataLength = QtWidgets.QLabel(self.groupBoxTest)
         self.labelDataLength.setObjectName("labelDataLength")
         self.formLayoutTest.setWidget(6, QtWidgets.QFormLayout.LabelRole, self.labelDataLength)
@@ -1124,14 +531,14 @@ class Ui_MainWindow(object):
         self.inputDataLength = QtWidgets.QLineEdit(self.groupBoxTest)
         self.inputDataLength.setObjectName("inputDataLength")
         self.horizontalLayoutDataLength.addWidget(self.inputDataLength)
-        spacerItem17 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
-        self.horizontalLayoutDataLength.addItem(spacerItem17)
+        spacerItem18 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayoutDataLength.addItem(spacerItem18)
         self.pushButtonTestTransmit = QtWidgets.QPushButton(self.groupBoxTest)
         self.pushButtonTestTransmit.setObjectName("pushButtonTestTransmit")
         self.horizontalLayoutDataLength.addWidget(self.pushButtonTestTransmit)
         self.formLayoutTest.setLayout(6, QtWidgets.QFormLayout.FieldRole, self.horizontalLayoutDataLength)
-        spacerItem18 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.formLayoutTest.setItem(7, QtWidgets.QFormLayout.SpanningRole, spacerItem18)
+        spacerItem19 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.formLayoutTest.setItem(7, QtWidgets.QFormLayout.SpanningRole, spacerItem19)
         self.labelDataField = QtWidgets.QLabel(self.groupBoxTest)
         self.labelDataField.setObjectName("labelDataField")
         self.formLayoutTest.setWidget(8, QtWidgets.QFormLayout.LabelRole, self.labelDataField)
@@ -1141,8 +548,8 @@ class Ui_MainWindow(object):
         self.inputDataField.setObjectName("inputDataField")
         self.horizontalLayoutDataField.addWidget(self.inputDataField)
         self.formLayoutTest.setLayout(8, QtWidgets.QFormLayout.FieldRole, self.horizontalLayoutDataField)
-        spacerItem19 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
-        self.formLayoutTest.setItem(9, QtWidgets.QFormLayout.SpanningRole, spacerItem19)
+        spacerItem20 = QtWidgets.QSpacerItem(20, 13, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.formLayoutTest.setItem(9, QtWidgets.QFormLayout.SpanningRole, spacerItem20)
         self.labelResponse = QtWidgets.QLabel(self.groupBoxTest)
         self.labelResponse.setObjectName("labelResponse")
         self.formLayoutTest.setWidget(10, QtWidgets.QFormLayout.LabelRole, self.labelResponse)
@@ -1179,92 +586,14 @@ class Ui_MainWindow(object):
         self.comboBoxComms.currentIndexChanged['int'].connect(MainWindow.on_comms_change) # type: ignore
         self.pushButtonSendPcTime.clicked.connect(MainWindow.on_click_send_pc_time) # type: ignore
         self.pushButtonSendThisTime.clicked.connect(MainWindow.on_click_send_this_time) # type: ignore
+        self.comboBoxPlotChannel.currentIndexChanged['int'].connect(MainWindow.on_plot_channel_change) # type: ignore
+        self.spinBoxPlotTimeSpan.valueChanged['int'].connect(MainWindow.on_plot_time_span_change) # type: ignore
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
 
     def retranslateUi(self, MainWindow):
         _translate = QtCore.QCoreApplication.translate
         MainWindow.setWindowTitle(_translate("MainWindow", "OSSAT Mercury Ground Segment"))
         self.groupBoxTlm.setTitle(_translate("MainWindow", "Telemetry"))
-        self.labelTlmSlot2Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot4Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot5.setText(_translate("MainWindow", "TLM CH 5"))
-        self.labelTlmSlot2.setText(_translate("MainWindow", "TLM CH 2"))
-        self.labelTlmSlot6Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot9Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot4.setText(_translate("MainWindow", "TLM CH 4"))
-        self.labelTlmSlot8.setText(_translate("MainWindow", "TLM CH 8"))
-        self.labelTlmSlot9.setText(_translate("MainWindow", "TLM CH 9"))
-        self.labelTlmSlot1.setText(_translate("MainWindow", "TLM CH 1"))
-        self.labelTlmSlot5Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot3.setText(_translate("MainWindow", "TLM CH 3"))
-        self.labelTlmSlot6.setText(_translate("MainWindow", "TLM CH 6"))
-        self.labelTlmSlot7.setText(_translate("MainWindow", "TLM CH 7"))
-        self.labelTlmSlot7Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot8Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot1Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot3Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot28Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot35.setText(_translate("MainWindow", "TLM CH 35"))
-        self.labelTlmSlot30Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot29Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot21.setText(_translate("MainWindow", "TLM CH 21"))
-        self.labelTlmSlot22.setText(_translate("MainWindow", "TLM CH 22"))
-        self.labelTlmSlot24.setText(_translate("MainWindow", "TLM CH 24"))
-        self.labelTlmSlot23.setText(_translate("MainWindow", "TLM CH 23"))
-        self.labelTlmSlot28.setText(_translate("MainWindow", "TLM CH 28"))
-        self.labelTlmSlot27.setText(_translate("MainWindow", "TLM CH 27"))
-        self.labelTlmSlot26.setText(_translate("MainWindow", "TLM CH 26"))
-        self.labelTlmSlot29.setText(_translate("MainWindow", "TLM CH 29"))
-        self.labelTlmSlot25.setText(_translate("MainWindow", "TLM CH 25"))
-        self.labelTlmSlot11.setText(_translate("MainWindow", "TLM CH 11"))
-        self.labelTlmSlot11Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot12.setText(_translate("MainWindow", "TLM CH 12"))
-        self.labelTlmSlot30.setText(_translate("MainWindow", "TLM CH 30"))
-        self.labelTlmSlot16.setText(_translate("MainWindow", "TLM CH 16"))
-        self.labelTlmSlot17.setText(_translate("MainWindow", "TLM CH 17"))
-        self.labelTlmSlot14.setText(_translate("MainWindow", "TLM CH 14"))
-        self.labelTlmSlot15.setText(_translate("MainWindow", "TLM CH 15"))
-        self.labelTlmSlot13.setText(_translate("MainWindow", "TLM CH 13"))
-        self.labelTlmSlot18.setText(_translate("MainWindow", "TLM CH 18"))
-        self.labelTlmSlot10.setText(_translate("MainWindow", "TLM CH 10"))
-        self.labelTlmSlot20.setText(_translate("MainWindow", "TLM CH 20"))
-        self.labelTlmSlot10Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot20Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot19.setText(_translate("MainWindow", "TLM CH 19"))
-        self.labelTlmSlot16Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot14Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot15Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot12Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot13Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot22Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot21Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot17Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot19Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot18Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot23Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot27Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot26Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot25Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot24Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot35Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot31.setText(_translate("MainWindow", "TLM CH 31"))
-        self.labelTlmSlot32.setText(_translate("MainWindow", "TLM CH 32"))
-        self.labelTlmSlot33.setText(_translate("MainWindow", "TLM CH 33"))
-        self.labelTlmSlot34.setText(_translate("MainWindow", "TLM CH 34"))
-        self.labelTlmSlot36.setText(_translate("MainWindow", "TLM CH 36"))
-        self.labelTlmSlot37.setText(_translate("MainWindow", "TLM CH 37"))
-        self.labelTlmSlot38.setText(_translate("MainWindow", "TLM CH 38"))
-        self.labelTlmSlot39.setText(_translate("MainWindow", "TLM CH 39"))
-        self.labelTlmSlot40.setText(_translate("MainWindow", "TLM CH 40"))
-        self.labelTlmSlot31Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot32Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot33Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot34Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot36Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot37Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot38Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot39Value.setText(_translate("MainWindow", "N/A"))
-        self.labelTlmSlot40Value.setText(_translate("MainWindow", "N/A"))
         self.groupBoxAdHocReq.setTitle(_translate("MainWindow", "Ad-hoc Request"))
         self.groupBoxTlmErr.setTitle(_translate("MainWindow", "Last Failure"))
         self.labelTlmErrChannel.setText(_translate("MainWindow", "Channel #"))
@@ -1277,6 +606,10 @@ class Ui_MainWindow(object):
         self.labelTlmTimeoutsValue.setText(_translate("MainWindow", "0"))
         self.checkBoxTlmReqContinuous.setText(_translate("MainWindow", "Continuous?"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabTelemetry), _translate("MainWindow", "TELEMETRY"))
+        self.groupBoxPlot.setTitle(_translate("MainWindow", "Telemetry Plot"))
+        self.labelPlotChannel.setText(_translate("MainWindow", "TLM Channel:"))
+        self.labelPlotTimeSpan.setText(_translate("MainWindow", "Time Span (s):"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabPlot), _translate("MainWindow", "PLOT"))
         self.groupBoxTelecommanding.setTitle(_translate("MainWindow", "Telecommanding"))
         self.labelTcNumber.setText(_translate("MainWindow", "TC #"))
         self.pushButtonSendTcReq.setText(_translate("MainWindow", "Send TC REQ"))
@@ -1368,4 +701,5 @@ class Ui_MainWindow(object):
         self.inputDataField.setText(_translate("MainWindow", "0x01 0x02 0x03"))
         self.labelResponse.setText(_translate("MainWindow", "Response"))
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tabTest), _translate("MainWindow", "TEST"))
+from telemetry_view import TelemetryPlotWidget
 import gui_assets.mercury_resources_rc
@@ -22,7 +22,9 @@
 """
 
 #import Queue
+import os
 import queue
+import selectors
 import threading
 import time
 
@@ -57,6 +59,16 @@ class ComMonitorThread(threading.Thread):
             value is low, the thread will return data in finer
             grained chunks, with more accurate timestamps, but
             it will also consume more CPU.
+
+        event_driven:
+            Instead of polling with port_timeout, sleep until the
+            port's file descriptor is readable and then read
+            everything available in one call. Uses no CPU while
+            the port is idle, and each chunk is timestamped with
+            time.monotonic() as soon as it is read. Use
+            byte_timestamps() to estimate when each byte of a chunk
+            arrived. Falls back to polling on platforms where the
+            port has no file descriptor (Windows).
     """
     def __init__(   self, 
                     data_q, error_q, 
@@ -64,7 +76,8 @@ class ComMonitorThread(threading.Thread):
                     port_baud,
                     port_stopbits=serial.STOPBITS_ONE,
                     port_parity=serial.PARITY_NONE,
-                    port_timeout=0.01):
+                    port_timeout=0.01,
+                    event_driven=False):
         threading.Thread.__init__(self)
         
         self.serial_port = None
@@ -76,7 +89,18 @@ class ComMonitorThread(threading.Thread):
 
         self.data_q = data_q
         self.error_q = error_q
-        
+
+        self.event_driven = event_driven
+        # Seconds on the wire per byte: start bit, 8 data bits,
+        # parity bit and stop bits
+        parity_bits = 0 if port_parity == serial.PARITY_NONE else 1
+        self.byte_time = (1 + serial.EIGHTBITS + parity_bits + port_stopbits) / port_baud
+        # Pipe used by join() to wake the event driven loop, only
+        # written or closed with wake_lock held so join() never
+        # writes to a closed (and possibly reused) descriptor
+        self.wake_pipe = None
+        self.wake_lock = threading.Lock()
+
         self.alive = threading.Event()
         self.alive.set()
         
@@ -87,8 +111,12 @@ class ComMonitorThread(threading.Thread):
                 self.serial_port.close()
             self.serial_port = serial.Serial(**self.serial_arg)
         #except serial.SerialException, e:
-        except (serial.SerialException, e):
-            self.error_q.put(e.message)
+        except serial.SerialException as e:
+            self.error_q.put(str(e))
+            return
+
+        if self.event_driven and self.event_loop():
+            self.serial_port.close()
             return
         
         # Restart the clock
@@ -112,7 +140,61 @@ class ComMonitorThread(threading.Thread):
         if self.serial_port:
             self.serial_port.close()
 
+    def event_loop(self):
+        """ Sleep on the port's file descriptor (and the wake pipe)
+            until data arrives, then read all of it at once.
+            Returns False without reading if the port has no file
+            descriptor, so the caller can poll instead.
+        """
+        try:
+            port_fd = self.serial_port.fileno()
+        except (AttributeError, ValueError, OSError):
+            return False
+
+        selector = selectors.DefaultSelector()
+        with self.wake_lock:
+            self.wake_pipe = os.pipe()
+        selector.register(port_fd, selectors.EVENT_READ)
+        selector.register(self.wake_pipe[0], selectors.EVENT_READ)
+        try:
+            while self.alive.isSet():
+                events = selector.select()
+                if not self.alive.isSet():
+                    break
+                if not any(key.fd == port_fd for key, _ in events):
+                    continue
+                try:
+                    # At least one byte is waiting, so this read
+                    # returns without waiting for port_timeout
+                    data = self.serial_port.read(max(1, self.serial_port.in_waiting))
+                except serial.SerialException as e:
+                    self.error_q.put(str(e))
+                    break
+                if len(data) > 0:
+                    timestamp = time.monotonic()
+                    self.data_q.put((data, timestamp))
+        finally:
+            selector.close()
+            with self.wake_lock:
+                os.close(self.wake_pipe[0])
+                os.close(self.wake_pipe[1])
+                self.wake_pipe = None
+        return True
+
+    def byte_timestamps(self, data, timestamp):
+        """ Estimate the arrival time of each byte of a chunk
+            from the chunk's timestamp, assuming the bytes
+            arrived back to back at the baud rate and the last
+            one arrived just before the chunk was read.
+        """
+        count = len(data)
+        return [timestamp - (count - 1 - index) * self.byte_time
+                for index in range(count)]
+
     def join(self, timeout=None):
         self.alive.clear()
+        with self.wake_lock:
+            if self.wake_pipe is not None:
+                os.write(self.wake_pipe[1], b"\0")
         threading.Thread.join(self, timeout)
 
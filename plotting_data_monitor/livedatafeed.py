@@ -22,35 +22,118 @@
 """
 
 class LiveDataFeed(object):
-    """ A simple "live data feed" abstraction that allows a reader 
-        to read the most recent data and find out whether it was 
-        updated since the last read. 
-        
+    """ A "live data feed" abstraction with one writer and any
+        number of readers. Items are kept in a bounded ring and
+        numbered by a version that only ever increases, each
+        reader keeps its own cursor so reading does not affect
+        the other readers.
+
         Interface to data writer:
-        
+
         add_data(data):
-            Add new data to the feed.
-        
-        Interface to reader:
-        
+            Add new data to the feed. Only one thread may write.
+
+        Interface to readers:
+
+        reader():
+            Returns a LiveDataReader with its own cursor, starting
+            at the current version. Readers read without a lock,
+            and detect items overwritten while they read.
+
         read_data():
-            Returns the most recent data.
-            
+            Returns the most recent data (single reader interface,
+            uses the feed's own reader).
+
         has_new_data:
-            A boolean attribute telling the reader whether the
-            data was updated since the last read.    
+            A boolean attribute telling the single reader whether
+            the data was updated since its last read.
     """
-    def __init__(self):
-        self.cur_data = None
-        self.has_new_data = False
-    
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.ring = [None] * capacity
+        # Number of items ever added, item n is in ring[n % capacity]
+        self.version = 0
+        self.default_reader = LiveDataReader(self)
+
     def add_data(self, data):
-        self.cur_data = data
-        self.has_new_data = True
-    
+        self.ring[self.version % self.capacity] = data
+        # Publish only once the item is in the ring
+        self.version += 1
+
+    def reader(self):
+        return LiveDataReader(self)
+
     def read_data(self):
-        self.has_new_data = False
-        return self.cur_data
+        return self.default_reader.read_latest()
+
+    @property
+    def has_new_data(self):
+        return self.default_reader.has_new_data
+
+
+class LiveDataReader(object):
+    """ One reader's cursor into a LiveDataFeed.
+
+        read_batch(max_items=None):
+            Returns (items, missed), every item added since the
+            last read (oldest first, up to max_items) and how many
+            were overwritten before they could be read. The items
+            are the objects the writer added, not copies.
+
+        read_latest():
+            Returns the most recent data, skipping anything older.
+
+        has_new_data:
+            True if items were added since the last read.
+
+        missed:
+            Total items this reader has missed.
+    """
+    def __init__(self, feed):
+        self.feed = feed
+        self.cursor = feed.version
+        self.missed = 0
+
+    @property
+    def has_new_data(self):
+        return self.feed.version != self.cursor
+
+    def read_batch(self, max_items=None):
+        feed = self.feed
+        capacity = feed.capacity
+        version = feed.version
+        start = self.cursor
+        # Items older than one ring behind have been overwritten
+        missed = max(0, version - capacity - start)
+        start += missed
+        end = version if max_items is None else min(version, start + max_items)
+
+        first = start % capacity
+        count = end - start
+        if first + count <= capacity:
+            items = feed.ring[first:first + count]
+        else:
+            items = feed.ring[first:] + feed.ring[:first + count - capacity]
+
+        # Anything the writer overwrote while the ring was being
+        # sliced is stale, drop it and count it as missed. The
+        # writer stores item version before publishing it, so the
+        # slot of item version - capacity may already be replaced
+        overwritten = min(count, feed.version + 1 - capacity - start)
+        if overwritten > 0:
+            items = items[overwritten:]
+            missed += overwritten
+
+        self.cursor = end
+        self.missed += missed
+        return items, missed
+
+    def read_latest(self):
+        version = self.feed.version
+        self.cursor = version
+        if version == 0:
+            return None
+        return self.feed.ring[(version - 1) % self.feed.capacity]
 
 
 if __name__ == "__main__":
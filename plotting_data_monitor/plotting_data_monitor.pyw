@@ -51,7 +51,7 @@ from com_monitor import ComMonitorThread
 #from eblib.serialutils import full_port_name, enumerate_serial_ports
 from serialutils import full_port_name, enumerate_serial_ports
 #from eblib.utils import get_all_from_queue, get_item_from_queue
-from utils import get_all_from_queue, get_item_from_queue
+from utils import get_batch_from_queue, get_item_from_queue
 from livedatafeed import LiveDataFeed
 
 class PlottingDataMonitor(QMainWindow):
@@ -364,7 +364,7 @@ class PlottingDataMonitor(QMainWindow):
             from the serial port.
         """
 
-        qdata = list(get_all_from_queue(self.data_q))
+        qdata = get_batch_from_queue(self.data_q, timeout=0)
         if len(qdata) > 0:
             data = dict(timestamp=qdata[-1][1], 
                         temperature=ord(qdata[-1][0]))
@@ -41,14 +41,43 @@ class Timer(object):
 def get_all_from_queue(Q):
     """ Generator to yield one after the others all items 
         currently in the queue Q, without any waiting.
+        The items are removed with a single lock acquisition.
     """
-    try:
-        while True:
-            yield Q.get_nowait( )
-    #except Queue.Empty:
-    except:
-        #raise StopIteration
-        return None
+    for item in get_batch_from_queue(Q, timeout=0):
+        yield item
+
+
+def get_batch_from_queue(Q, max_items=None, timeout=0.01):
+    """ Blocks until the queue Q holds at least one item or
+        'timeout' seconds pass (None waits forever, 0 does not
+        wait), then removes and returns up to max_items items
+        (all of them if None) with a single lock acquisition.
+
+        Returns an empty list on timeout. Use this instead of
+        repeated get calls when items arrive quickly, it costs
+        one wakeup and one lock per batch rather than per item.
+
+        Copy of low_level/batchqueue.queue_get_batch (plus
+        max_items=None for everything), keep the two in step.
+        plotting_data_monitor is a standalone script run from
+        its own directory with flat imports, so it can't import
+        the low_level package.
+    """
+    with Q.not_empty:
+        if timeout is None:
+            while not Q._qsize():
+                Q.not_empty.wait()
+        else:
+            deadline = time.monotonic() + timeout
+            while not Q._qsize():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return []
+                Q.not_empty.wait(remaining)
+        count = Q._qsize() if max_items is None else min(max_items, Q._qsize())
+        items = [Q._get() for _ in range(count)]
+        Q.not_full.notify(len(items))
+        return items
 
 
 def get_item_from_queue(Q, timeout=0.01):
@@ -0,0 +1,152 @@
+"""
+/***********************************************************************************
+ *  @fault_injection.py
+ ***********************************************************************************
+ *   _  _____ ____  ____  _____
+ *  | |/ /_ _/ ___||  _ \| ____|
+ *  | ' / | |\___ \| |_) |  _|
+ *  | . \ | | ___) |  __/| |___
+ *  |_|\_\___|____/|_|   |_____|
+ *
+ ***********************************************************************************
+ *  Copyright (c) 2021 KISPE Space Systems Ltd.
+ *
+ *  https://www.kispe.co.uk/projectlicenses/RA2001001003
+ ***********************************************************************************
+ *  Created on: 18-10-2026
+ *  Seeded fault injection on the space station simulator link
+ ***********************************************************************************/
+"""
+
+# Corrupts the byte stream sent to the ground station like a noisy radio link.
+# Frame faults are rates per frame, byte faults are rates per byte. The same seed
+# and the same stream of writes always produce the same faults.
+
+import re
+
+import numpy as np
+
+from low_level.frameformat import PROTOCOL_DELIMITER, MAX_DATA_TYPES
+
+# Offset of the data type byte from the start of frame delimiter
+DATA_TYPE_OFFSET = 4
+# A start of frame is the last delimiter of an odd length run, stuffed delimiters come in pairs
+DELIMITER_RUN = re.compile(bytes([PROTOCOL_DELIMITER]) + b"+")
+
+FRAME_FAULTS = ("truncate", "bogus_type", "junk_burst")
+BYTE_FAULTS = ("bit_flip", "drop", "duplicate_delimiter")
+
+
+class FaultInjector:
+    """ Applies seeded faults to each chunk written to the ground station.
+
+        truncate:            rate per frame of cutting the frame short at a random point
+        bogus_type:          rate per frame of replacing its data type with one >= MAX_DATA_TYPES
+        junk_burst:          rate per frame of inserting 1 to junk_burst_length random bytes before it
+        bit_flip:            rate per byte of flipping one random bit
+        drop:                rate per byte of dropping it
+        duplicate_delimiter: rate per \\x55 byte of sending it twice
+    """
+
+    def __init__(self, seed=0, junk_burst_length=32, **rates):
+        unknown = set(rates) - set(FRAME_FAULTS) - set(BYTE_FAULTS)
+        if unknown:
+            raise ValueError("Unknown faults: " + ", ".join(sorted(unknown)))
+        self.rates = {fault: float(rates.get(fault, 0.0)) for fault in FRAME_FAULTS + BYTE_FAULTS}
+        self.junk_burst_length = junk_burst_length
+        self.rng = np.random.default_rng(seed)
+        self.counts = {fault: 0 for fault in FRAME_FAULTS + BYTE_FAULTS}
+        self.frames = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def frame_starts(self, data):
+        """ Return the positions of every start of frame delimiter in a chunk. """
+        return [match.end() - 1 for match in DELIMITER_RUN.finditer(data) if (match.end() - match.start()) % 2]
+
+    def inject(self, data):
+        """ Return the chunk with faults applied. """
+        self.bytes_in += len(data)
+        if not data:
+            return data
+        if any(self.rates[fault] for fault in FRAME_FAULTS):
+            data = self.inject_frame_faults(bytes(data))
+        if any(self.rates[fault] for fault in BYTE_FAULTS):
+            data = self.inject_byte_faults(data)
+        self.bytes_out += len(data)
+        return data
+
+    def inject_frame_faults(self, data):
+        """ Truncate frames, replace their data types and insert junk before them. """
+        starts = self.frame_starts(data)
+        self.frames += len(starts)
+        if not starts:
+            return data
+        ends = starts[1:] + [len(data)]
+        draws = self.rng.random((len(starts), len(FRAME_FAULTS)))
+        faulty = np.flatnonzero((draws < [self.rates[fault] for fault in FRAME_FAULTS]).any(axis=1))
+        if faulty.size == 0:
+            return data
+
+        parts = [data[:starts[0]]]
+        previous = starts[0]
+        for index in faulty:
+            start = starts[index]
+            end = ends[index]
+            parts.append(data[previous:start])
+            frame = bytearray(data[start:end])
+            truncate, bogus_type, junk_burst = draws[index] < [self.rates[fault] for fault in FRAME_FAULTS]
+            if bogus_type and len(frame) > DATA_TYPE_OFFSET:
+                bogus = int(self.rng.integers(MAX_DATA_TYPES, 256))
+                # A bogus delimiter would be a new start of frame rather than a bad data type
+                frame[DATA_TYPE_OFFSET] = bogus if bogus != PROTOCOL_DELIMITER else 0xFF
+                self.counts["bogus_type"] += 1
+            if truncate and len(frame) > 1:
+                del frame[int(self.rng.integers(1, len(frame))):]
+                self.counts["truncate"] += 1
+            if junk_burst:
+                parts.append(self.rng.integers(0, 256, int(self.rng.integers(1, self.junk_burst_length + 1)),
+                                               dtype=np.uint8).tobytes())
+                self.counts["junk_burst"] += 1
+            parts.append(bytes(frame))
+            previous = end
+        parts.append(data[previous:])
+        return b"".join(parts)
+
+    def inject_byte_faults(self, data):
+        """ Flip bits, drop bytes and duplicate delimiters. """
+        stream = np.frombuffer(data, dtype=np.uint8).copy()
+        rate = self.rates["bit_flip"]
+        if rate:
+            flipped = np.flatnonzero(self.rng.random(stream.size) < rate)
+            stream[flipped] ^= (1 << self.rng.integers(0, 8, flipped.size)).astype(np.uint8)
+            self.counts["bit_flip"] += flipped.size
+        rate = self.rates["duplicate_delimiter"]
+        if rate:
+            delimiters = np.flatnonzero(stream == PROTOCOL_DELIMITER)
+            duplicated = delimiters[self.rng.random(delimiters.size) < rate]
+            if duplicated.size:
+                repeats = np.ones(stream.size, dtype=np.int64)
+                repeats[duplicated] = 2
+                stream = np.repeat(stream, repeats)
+                self.counts["duplicate_delimiter"] += duplicated.size
+        rate = self.rates["drop"]
+        if rate:
+            kept = self.rng.random(stream.size) >= rate
+            self.counts["drop"] += stream.size - int(kept.sum())
+            stream = stream[kept]
+        return stream.tobytes()
+
+    def summary(self):
+        """ Return a one line summary of the faults injected. """
+        return "{} frames, {} bytes in, {} bytes out, ".format(self.frames, self.bytes_in, self.bytes_out) + \
+            ", ".join("{} {}".format(fault, count) for fault, count in self.counts.items())
+
+
+def parse_faults(specification, seed=0):
+    """ Build a FaultInjector from "fault=rate,fault=rate,...", E.G. "bit_flip=1e-5,truncate=0.01". """
+    rates = {}
+    for item in specification.split(","):
+        fault, rate = item.split("=")
+        rates[fault.strip()] = float(rate)
+    return FaultInjector(seed, **rates)
@@ -0,0 +1,302 @@
+"""
+/***********************************************************************************
+ *  @sim_engine.py
+ ***********************************************************************************
+ *   _  _____ ____  ____  _____
+ *  | |/ /_ _/ ___||  _ \| ____|
+ *  | ' / | |\___ \| |_) |  _|
+ *  | . \ | | ___) |  __/| |___
+ *  |_|\_\___|____/|_|   |_____|
+ *
+ ***********************************************************************************
+ *  Copyright (c) 2021 KISPE Space Systems Ltd.
+ *
+ *  https://www.kispe.co.uk/projectlicenses/RA2001001003
+ ***********************************************************************************
+ *  Created on: 18-10-2026
+ *  High throughput space station simulator for load testing Mercury GS
+ ***********************************************************************************/
+"""
+
+# Run from the repository root with:
+#   python -m ss_simulator.sim_engine pty             (then open the printed /dev/pts/N as the GS COM port)
+#   python -m ss_simulator.sim_engine tcp --port 5555 (for GroundStationLink.open_connection)
+# Responds to the same telecommands and telemetry channels as ss_sim.py
+# Add synthetic telemetry streams with, E.G.:
+#   --stream 42:sine:10 --stream 43:replay=values.txt:100 --bulk 100:50
+# Corrupt everything sent to the ground station with, E.G.:
+#   --faults bit_flip=1e-5,drop=1e-5,truncate=0.001,bogus_type=0.001,junk_burst=0.001 --fault-seed 1
+
+import argparse
+import functools
+import os
+import pty
+import random
+import select
+import socket
+import socketserver
+import struct
+import time
+import tty
+
+from low_level.framedecoder import FrameDecoder
+from low_level.frameformat import DataType, TelecommandResponseState, TelemetryRejectionResponseState, \
+    telecommand_response_builder, telemetry_response_builder, telemetry_rejection_response_builder
+from low_level.packet import build_frame
+from ss_simulator.fault_injection import parse_faults
+from ss_simulator.telemetry_generator import TelemetryGenerator, parse_stream, bulk_streams
+
+# Largest chunk read from the transport at once
+READ_SIZE = 65536
+# Seconds between printing the exchange rate
+STATS_INTERVAL = 5
+
+
+@functools.lru_cache(maxsize=4096)
+def encode_frame(data_type, data):
+    """ Return the stuffed frame for a data field, responses repeat so they are only encoded once. """
+    return bytes(build_frame(data, data_type))
+
+
+def constant(value):
+    """ Telemetry source that always returns value. """
+    return lambda: value
+
+
+def random_byte():
+    """ Telemetry source returning a random value from 0 to 255. """
+    return random.randint(0, 255)
+
+
+def default_telemetry_sources():
+    """ Telemetry channels answered by ss_sim.py, channel number: function returning the value. """
+    sources = {1: constant(1), 2: constant(2), 3: constant(3), 12: constant(0xff), 85: constant(0x555500fe)}
+    for channel in range(20, 40):
+        sources[channel] = random_byte
+    return sources
+
+
+class SimulatorEngine:
+    """ Decodes request frames from the ground station in chunks and answers them by table lookup.
+    One engine per connection, as it holds that connection's partially received frame.
+    """
+
+    def __init__(self, telemetry_sources=None):
+        """ Initialise the decoder, the dispatch tables and the counters. """
+        self.decoder = FrameDecoder(self.decode_error)
+        # Data type: handler returning the response frame, or None for no response
+        self.handlers = {DataType.TELECOMMAND_REQUEST.value: self.telecommand_request,
+                         DataType.TELEMETRY_REQUEST.value: self.telemetry_request}
+        # Telecommand number: response status, every other command is not supported
+        self.telecommand_responses = {1: TelecommandResponseState.SUCCESS.value,
+                                      2: TelecommandResponseState.FAILED.value,
+                                      3: TelecommandResponseState.INVALID_LENGTH.value,
+                                      5: TelecommandResponseState.INVALID_COMMAND_ARGUMENT.value}
+        # Telemetry channel: function returning its value
+        self.telemetry_sources = default_telemetry_sources() if telemetry_sources is None else telemetry_sources
+        # Telemetry channel: rejection code, channels without a source are not supported
+        self.telemetry_rejections = {4: TelemetryRejectionResponseState.INVALID_DATA_LENGTH.value}
+        self.exchanges = 0
+
+    def decode_error(self, error):
+        """ Frame decode error callback, errors are counted by the decoder. """
+        print("Invalid frame:", error.value)
+
+    def feed(self, chunk):
+        """ Decode a received chunk, return the responses to every request completed by it. """
+        responses = []
+        for frame in self.decoder.feed(chunk):
+            handler = self.handlers.get(frame[4])
+            if handler is None:
+                print("Unsupported data type:", frame[4])
+                continue
+            response = handler(frame[9:])
+            if response is not None:
+                responses.append(response)
+        self.exchanges += len(responses)
+        return b"".join(responses)
+
+    def telecommand_request(self, data):
+        """ Respond with the telecommand's status from the table. """
+        telecommand_number = struct.unpack_from("!I", data)[0]
+        status = self.telecommand_responses.get(telecommand_number,
+                                                TelecommandResponseState.COMMAND_NOT_SUPPORTED.value)
+        return encode_frame(DataType.TELECOMMAND_RESPONSE.value,
+                            telecommand_response_builder.pack(telecommand_number, status))
+
+    def telemetry_request(self, data):
+        """ Respond with the channel's value, or reject the request. """
+        channel = struct.unpack_from("!I", data)[0]
+        rejection_code = self.telemetry_rejections.get(channel)
+        if rejection_code is None:
+            source = self.telemetry_sources.get(channel)
+            if source is not None:
+                return encode_frame(DataType.TELEMETRY_DATA.value, telemetry_response_builder.pack(channel, source()))
+            rejection_code = TelemetryRejectionResponseState.CHANNEL_NOT_SUPPORTED.value
+        return encode_frame(DataType.TELEMETRY_REQUEST_REJECTION.value,
+                            telemetry_rejection_response_builder.pack(channel, rejection_code))
+
+
+class ExchangeRate:
+    """ Prints the number of exchanges per second every STATS_INTERVAL seconds while requests arrive. """
+
+    def __init__(self):
+        self.last_time = time.monotonic()
+        self.last_exchanges = 0
+
+    def update(self, exchanges):
+        now = time.monotonic()
+        if now - self.last_time >= STATS_INTERVAL:
+            print("{:.0f} exchanges/s".format((exchanges - self.last_exchanges) / (now - self.last_time)))
+            self.last_time = now
+            self.last_exchanges = exchanges
+
+
+def write_all(fd, data):
+    """ Write all of data to a file descriptor, a pty may accept only part of a large write. """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def serve_pty(engine, link_path=None, generator_factory=None, injector_factory=None):
+    """ Create a pty pair and serve the ground station on its slave side, optionally symlinked at link_path.
+    Telemetry streams from generator_factory() are sent between responses, and everything sent passes through
+    the FaultInjector from injector_factory().
+    """
+    master, slave = pty.openpty()
+    # Raw mode, so no bytes are translated or echoed
+    tty.setraw(master)
+    tty.setraw(slave)
+    slave_name = os.ttyname(slave)
+    if link_path is not None:
+        if os.path.lexists(link_path):
+            os.remove(link_path)
+        os.symlink(slave_name, link_path)
+    print("Simulator listening on", link_path or slave_name, flush=True)
+    # The slave stays open here so reads don't fail while the ground station has the port closed
+    generator = None if generator_factory is None else generator_factory()
+    injector = None if injector_factory is None else injector_factory()
+    rate = ExchangeRate()
+    try:
+        while True:
+            timeout = None if generator is None else generator.time_to_next_batch()
+            readable, _, _ = select.select([master], [], [], timeout)
+            if readable:
+                response = engine.feed(os.read(master, READ_SIZE))
+                if response:
+                    write_all(master, response if injector is None else injector.inject(response))
+                rate.update(engine.exchanges)
+            if generator is not None and generator.time_to_next_batch() == 0:
+                frames = generator.batch()
+                if frames:
+                    write_all(master, frames if injector is None else injector.inject(frames))
+    finally:
+        if injector is not None:
+            print("Faults injected:", injector.summary())
+        if link_path is not None and os.path.islink(link_path):
+            os.remove(link_path)
+        os.close(master)
+        os.close(slave)
+
+
+class SimulatorRequestHandler(socketserver.BaseRequestHandler):
+    """ Serves one ground station TCP connection with its own engine and telemetry streams. """
+
+    def handle(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        engine = SimulatorEngine(self.server.telemetry_sources)
+        generator_factory = self.server.generator_factory
+        generator = None if generator_factory is None else generator_factory()
+        injector_factory = self.server.injector_factory
+        injector = None if injector_factory is None else injector_factory()
+        rate = ExchangeRate()
+        print("Ground station connected from", self.client_address)
+        while True:
+            timeout = None if generator is None else generator.time_to_next_batch()
+            readable, _, _ = select.select([self.request], [], [], timeout)
+            if readable:
+                chunk = self.request.recv(READ_SIZE)
+                if not chunk:
+                    break
+                response = engine.feed(chunk)
+                if response:
+                    self.request.sendall(response if injector is None else injector.inject(response))
+                rate.update(engine.exchanges)
+            if generator is not None and generator.time_to_next_batch() == 0:
+                frames = generator.batch()
+                if frames:
+                    self.request.sendall(frames if injector is None else injector.inject(frames))
+        print("Ground station disconnected,", engine.exchanges, "exchanges")
+        if injector is not None:
+            print("Faults injected:", injector.summary())
+
+
+class SimulatorServer(socketserver.ThreadingTCPServer):
+    """ TCP server with one Thread and engine per ground station connection. """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, address, telemetry_sources=None, generator_factory=None, injector_factory=None):
+        super().__init__(address, SimulatorRequestHandler)
+        self.telemetry_sources = telemetry_sources
+        self.generator_factory = generator_factory
+        self.injector_factory = injector_factory
+
+
+def serve_tcp(host, port, telemetry_sources=None, generator_factory=None, injector_factory=None):
+    """ Serve ground stations connecting to host:port, each connection gets its own generator_factory() streams
+    and injector_factory() faults.
+    """
+    with SimulatorServer((host, port), telemetry_sources, generator_factory, injector_factory) as server:
+        print("Simulator listening on", server.server_address, flush=True)
+        server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Space station simulator for load testing Mercury GS")
+    parser.add_argument("--stream", action="append", default=[],
+                        help="synthetic telemetry channel:waveform:rate, waveform is sine, ramp, walk or replay=FILE")
+    parser.add_argument("--bulk", help="COUNT:RATE synthetic channels from 1000 upwards")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the random walk streams")
+    parser.add_argument("--batch-interval", type=float, default=0.02, help="seconds between telemetry batches")
+    parser.add_argument("--faults", help="fault=rate,... injected into everything sent, faults are truncate, "
+                                         "bogus_type, junk_burst (per frame), bit_flip, drop, duplicate_delimiter "
+                                         "(per byte)")
+    parser.add_argument("--fault-seed", type=int, default=0, help="seed for the injected faults")
+    subparsers = parser.add_subparsers(dest="transport", required=True)
+    pty_parser = subparsers.add_parser("pty", help="serve on a pseudo terminal")
+    pty_parser.add_argument("--link", help="symlink to create to the pty, E.G. /tmp/ttyMercury")
+    tcp_parser = subparsers.add_parser("tcp", help="serve on a TCP socket")
+    tcp_parser.add_argument("--host", default="127.0.0.1")
+    tcp_parser.add_argument("--port", type=int, default=5555)
+    args = parser.parse_args()
+
+    generator_factory = None
+    if args.stream or args.bulk:
+        def generator_factory():
+            generators = [parse_stream(specification, args.seed) for specification in args.stream]
+            if args.bulk:
+                count, rate = args.bulk.split(":")
+                generators += bulk_streams(int(count), float(rate), seed=args.seed)
+            return TelemetryGenerator(generators, args.batch_interval)
+
+    injector_factory = None
+    if args.faults:
+        # Check the specification now rather than on the first connection
+        parse_faults(args.faults, args.fault_seed)
+
+        def injector_factory():
+            return parse_faults(args.faults, args.fault_seed)
+
+    try:
+        if args.transport == "pty":
+            serve_pty(SimulatorEngine(), args.link, generator_factory, injector_factory)
+        else:
+            serve_tcp(args.host, args.port, generator_factory=generator_factory, injector_factory=injector_factory)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+/***********************************************************************************
+ *  @telemetry_generator.py
+ ***********************************************************************************
+ *   _  _____ ____  ____  _____
+ *  | |/ /_ _/ ___||  _ \| ____|
+ *  | ' / | |\___ \| |_) |  _|
+ *  | . \ | | ___) |  __/| |___
+ *  |_|\_\___|____/|_|   |_____|
+ *
+ ***********************************************************************************
+ *  Copyright (c) 2021 KISPE Space Systems Ltd.
+ *
+ *  https://www.kispe.co.uk/projectlicenses/RA2001001003
+ ***********************************************************************************
+ *  Created on: 18-10-2026
+ *  Synthetic telemetry streams for the space station simulator
+ ***********************************************************************************/
+"""
+
+# Each channel produces values at its own rate from a waveform (sine, ramp, random walk or
+# replay of recorded values). Values are generated for a whole batch at once with NumPy and
+# encoded straight into TELEMETRY_DATA frames, only frames containing \x55 are stuffed one by one.
+
+import time
+
+import numpy as np
+
+from low_level.frameformat import DataType, PROTOCOL_DELIMITER, frame_header_builder, FRAME_HEADER_PREFIX, \
+    telemetry_response_builder
+from low_level.packet import build_frame
+
+TELEMETRY_DATA_SIZE = telemetry_response_builder.size
+# Header of a TELEMETRY_DATA frame whose data field needs no stuffing
+TELEMETRY_HEADER = np.frombuffer(frame_header_builder.pack(*FRAME_HEADER_PREFIX, DataType.TELEMETRY_DATA.value,
+                                                           TELEMETRY_DATA_SIZE), dtype=np.uint8)
+FRAME_SIZE = TELEMETRY_HEADER.size + TELEMETRY_DATA_SIZE
+# Largest value a float waveform is clipped to before conversion to uint64
+MAX_FLOAT_VALUE = float(2 ** 63)
+
+
+def encode_telemetry_frames(channel, values):
+    """ Return the stuffed TELEMETRY_DATA frames of a channel's values, concatenated in order. """
+    count = len(values)
+    frames = np.empty((count, FRAME_SIZE), dtype=np.uint8)
+    frames[:, :TELEMETRY_HEADER.size] = TELEMETRY_HEADER
+    frames[:, TELEMETRY_HEADER.size:TELEMETRY_HEADER.size + 4] = np.frombuffer(int(channel).to_bytes(4, "big"),
+                                                                               dtype=np.uint8)
+    frames[:, TELEMETRY_HEADER.size + 4:] = np.asarray(values, dtype=">u8").view(np.uint8).reshape(count, 8)
+
+    needs_stuffing = (frames[:, TELEMETRY_HEADER.size:] == PROTOCOL_DELIMITER).any(axis=1)
+    if not needs_stuffing.any():
+        return frames.tobytes()
+    # Copy the runs of frames without a delimiter as they are, build the others one by one
+    parts = []
+    previous = 0
+    for row in np.flatnonzero(needs_stuffing):
+        parts.append(frames[previous:row].tobytes())
+        parts.append(bytes(build_frame(frames[row, TELEMETRY_HEADER.size:].tobytes(), DataType.TELEMETRY_DATA.value)))
+        previous = row + 1
+    parts.append(frames[previous:].tobytes())
+    return b"".join(parts)
+
+
+def to_uint64(values):
+    """ Round and clip float waveform values to the telemetry value range. """
+    return np.clip(np.rint(values), 0, MAX_FLOAT_VALUE).astype(np.uint64)
+
+
+class SineWave:
+    """ offset + amplitude * sin(2 pi t / period) """
+
+    def __init__(self, amplitude=1000.0, period=10.0, offset=None):
+        """ Initialise the amplitude, period in seconds and offset (the amplitude by default, so values stay >= 0). """
+        self.amplitude = amplitude
+        self.period = period
+        self.offset = amplitude if offset is None else offset
+
+    def generate(self, times, indices):
+        """ Return the values at times seconds since the stream started. """
+        return to_uint64(self.offset + self.amplitude * np.sin(2 * np.pi * times / self.period))
+
+
+class Ramp:
+    """ start + step * n, wrapping back to start at limit. """
+
+    def __init__(self, step=1, start=0, limit=2 ** 32):
+        """ Initialise the step per sample, the start value and the limit it wraps at. """
+        self.step = step
+        self.start = start
+        self.limit = limit
+
+    def generate(self, times, indices):
+        """ Return the values of samples number indices. """
+        span = self.limit - self.start
+        return (self.start + (indices * self.step) % span).astype(np.uint64)
+
+
+class RandomWalk:
+    """ Steps by a random amount from -step to step each sample, reproducible for a given seed. """
+
+    def __init__(self, step=10, start=2 ** 31, seed=0):
+        """ Initialise the largest step, the start value and the seeded random generator. """
+        self.step = step
+        self.value = start
+        self.rng = np.random.default_rng(seed)
+
+    def generate(self, times, indices):
+        """ Return the next len(indices) values of the walk, continuing from the last value returned. """
+        values = self.value + np.cumsum(self.rng.integers(-self.step, self.step + 1, size=len(indices)))
+        np.clip(values, 0, None, out=values)
+        self.value = int(values[-1])
+        return values.astype(np.uint64)
+
+
+class Replay:
+    """ Repeats a recorded sequence of values. """
+
+    def __init__(self, values):
+        """ Initialise the recorded values. """
+        self.values = np.asarray(values, dtype=np.uint64)
+
+    @classmethod
+    def from_file(cls, path):
+        """ Load the values from a text file with one value per line. """
+        return cls(np.loadtxt(path, dtype=np.uint64, ndmin=1))
+
+    def generate(self, times, indices):
+        """ Return the recorded values of samples number indices, repeating from the first once they run out. """
+        return self.values[indices % len(self.values)]
+
+
+class ChannelGenerator:
+    """ One telemetry channel produced at rate values per second. """
+
+    def __init__(self, channel, rate, waveform):
+        """ Initialise the channel, its rate, waveform and the count of values emitted and skipped. """
+        self.channel = channel
+        self.rate = rate
+        self.waveform = waveform
+        self.emitted = 0
+        self.skipped = 0
+
+    def frames_due(self, elapsed, max_samples):
+        """ Return the frames of every value due by elapsed seconds, at most max_samples of them.
+        Values further behind than that are skipped rather than sent late.
+        """
+        due = int(elapsed * self.rate) - self.emitted
+        if due > max_samples:
+            self.skipped += due - max_samples
+            self.emitted += due - max_samples
+            due = max_samples
+        if due <= 0:
+            return b""
+        indices = np.arange(self.emitted, self.emitted + due, dtype=np.int64)
+        values = self.waveform.generate(indices / self.rate, indices)
+        self.emitted += due
+        return encode_telemetry_frames(self.channel, values)
+
+
+class TelemetryGenerator:
+    """ Produces the frames of several channels in batches every batch_interval seconds. """
+
+    def __init__(self, channel_generators, batch_interval=0.02, max_batch_time=1.0):
+        """ Initialise the channel generators, the batch timing and the count of frames sent. """
+        self.channel_generators = list(channel_generators)
+        self.batch_interval = batch_interval
+        # A batch holds at most this many seconds of values per channel
+        self.max_batch_time = max_batch_time
+        self.start_time = time.monotonic()
+        self.next_batch_time = self.start_time
+        self.frames_sent = 0
+
+    def time_to_next_batch(self):
+        """ Return the seconds until the next batch is due. """
+        return max(0.0, self.next_batch_time - time.monotonic())
+
+    def batch(self):
+        """ Return the frames of every channel due now, concatenated. """
+        now = time.monotonic()
+        elapsed = now - self.start_time
+        self.next_batch_time = max(self.next_batch_time + self.batch_interval, now)
+        emitted = sum(generator.emitted for generator in self.channel_generators)
+        frames = b"".join(generator.frames_due(elapsed, max(1, int(generator.rate * self.max_batch_time)))
+                          for generator in self.channel_generators)
+        self.frames_sent += sum(generator.emitted for generator in self.channel_generators) - emitted
+        return frames
+
+
+WAVEFORMS = {"sine": SineWave, "ramp": Ramp, "walk": RandomWalk}
+
+
+def parse_stream(specification, seed=0):
+    """ Build a ChannelGenerator from "channel:waveform:rate", waveform is sine, ramp, walk or replay=<file>. """
+    channel, waveform, rate = specification.split(":")
+    channel = int(channel)
+    if waveform.startswith("replay="):
+        waveform = Replay.from_file(waveform[len("replay="):])
+    elif waveform == "walk":
+        waveform = RandomWalk(seed=seed + channel)
+    else:
+        waveform = WAVEFORMS[waveform]()
+    return ChannelGenerator(channel, float(rate), waveform)
+
+
+def bulk_streams(count, rate, first_channel=1000, seed=0):
+    """ Build count channels from first_channel at rate values per second each, cycling sine, ramp and walk. """
+    generators = []
+    for index in range(count):
+        channel = first_channel + index
+        kind = index % 3
+        if kind == 0:
+            waveform = SineWave(period=5.0 + index % 20)
+        elif kind == 1:
+            waveform = Ramp(step=1 + index % 7)
+        else:
+            waveform = RandomWalk(seed=seed + channel)
+        generators.append(ChannelGenerator(channel, rate, waveform))
+    return generators
@@ -17,40 +17,48 @@
 #  @author: Jamie Bayley (jbayley@kispe.co.uk)
 ###################################################################################
 import struct
+import time
 import config
-from low_level.packet import packetize, DataType, data_format
+from low_level.timeouts import timeout_wheel
+from low_level.outstanding import OutstandingRequests
+from low_level.latency import latency_tracker
+from low_level.packet import packetize, request_frame, frame_send, DataType, data_format
 from low_level.frameformat import telecommand_request_builder_string, telecommand_request_builder_integer, \
     telecommand_request_builder_float, telecommand_response_builder, telecommand_time_builder_string, TelecommandResponseState
-from threading import Timer
 
-telecommand_database = []
+telecommand_database = OutstandingRequests()
 
 
 class Telecommand:  # A Class for each Telecommand
     """ The Telecommand Class. """
 
     def __init__(self, number, tc_timeout):
-        """ Init Function, Sets the Telecommand Request Number,
-        creates instance of Timer to handle Timeouts using the  Timeout value.
+        """ Init Function, Sets the Telecommand Request Number and the Timeout value,
+        the timeout is tracked by the shared timeout wheel once the timer is started.
         """
         self.ID = number
-        self.TimeoutTimer = Timer(tc_timeout, self.timeout)
+        self.timeout_value = tc_timeout
+        self.timeout_id = None
+        self.sent_time = None
+        self.received_time = None
 
     def start_timer(self):
-        """ Start the timeout timer. """
-        self.TimeoutTimer.start()
+        """ Record the send time and start the timeout timer. """
+        self.sent_time = time.perf_counter_ns()
+        self.timeout_id = timeout_wheel.arm(self.timeout_value, self.timeout)
 
     def stop_timer(self):
         """ Stop the timeout timer. """
-        self.TimeoutTimer.cancel()
+        if self.timeout_id is not None:
+            timeout_wheel.cancel(self.timeout_id)
 
     def timeout(self):
         """ Called if the timeout timer executes (has timed out). """
-        # Search for the first element of the database where the ID matches and remove it
-        telecommand_database[:] = [telecommand for telecommand in telecommand_database if
-                                   not tc_search_for_id_match(telecommand, self.ID)]
-        # Increment the timeout counter
-        callback_telecommand_timeout()
+        # Remove this request from the database, unless a response has already matched it
+        if telecommand_database.remove(self) is True:
+            latency_tracker.record_timeout("TC", self.ID)
+            # Increment the timeout counter
+            callback_telecommand_timeout()
 
 
 def telecommand_register_callback(tc_update_function_ptr, tc_timeout_function_ptr, exception_handler_function_ptr):
@@ -82,8 +90,8 @@ def tc_request_send(telecommand_number, telecommand_data, telecommand_data_type,
             while len(telecommand_data) < 8:
                 telecommand_data = " " + telecommand_data
             # Format the data as an 8 byte string
-            data = data_format([telecommand_number, *bytes(telecommand_data, "ascii")],
-                               telecommand_request_builder_string)
+            frame = request_frame(DataType.TELECOMMAND_REQUEST.value, telecommand_request_builder_string,
+                                  (telecommand_number, *bytes(telecommand_data, "ascii")))
     except struct.error as err:
         print(repr(err))
         print("ERROR: Telecommand Data Value is not String")
@@ -91,8 +99,8 @@ def tc_request_send(telecommand_number, telecommand_data, telecommand_data_type,
     try:
         if telecommand_data_type == "Integer":
             # Format the data as a 64 bit signed integer
-            data = data_format([telecommand_number, int(telecommand_data)],
-                               telecommand_request_builder_integer)
+            frame = request_frame(DataType.TELECOMMAND_REQUEST.value, telecommand_request_builder_integer,
+                                  (telecommand_number, int(telecommand_data)))
     except ValueError as err:
         # Handle exception if data is not an integer
         print(repr(err))
@@ -101,8 +109,8 @@ def tc_request_send(telecommand_number, telecommand_data, telecommand_data_type,
     try:
         if telecommand_data_type == "Floating Point":
             # Format the data as a double
-            data = data_format([telecommand_number, float(telecommand_data)],
-                               telecommand_request_builder_float)
+            frame = request_frame(DataType.TELECOMMAND_REQUEST.value, telecommand_request_builder_float,
+                                  (telecommand_number, float(telecommand_data)))
     except ValueError as err:
         # Handle exception if data is not a float
         print(repr(err))
@@ -111,24 +119,29 @@ def tc_request_send(telecommand_number, telecommand_data, telecommand_data_type,
 
     try:
         # Add telecommand message to database to enable matching with response
-        telecommand_database.append(Telecommand(telecommand_number, config.TIMEOUT))
-        # Format the telecommand as a frame and send
-        packetize(data, DataType.TELECOMMAND_REQUEST.value, is_continuous, telecommand_database,
-                  telecommand_database[-1])
+        telecommand = Telecommand(telecommand_number, config.TIMEOUT)
+        telecommand_database.append(telecommand)
+        # Send the telecommand frame (cached per command number and argument)
+        frame_send(frame, is_continuous, telecommand_database, telecommand)
     except UnboundLocalError as err:
         print(repr(err))
+        # Nothing was sent, so no response will arrive for this request
+        telecommand_database.remove(telecommand)
         print("ERROR: Could not format message")
         callback_exception_handler("ERROR: Could not format message, " + type_error)
 
 
-def tc_search_for_id_match(telecommand, id_to_match, action=None):
-    """ If the ID matches return True, stop the timer if action = "STOP_TIMEOUT". """
-    if telecommand.ID == id_to_match:
-        if action == "STOP_TIMEOUT":
-            telecommand.stop_timer()
-        return True
-    else:
-        return False
+def tc_match_response(telecommand_number):
+    """ Remove the oldest outstanding request for the command from the database, stop its timeout timer
+    and record its round trip latency.
+    """
+    received_time = time.perf_counter_ns()
+    telecommand = telecommand_database.match(telecommand_number)
+    if telecommand is not None:
+        telecommand.stop_timer()
+        if telecommand.sent_time is not None:
+            telecommand.received_time = received_time
+            latency_tracker.record("TC", telecommand.ID, received_time - telecommand.sent_time)
 
 
 def tc_response(telecommand_packet):
@@ -140,9 +153,8 @@ def tc_response(telecommand_packet):
     telecommand_number = telecommand_data[0]
     telecommand_response = telecommand_data[1]
 
-    # Search for the first element of the database where the ID matches, remove it and stop the associated timeout timer
-    telecommand_database[:] = [telecommand for telecommand in telecommand_database if
-                               not tc_search_for_id_match(telecommand, telecommand_number, "STOP_TIMEOUT")]
+    # Match the response to the oldest outstanding request for this command and stop its timeout timer
+    tc_match_response(telecommand_number)
 
     # Get the telecommand response status value
     if telecommand_response == TelecommandResponseState.SUCCESS.value:
@@ -170,13 +182,15 @@ def tc_time_send(telecommand_number, unix_time_seconds, millisec_through_sec):
 
     try:
         # Add telecommand time to database to enable matching with response
-        telecommand_database.append(Telecommand(telecommand_number, config.TIMEOUT))
+        telecommand = Telecommand(telecommand_number, config.TIMEOUT)
+        telecommand_database.append(telecommand)
         # Format the telecommand as a frame and send.
         # is_continious is set to 0.
-        packetize(time_data, DataType.TELECOMMAND_REQUEST.value, 0 , telecommand_database,
-                  telecommand_database[-1])
+        packetize(time_data, DataType.TELECOMMAND_REQUEST.value, 0 , telecommand_database, telecommand)
     except UnboundLocalError as err:
         print(repr(err))
+        # Nothing was sent, so no response will arrive for this request
+        telecommand_database.remove(telecommand)
         print("ERROR: Could not format message")
         callback_exception_handler("ERROR: Could not format message, " + type_error)
 
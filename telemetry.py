@@ -16,40 +16,136 @@
 #  Mercury GS Telemetry Handler
 #  @author: Jamie Bayley (jbayley@kispe.co.uk)
 ###################################################################################
+import threading
+import time
 import config
-from threading import Timer
-from low_level.packet import packetize, DataType, data_format
+from low_level.timeouts import timeout_wheel
+from low_level.outstanding import OutstandingRequests
+from low_level.latency import latency_tracker
+from low_level.packet import request_frame, frame_send, DataType
+from telemetry_store import telemetry_history
 from low_level.frameformat import telemetry_request_builder, telemetry_response_builder, \
     telemetry_rejection_response_builder, TelemetryRejectionResponseState
 
-telemetry_database = []
+telemetry_database = OutstandingRequests()
 
 
 class Telemetry:
     """ The Telemetry Class. """
 
     def __init__(self, number, tc_timeout):
-        """ Init Function, Sets the Telemetry Request Number,
-        creates instance of Timer to handle Timeouts using the  Timeout value.
+        """ Init Function, Sets the Telemetry Request Number and the Timeout value,
+        the timeout is tracked by the shared timeout wheel once the timer is started.
         """
         self.ID = number
-        self.TimeoutTimer = Timer(tc_timeout, self.timeout)
+        self.timeout_value = tc_timeout
+        self.timeout_id = None
+        self.sent_time = None
+        self.received_time = None
+        # TelemetryPoll this request belongs to, None for single requests
+        self.poll = None
 
     def start_timer(self):
-        """ Start the timeout timer. """
-        self.TimeoutTimer.start()
+        """ Record the send time and start the timeout timer. """
+        self.sent_time = time.perf_counter_ns()
+        self.timeout_id = timeout_wheel.arm(self.timeout_value, self.timeout)
 
     def stop_timer(self):
         """ Stop the timeout timer. """
-        self.TimeoutTimer.cancel()
+        if self.timeout_id is not None:
+            timeout_wheel.cancel(self.timeout_id)
 
     def timeout(self):
         """ Called if the timeout timer executes (has timed out). """
-        # Search for the first element of the database where the ID matches and remove it
-        telemetry_database[:] = [telemetry for telemetry in telemetry_database if
-                                 not tlm_search_for_id_match(telemetry, self.ID)]
-        # Increment the timeout counter
-        callback_telemetry_timeout()
+        # Remove this request from the database, unless a response has already matched it
+        if telemetry_database.remove(self) is True:
+            latency_tracker.record_timeout("TLM", self.ID)
+            if self.poll is not None:
+                self.poll.timeout_received(self.ID)
+            # Increment the timeout counter
+            callback_telemetry_timeout()
+
+
+class TelemetryPoll(threading.Thread):
+    """ Requests a list of telemetry channels back to back, at up to rate requests per second (0 for no limit)
+    with at most window requests awaiting a response at once. Responses are matched through the telemetry database,
+    and the poll finishes once every request has been answered, rejected or has timed out.
+    Results are in results {channel: value}, rejections {channel: rejection code} and timeouts [channel],
+    so each channel may only be listed once.
+    """
+
+    def __init__(self, channels, rate=0, window=config.TLM_POLL_WINDOW, timeout=None, callback=None):
+        """ Initialise Thread, the in-flight window and the results. """
+        super().__init__()
+        self.daemon = True
+        self.channels = [int(channel) for channel in channels]
+        if len(set(self.channels)) != len(self.channels):
+            # Results are keyed by channel, a repeated channel's results would overwrite each other
+            raise ValueError("A telemetry channel is listed more than once")
+        self.rate = rate
+        self.timeout_value = config.TIMEOUT if timeout is None else timeout
+        self.window = threading.Semaphore(window)
+        # Called with this poll once it has finished
+        self.callback = callback
+        self.results = {}
+        self.rejections = {}
+        self.timeouts = []
+        self.remaining = len(self.channels)
+        self.lock = threading.Lock()
+        self.finished = threading.Event()
+        self.duration = None
+
+    def run(self):
+        """ Overloads the Thread's "run" function, sends every request then waits for them to complete. """
+        start_time = time.monotonic()
+        interval = 1.0 / self.rate if self.rate > 0 else 0.0
+        next_send = start_time
+        for channel in self.channels:
+            # Wait for a place in the in-flight window
+            self.window.acquire()
+            if interval:
+                delay = next_send - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                # Don't burst to catch up after waiting on the window
+                next_send = max(next_send, time.monotonic() - interval) + interval
+            telemetry = Telemetry(channel, self.timeout_value)
+            telemetry.poll = self
+            telemetry_database.append(telemetry)
+            frame = request_frame(DataType.TELEMETRY_REQUEST.value, telemetry_request_builder, (channel,))
+            frame_send(frame, False, telemetry_database, telemetry)
+        if self.channels:
+            self.finished.wait()
+        else:
+            self.finished.set()
+        self.duration = time.monotonic() - start_time
+        if self.callback is not None:
+            self.callback(self)
+
+    def request_complete(self):
+        """ Free a place in the in-flight window, called with the lock held. """
+        self.remaining -= 1
+        self.window.release()
+        if self.remaining == 0:
+            self.finished.set()
+
+    def response_received(self, channel, value):
+        """ A request of this poll has been answered. """
+        with self.lock:
+            self.results[channel] = value
+            self.request_complete()
+
+    def rejection_received(self, channel, rejection_code):
+        """ A request of this poll has been rejected. """
+        with self.lock:
+            self.rejections[channel] = rejection_code
+            self.request_complete()
+
+    def timeout_received(self, channel):
+        """ A request of this poll has timed out. """
+        with self.lock:
+            self.timeouts.append(channel)
+            self.request_complete()
 
 
 def telemetry_register_callback(tlm_update_function_ptr, tlm_rejection_update_function_ptr, tlm_timeout_function_ptr,
@@ -73,10 +169,11 @@ def tlm_request_send(tlm_channel, is_continuous):
     """ Check data type of Telemetry Request before formatting and send over COM Port. """
     try:
         # Add telemetry message to database to enable matching with response
-        telemetry_database.append(Telemetry(int(tlm_channel), config.TIMEOUT))
-        # Format the telemetry request as a frame and send
-        data = data_format([int(tlm_channel)], telemetry_request_builder)
-        packetize(data, DataType.TELEMETRY_REQUEST.value, is_continuous, telemetry_database, telemetry_database[-1])
+        telemetry = Telemetry(int(tlm_channel), config.TIMEOUT)
+        telemetry_database.append(telemetry)
+        # Format the telemetry request as a frame (cached per channel) and send
+        frame = request_frame(DataType.TELEMETRY_REQUEST.value, telemetry_request_builder, (int(tlm_channel),))
+        frame_send(frame, is_continuous, telemetry_database, telemetry)
     except UnboundLocalError as err:
         print("ERROR: ", err)
         print("INFO: Could not format message")
@@ -87,14 +184,34 @@ def tlm_request_send(tlm_channel, is_continuous):
         callback_exception_handler("ERROR: Telemetry Request Channel is invalid")
 
 
-def tlm_search_for_id_match(telemetry, id_to_match, action=None):
-    """ If the ID matches return True, stop the timer if action = "STOP_TIMEOUT". """
-    if telemetry.ID == id_to_match:
-        if action == "STOP_TIMEOUT":
-            telemetry.stop_timer()
-        return True
-    else:
-        return False
+def tlm_poll_send(tlm_channels, rate=0, window=config.TLM_POLL_WINDOW, timeout=None, callback=None):
+    """ Start polling a list of telemetry channels, see TelemetryPoll. Returns the poll (join it, or pass a callback,
+    to wait for the results), or None if a channel is invalid or listed more than once.
+    """
+    try:
+        poll = TelemetryPoll(tlm_channels, rate, window, timeout, callback)
+    except ValueError as err:
+        # A channel is not a number or is listed more than once
+        print("ERROR: ", err)
+        print("INFO: Telemetry Poll Channel list is invalid")
+        callback_exception_handler("ERROR: Telemetry Poll Channel list is invalid")
+        return None
+    poll.start()
+    return poll
+
+
+def tlm_match_response(tlm_channel):
+    """ Remove the oldest outstanding request for the channel from the database, stop its timeout timer
+    and record its round trip latency. Returns the request, None if there wasn't one.
+    """
+    received_time = time.perf_counter_ns()
+    telemetry = telemetry_database.match(tlm_channel)
+    if telemetry is not None:
+        telemetry.stop_timer()
+        if telemetry.sent_time is not None:
+            telemetry.received_time = received_time
+            latency_tracker.record("TLM", telemetry.ID, received_time - telemetry.sent_time)
+    return telemetry
 
 
 def tlm_response(telemetry_packet):
@@ -107,9 +224,13 @@ def tlm_response(telemetry_packet):
     tlm_channel = telemetry_response[0]
     tlm_data = telemetry_response[1]
 
-    # Search for the first element of the database where the ID matches, remove it and stop the associated timeout timer
-    telemetry_database[:] = [telemetry for telemetry in telemetry_database if
-                             not tlm_search_for_id_match(telemetry, tlm_channel, "STOP_TIMEOUT")]
+    # Match the response to the oldest outstanding request for this channel and stop its timeout timer
+    telemetry = tlm_match_response(tlm_channel)
+    if telemetry is not None and telemetry.poll is not None:
+        telemetry.poll.response_received(tlm_channel, tlm_data)
+
+    # Record the value in the channel's history for plotting, export and statistics
+    telemetry_history.append(tlm_channel, tlm_data)
 
     # Pass the data back up to the GUI to display
     callback_telemetry_response_update(str(tlm_channel), str(tlm_data))
@@ -124,9 +245,10 @@ def tlm_rejection_response(telemetry_packet):
     tlm_channel = telemetry_rejection_response[0]
     tlm_rejection_code = telemetry_rejection_response[1]
 
-    # Search for the first element of the database where the ID matches, remove it and stop the associated timeout timer
-    telemetry_database[:] = [telemetry for telemetry in telemetry_database if
-                             not tlm_search_for_id_match(telemetry, tlm_channel, "STOP_TIMEOUT")]
+    # Match the response to the oldest outstanding request for this channel and stop its timeout timer
+    telemetry = tlm_match_response(tlm_channel)
+    if telemetry is not None and telemetry.poll is not None:
+        telemetry.poll.rejection_received(tlm_channel, tlm_rejection_code)
 
     if tlm_rejection_code is TelemetryRejectionResponseState.CHANNEL_NOT_SUPPORTED.value:
         tlm_rejection_message = "CHANNEL_NOT_SUPPORTED"
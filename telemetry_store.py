@@ -0,0 +1,275 @@
+###################################################################################
+# @file telemetry_store.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Telemetry Value Stores
+###################################################################################
+import bisect
+import threading
+import time
+
+import numpy as np
+
+import config
+
+
+class LatestValueStore:
+    """ Thread safe store of the latest value of each telemetry channel.
+    The packet handler Thread writes every value, the GUI Thread takes only the channels changed since its last read,
+    so however fast values arrive the GUI only sees the latest value of each channel once per refresh.
+    """
+
+    def __init__(self):
+        """ Initialise the values, the set of changed channels and the lock. """
+        # (value, update time, update count) for each channel
+        self.values = {}
+        self.changed = set()
+        self.lock = threading.Lock()
+
+    def update(self, channel, value):
+        """ Store the latest value of a channel with its update time, and mark it as changed. """
+        update_time = time.time()
+        with self.lock:
+            entry = self.values.get(channel)
+            self.values[channel] = (value, update_time, 1 if entry is None else entry[2] + 1)
+            self.changed.add(channel)
+
+    def take_changed(self):
+        """ Return {channel: (value, update time, update count)} for every channel changed since the last call. """
+        with self.lock:
+            if not self.changed:
+                return {}
+            changed = {channel: self.values[channel] for channel in self.changed}
+            self.changed = set()
+        return changed
+
+    def get(self, channel, default=None):
+        """ Return the latest (value, update time, update count) of a channel. """
+        with self.lock:
+            return self.values.get(channel, default)
+
+
+class TelemetryColumns:
+    """ Columnar store of the telemetry table, one list per column with rows in ascending channel order. """
+
+    def __init__(self):
+        """ Initialise the empty columns. """
+        self.channels = []
+        self.values = []
+        self.update_times = []
+        self.update_counts = []
+
+    def __len__(self):
+        """ Return the number of channels. """
+        return len(self.channels)
+
+    def row_of(self, channel):
+        """ Return the row of a channel, or the row it would be inserted at and False if it is not stored. """
+        row = bisect.bisect_left(self.channels, channel)
+        return row, row < len(self.channels) and self.channels[row] == channel
+
+    def insert(self, row, channel, value, update_time, update_count):
+        """ Insert a new channel at row. """
+        self.channels.insert(row, channel)
+        self.values.insert(row, value)
+        self.update_times.insert(row, update_time)
+        self.update_counts.insert(row, update_count)
+
+    def update(self, row, value, update_time, update_count):
+        """ Update the value, update time and count of the channel at row. """
+        self.values[row] = value
+        self.update_times[row] = update_time
+        self.update_counts[row] = update_count
+
+
+class TelemetryRingBuffer:
+    """ Fixed capacity history of one telemetry channel, timestamps (ns since the epoch) and uint64 values.
+    Every sample is written twice, at its index and its index + capacity, so the latest n samples are always
+    contiguous and a window of them is a single slice of the arrays.
+    Windows are views of the live arrays. Each comes with a token, valid(token) is False once appends
+    (E.G. from the packet handler Thread) may have overwritten any of its samples, so a reader in another Thread
+    checks the window is still valid after using it and reads it again if not.
+    """
+    BYTES_PER_SAMPLE = 2 * (np.dtype(np.int64).itemsize + np.dtype(np.uint64).itemsize)
+
+    def __init__(self, capacity):
+        """ Initialise the preallocated arrays. """
+        self.capacity = capacity
+        self.timestamps = np.zeros(2 * capacity, dtype=np.int64)
+        self.values = np.zeros(2 * capacity, dtype=np.uint64)
+        # Appends write through memoryviews of the arrays, several times faster than NumPy scalar assignment
+        self.timestamp_writer = memoryview(self.timestamps)
+        self.value_writer = memoryview(self.values)
+        self.head = 0
+        self.count = 0
+        # Appends started and completed, they only differ while an append is being written
+        self.appends_started = 0
+        self.total_appended = 0
+
+    def __len__(self):
+        """ Return the number of samples held. """
+        return self.count
+
+    def append(self, timestamp, value):
+        """ Add a sample, overwriting the oldest once full. """
+        self.appends_started = self.total_appended + 1
+        index = self.head
+        mirror = index + self.capacity
+        self.timestamp_writer[index] = self.timestamp_writer[mirror] = timestamp
+        self.value_writer[index] = self.value_writer[mirror] = value
+        # Advance only once the sample is written so a reader never sees a half written sample
+        self.head = index + 1 if index + 1 < self.capacity else 0
+        if self.count < self.capacity:
+            self.count += 1
+        self.total_appended += 1
+
+    def window(self, count=None):
+        """ Return (timestamps, values, token), views of the latest count samples oldest first (all held if count is
+        None) and the token to check them with valid().
+        """
+        appended = self.total_appended
+        head = self.head
+        held = self.count
+        count = held if count is None else min(count, held)
+        end = head + self.capacity
+        return self.timestamps[end - count:end], self.values[end - count:end], (appended, count)
+
+    def window_since(self, start_timestamp):
+        """ Return (timestamps, values, token), views of the samples at or after start_timestamp and their token. """
+        timestamps, values, token = self.window()
+        start = np.searchsorted(timestamps, start_timestamp, side="left")
+        return timestamps[start:], values[start:], token
+
+    def valid(self, token):
+        """ Return True if no sample of the window with this token has been overwritten since it was taken. """
+        appended, count = token
+        # The oldest sample of a window is overwritten by the (capacity - count + 1)th append after it was taken,
+        # counting an append that has started but not finished
+        return self.appends_started - appended <= self.capacity - count
+
+    def latest(self):
+        """ Return the latest (timestamp, value), None if empty. """
+        if self.count == 0:
+            return None
+        index = self.head - 1 + self.capacity
+        return int(self.timestamps[index]), int(self.values[index])
+
+    def clear(self):
+        """ Discard every sample. """
+        self.head = 0
+        self.count = 0
+
+    def resized(self, capacity):
+        """ Return a new ring buffer of capacity holding the latest samples of this one. """
+        ring_buffer = TelemetryRingBuffer(capacity)
+        # Called by the Thread that appends, so the window can't be overwritten while it is copied
+        timestamps, values, _ = self.window(capacity)
+        count = len(timestamps)
+        ring_buffer.timestamps[:count] = ring_buffer.timestamps[capacity:capacity + count] = timestamps
+        ring_buffer.values[:count] = ring_buffer.values[capacity:capacity + count] = values
+        ring_buffer.head = count if count < capacity else 0
+        ring_buffer.count = count
+        ring_buffer.appends_started = ring_buffer.total_appended = self.total_appended
+        return ring_buffer
+
+    def memory_size(self):
+        """ Return the bytes used by the arrays. """
+        return self.timestamps.nbytes + self.values.nbytes
+
+
+class TelemetryHistory:
+    """ Ring buffer history of every telemetry channel, written by the packet handler Thread.
+    A channel's buffer is allocated on its first sample. Every channel gets the same capacity, up to max_capacity;
+    once another channel would take the history past memory_cap bytes every buffer is shrunk to make room,
+    and only channels that would need buffers smaller than min_capacity are not recorded.
+    """
+
+    def __init__(self, max_capacity=config.TLM_HISTORY_LENGTH, memory_cap=config.TLM_HISTORY_MEMORY_CAP,
+                 min_capacity=config.TLM_HISTORY_MIN_LENGTH):
+        """ Initialise the per channel buffers and their lock. """
+        self.max_capacity = max_capacity
+        self.min_capacity = min_capacity
+        self.capacity = max_capacity
+        self.memory_cap = memory_cap
+        self.buffers = {}
+        self.refused_channels = set()
+        self.lock = threading.Lock()
+
+    def append(self, channel, value, timestamp=None):
+        """ Add a sample to a channel's history, returns False if the channel is not recorded. """
+        ring_buffer = self.buffers.get(channel)
+        if ring_buffer is None:
+            ring_buffer = self.create_buffer(channel)
+            if ring_buffer is None:
+                return False
+        ring_buffer.append(time.time_ns() if timestamp is None else timestamp, value)
+        return True
+
+    def create_buffer(self, channel):
+        """ Allocate the ring buffer for a new channel, shrinking every buffer if it would exceed the memory cap.
+        None if the buffers would be smaller than min_capacity.
+        """
+        with self.lock:
+            if channel in self.buffers:
+                return self.buffers[channel]
+            channel_count = len(self.buffers) + 1
+            if channel_count * self.capacity * TelemetryRingBuffer.BYTES_PER_SAMPLE > self.memory_cap:
+                # Shrink to fit the next power of two channels, so buffers aren't resized for every new channel
+                planned_channels = 1 << (channel_count - 1).bit_length()
+                capacity = min(self.max_capacity,
+                               self.memory_cap // (planned_channels * TelemetryRingBuffer.BYTES_PER_SAMPLE))
+                if capacity < self.min_capacity:
+                    # Close to the limit, fit exactly this many channels
+                    capacity = self.memory_cap // (channel_count * TelemetryRingBuffer.BYTES_PER_SAMPLE)
+                if capacity < self.min_capacity:
+                    if channel not in self.refused_channels:
+                        self.refused_channels.add(channel)
+                        print("ERROR: Telemetry history memory cap reached, TLM CH " + str(channel) +
+                              " is not recorded")
+                    return None
+                self.resize(capacity)
+            ring_buffer = self.buffers[channel] = TelemetryRingBuffer(self.capacity)
+            return ring_buffer
+
+    def resize(self, capacity):
+        """ Replace every buffer with one of capacity holding its latest samples, called with the lock held.
+        Buffers are only appended to by the packet handler Thread, which is the Thread creating buffers,
+        so no samples are lost; readers holding an old buffer keep a consistent but stale copy.
+        """
+        self.capacity = capacity
+        for channel, ring_buffer in list(self.buffers.items()):
+            self.buffers[channel] = ring_buffer.resized(capacity)
+
+    def buffer(self, channel):
+        """ Return the ring buffer of a channel, None if it has not been received. """
+        return self.buffers.get(channel)
+
+    def channels(self):
+        """ Return the recorded channels in ascending order. """
+        with self.lock:
+            return sorted(self.buffers)
+
+    def memory_used(self):
+        """ Return the bytes allocated to every channel's buffer. """
+        return sum(ring_buffer.memory_size() for ring_buffer in self.buffers.values())
+
+    def clear(self):
+        """ Discard the history of every channel. """
+        with self.lock:
+            self.buffers.clear()
+            self.refused_channels.clear()
+            self.capacity = self.max_capacity
+
+
+telemetry_history = TelemetryHistory()
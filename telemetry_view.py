@@ -0,0 +1,201 @@
+###################################################################################
+# @file telemetry_view.py
+###################################################################################
+#   _  _____ ____  ____  _____
+#  | |/ /_ _/ ___||  _ \| ____|
+#  | ' / | |\___ \| |_) |  _|
+#  | . \ | |___ ) |  __/| |___
+#  |_|\_\___|____/|_|   |_____|
+###################################################################################
+# Copyright (c) 2020 KISPE Space Systems Ltd.
+#
+# Please follow the following link for the license agreement for this code:
+# www.kispe.co.uk/projectlicenses/RA2001001003
+###################################################################################
+#  Created on: 18-Oct-2026
+#  Mercury GS Telemetry Views
+###################################################################################
+from datetime import datetime
+import time
+
+import numpy as np
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QPointF, QTimer
+from PyQt5.QtGui import QPainter, QPen, QPolygonF
+from PyQt5.QtWidgets import QWidget
+
+import config
+from telemetry_store import TelemetryColumns, telemetry_history
+
+CHANNEL_COLUMN = 0
+VALUE_COLUMN = 1
+UPDATE_TIME_COLUMN = 2
+UPDATE_COUNT_COLUMN = 3
+COLUMN_HEADERS = ("CHANNEL", "VALUE", "LAST UPDATE", "UPDATES")
+
+# Pixels between the plot and the edge of the widget, room for the axis labels
+PLOT_MARGIN = 20
+
+
+class TelemetryTableModel(QAbstractTableModel):
+    """ Table model of every telemetry channel received, backed by a TelemetryColumns store.
+    The view only asks for the rows it is showing, and each refresh only signals the rows that changed.
+    """
+
+    def __init__(self, parent=None):
+        """ Initialise the model with an empty store. """
+        super().__init__(parent)
+        self.columns = TelemetryColumns()
+
+    def rowCount(self, parent=QModelIndex()):
+        """ Overloads QAbstractTableModel, one row per channel. """
+        if parent.isValid():
+            return 0
+        return len(self.columns)
+
+    def columnCount(self, parent=QModelIndex()):
+        """ Overloads QAbstractTableModel, channel, value, last update time and update count. """
+        if parent.isValid():
+            return 0
+        return len(COLUMN_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """ Overloads QAbstractTableModel, returns the column titles. """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMN_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        """ Overloads QAbstractTableModel, formats a single cell for display. """
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        if column == CHANNEL_COLUMN:
+            return "TLM CH " + str(self.columns.channels[row])
+        elif column == VALUE_COLUMN:
+            return self.columns.values[row]
+        elif column == UPDATE_TIME_COLUMN:
+            return datetime.fromtimestamp(self.columns.update_times[row]).strftime("%H:%M:%S.%f")[:-3]
+        elif column == UPDATE_COUNT_COLUMN:
+            return str(self.columns.update_counts[row])
+        return None
+
+    def apply_changes(self, changed):
+        """ Apply {channel: (value, update time, update count)} from a LatestValueStore,
+        inserting rows for new channels and signalling only the changed rows.
+        """
+        changed_rows = []
+        for channel, (value, update_time, update_count) in changed.items():
+            channel = int(channel)
+            row, exists = self.columns.row_of(channel)
+            if exists:
+                self.columns.update(row, value, update_time, update_count)
+                changed_rows.append(channel)
+            else:
+                self.beginInsertRows(QModelIndex(), row, row)
+                self.columns.insert(row, channel, value, update_time, update_count)
+                self.endInsertRows()
+
+        # Rows may have moved as new channels were inserted, look them up once every insert is done
+        for channel in changed_rows:
+            row = self.columns.row_of(channel)[0]
+            self.dataChanged.emit(self.index(row, VALUE_COLUMN), self.index(row, UPDATE_COUNT_COLUMN),
+                                  [Qt.DisplayRole])
+
+
+def decimate_min_max(timestamps, values, start_timestamp, end_timestamp, columns):
+    """ Reduce samples (sorted by timestamp) to the min and max value in each of columns time slices between
+    start_timestamp and end_timestamp. Returns (column, min, max) arrays for each column holding a sample,
+    so drawing costs the same however many samples there are.
+    """
+    if timestamps.size == 0 or columns <= 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, values[:0], values[:0]
+    sample_columns = (timestamps - start_timestamp) * columns // max(1, end_timestamp - start_timestamp)
+    np.clip(sample_columns, 0, columns - 1, out=sample_columns)
+    # Timestamps are sorted, so each column's samples are a run, find where each run starts
+    run_starts = np.concatenate(([0], np.flatnonzero(np.diff(sample_columns)) + 1))
+    return (sample_columns[run_starts],
+            np.minimum.reduceat(values, run_starts),
+            np.maximum.reduceat(values, run_starts))
+
+
+class TelemetryPlotWidget(QWidget):
+    """ Plot of one telemetry channel's history over the last time_span seconds.
+    Redrawn at PLOT_REFRESH_RATE from the channel's ring buffer, decimated to the min/max of each pixel column.
+    """
+
+    def __init__(self, parent=None):
+        """ Initialise the widget and its redraw timer. """
+        super().__init__(parent)
+        self.history = telemetry_history
+        self.channel = None
+        self.time_span = 60
+        self.redraw_timer = QTimer(self)
+        # Qt skips repainting while the widget is hidden, so the timer costs nothing on other tabs
+        self.redraw_timer.timeout.connect(self.update)
+        self.redraw_timer.start(int(1000 / config.PLOT_REFRESH_RATE))
+
+    def set_channel(self, channel):
+        """ Plot a different telemetry channel, None to clear the plot. """
+        self.channel = channel
+        self.update()
+
+    def set_time_span(self, seconds):
+        """ Plot the last seconds of history. """
+        self.time_span = seconds
+        self.update()
+
+    def paintEvent(self, event):
+        """ Overloads QWidget, draws the decimated history of the selected channel. """
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), Qt.white)
+        plot_width = self.width() - 2 * PLOT_MARGIN
+        plot_height = self.height() - 2 * PLOT_MARGIN
+        if plot_width <= 0 or plot_height <= 0:
+            return
+        painter.setPen(QPen(Qt.gray))
+        painter.drawRect(PLOT_MARGIN, PLOT_MARGIN, plot_width, plot_height)
+
+        ring_buffer = None if self.channel is None else self.history.buffer(self.channel)
+        if ring_buffer is None:
+            painter.drawText(self.rect(), Qt.AlignCenter, "No Data")
+            return
+
+        end_timestamp = time.time_ns()
+        start_timestamp = end_timestamp - int(self.time_span * 1e9)
+        # Decimate straight from the ring buffer, again if the packet handler Thread overwrote the window meanwhile
+        while True:
+            timestamps, values, token = ring_buffer.window_since(start_timestamp)
+            columns, minimums, maximums = decimate_min_max(timestamps, values, start_timestamp, end_timestamp,
+                                                           plot_width)
+            if ring_buffer.valid(token):
+                break
+        if columns.size == 0:
+            painter.drawText(self.rect(), Qt.AlignCenter, "No Data")
+            return
+
+        # Only the decimated values are converted to float, at most two per pixel column
+        minimums = minimums.astype(np.float64)
+        maximums = maximums.astype(np.float64)
+        lowest = minimums.min()
+        highest = maximums.max()
+        scale = plot_height / (highest - lowest) if highest > lowest else 0.0
+        x = (PLOT_MARGIN + columns).tolist()
+        y_minimums = (PLOT_MARGIN + plot_height - (minimums - lowest) * scale).tolist()
+        y_maximums = (PLOT_MARGIN + plot_height - (maximums - lowest) * scale).tolist()
+        if scale == 0.0:
+            # Flat line through the middle
+            y_minimums = y_maximums = [PLOT_MARGIN + plot_height / 2] * len(x)
+
+        trace = QPolygonF()
+        for column_x, y_minimum, y_maximum in zip(x, y_minimums, y_maximums):
+            trace.append(QPointF(column_x, y_minimum))
+            trace.append(QPointF(column_x, y_maximum))
+        painter.setPen(QPen(Qt.blue))
+        painter.drawPolyline(trace)
+
+        painter.setPen(QPen(Qt.black))
+        painter.drawText(PLOT_MARGIN + 2, PLOT_MARGIN - 4, "{:g}".format(highest))
+        painter.drawText(PLOT_MARGIN + 2, self.height() - 4, "{:g}".format(lowest))
+        painter.drawText(self.width() - PLOT_MARGIN - 80, self.height() - 4, "Last " + str(self.time_span) + " s")